@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that reports the time spent serializing a Thing fragment with hundreds
+of interactions compared to the previous dir()-based serialization algorithm.
+"""
+
+import argparse
+import time
+
+import six
+
+from wotpy.utils.utils import to_snake
+from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+from wotpy.wot.dictionaries.thing import ThingFragment
+
+
+def build_fragment_init(num_interactions):
+    """Returns the init dict of a Thing fragment with the given number of Properties and Actions."""
+
+    return {
+        "id": "urn:wotpy:benchmark:dictionaries",
+        "properties": {
+            "prop{}".format(idx): {
+                "type": "number",
+                "observable": True,
+                "forms": [{"href": "/prop{}".format(idx), "op": ["readproperty"]}]
+            }
+            for idx in range(num_interactions)
+        },
+        "actions": {
+            "action{}".format(idx): {
+                "input": {"type": "object", "properties": {"val": {"type": "string"}}},
+                "forms": [{"href": "/action{}".format(idx)}]
+            }
+            for idx in range(num_interactions)
+        }
+    }
+
+
+def legacy_to_dict(wot_dict):
+    """Previous dict serialization that looks up the existing fields on each call with dir()."""
+
+    def serialize(val):
+        if isinstance(val, list) and len(val) and hasattr(val[0], "to_dict"):
+            return [legacy_to_dict(item) for item in val]
+
+        if isinstance(val, dict) and len(val) and hasattr(next(six.itervalues(val)), "to_dict"):
+            return {key: legacy_to_dict(item) for key, item in six.iteritems(val)}
+
+        if hasattr(val, "to_dict"):
+            return legacy_to_dict(val)
+
+        return val
+
+    ret = {
+        name: serialize(getattr(wot_dict, to_snake(name)))
+        for name in wot_dict.Meta.fields
+        if name in wot_dict._init or (
+                to_snake(name) in dir(wot_dict) and
+                getattr(wot_dict, to_snake(name)) is not None)
+    }
+
+    if isinstance(wot_dict, PropertyFragmentDict):
+        ret.update(legacy_to_dict(wot_dict.data_schema))
+
+    return ret
+
+
+def time_per_call(func, num_iters):
+    """Returns the average time (seconds) of calling func."""
+
+    time_start = time.time()
+
+    for _ in range(num_iters):
+        func()
+
+    return (time.time() - time_start) / num_iters
+
+
+def main(parsed_args):
+    """Serializes the same Thing fragment with both algorithms."""
+
+    thing_fragment = ThingFragment(build_fragment_init(parsed_args.interactions))
+
+    assert thing_fragment.to_dict() == legacy_to_dict(thing_fragment)
+
+    print("{:<40}{:>12}".format("serialization", "ms/call"))
+
+    results = [
+        ("dir() reference", time_per_call(lambda: legacy_to_dict(thing_fragment), parsed_args.iterations)),
+        ("to_dict", time_per_call(thing_fragment.to_dict, parsed_args.iterations))
+    ]
+
+    for name, secs in results:
+        print("{:<40}{:>12.2f}".format(name, secs * 1000))
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="WoT dictionaries serialization benchmark")
+    parser.add_argument("--interactions", dest="interactions", default=200, type=int)
+    parser.add_argument("--iterations", dest="iterations", default=20, type=int)
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
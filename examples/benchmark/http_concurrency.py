@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that reports the throughput of concurrent Property reads
+against a local HTTP server with different HTTPClient pool settings.
+"""
+
+import argparse
+import json
+import time
+
+import tornado.gen
+import tornado.ioloop
+
+from wotpy.protocols.http.client import HTTPClient
+from wotpy.protocols.http.server import HTTPServer
+from wotpy.wot.servient import Servient
+from wotpy.wot.td import ThingDescription
+
+PROPERTY_NAME = "temperature"
+
+TD_SENSOR = {
+    "id": "urn:wotpy:benchmark:concurrency",
+    "name": "Sensor",
+    "properties": {
+        PROPERTY_NAME: {
+            "type": "number",
+            "observable": True
+        }
+    }
+}
+
+SCENARIOS = [
+    ("max_clients=10", {"max_clients": 10}),
+    ("max_clients=100", {"max_clients": 100}),
+    ("max_clients=100,per_host=20", {"max_clients": 100, "max_clients_per_host": 20}),
+    ("curl,max_clients=100", {"max_clients": 100, "use_curl": True}),
+    ("curl,max_clients=100,no_keep_alive", {"max_clients": 100, "use_curl": True, "keep_alive": False})
+]
+
+
+@tornado.gen.coroutine
+def run_scenario(td, client_kwargs, num_requests, concurrency, latency):
+    """Reads the Property num_requests times keeping the given number of reads in flight.
+    Returns the number of requests per second."""
+
+    http_client = HTTPClient(**client_kwargs)
+    pending = list(range(num_requests))
+
+    @tornado.gen.coroutine
+    def worker():
+        while len(pending):
+            pending.pop()
+            yield http_client.read_property(td, PROPERTY_NAME)
+
+    yield http_client.read_property(td, PROPERTY_NAME)
+
+    start = time.time()
+    yield [worker() for _ in range(concurrency)]
+    elapsed = time.time() - start
+
+    raise tornado.gen.Return(num_requests / elapsed)
+
+
+@tornado.gen.coroutine
+def main(parsed_args):
+    """Starts the server and runs all the scenarios."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(HTTPServer(port=parsed_args.port))
+    wot = yield servient.start()
+
+    exposed_thing = wot.produce(json.dumps(TD_SENSOR))
+
+    @tornado.gen.coroutine
+    def read_handler():
+        yield tornado.gen.sleep(parsed_args.latency)
+        raise tornado.gen.Return(21.5)
+
+    exposed_thing.set_property_read_handler(PROPERTY_NAME, read_handler)
+    exposed_thing.expose()
+
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    print("{:<40}{:>12}".format("client settings", "req/s"))
+
+    for name, client_kwargs in SCENARIOS:
+        try:
+            rate = yield run_scenario(
+                td, client_kwargs, parsed_args.requests,
+                parsed_args.concurrency, parsed_args.latency)
+        except ImportError as ex:
+            print("{:<40}{:>12}".format(name, "n/a ({})".format(ex)))
+            continue
+
+        print("{:<40}{:>12.1f}".format(name, rate))
+
+    yield servient.shutdown()
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="HTTP client concurrency benchmark")
+    parser.add_argument("--port", dest="port", default=9494, type=int)
+    parser.add_argument("--requests", dest="requests", default=2000, type=int)
+    parser.add_argument("--concurrency", dest="concurrency", default=200, type=int)
+    parser.add_argument("--latency", dest="latency", default=0.02, type=float,
+                        help="Simulated latency (seconds) of the Property read handler")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    tornado.ioloop.IOLoop.current().run_sync(lambda: main(parse_args()))
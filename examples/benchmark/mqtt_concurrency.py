@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that reports the throughput of concurrent Action invocations
+through a local MQTT broker with different MQTTClient in-flight windows.
+A broker should be running beforehand (e.g. start one with the hbmqtt command).
+"""
+
+import argparse
+import json
+import time
+
+import tornado.gen
+import tornado.ioloop
+
+from wotpy.protocols.mqtt.client import MQTTClient
+from wotpy.protocols.mqtt.server import MQTTServer
+from wotpy.wot.servient import Servient
+from wotpy.wot.td import ThingDescription
+
+ACTION_NAME = "double"
+
+TD_DOUBLER = {
+    "id": "urn:wotpy:benchmark:mqttconcurrency",
+    "name": "Doubler",
+    "actions": {
+        ACTION_NAME: {
+            "input": {"type": "number"},
+            "output": {"type": "number"}
+        }
+    }
+}
+
+SCENARIOS = [
+    ("concurrency=1,max_inflight=1", {"concurrency": 1, "max_inflight": 1}),
+    ("concurrency=10,max_inflight=1", {"concurrency": 10, "max_inflight": 1}),
+    ("concurrency=10,max_inflight=10", {"concurrency": 10, "max_inflight": 10}),
+    ("concurrency=50,max_inflight=10", {"concurrency": 50, "max_inflight": 10}),
+    ("concurrency=50,max_inflight=50", {"concurrency": 50, "max_inflight": 50})
+]
+
+
+@tornado.gen.coroutine
+def run_scenario(td, num_requests, concurrency, max_inflight):
+    """Invokes the Action num_requests times keeping the given number of invocations in flight.
+    Returns the number of invocations per second."""
+
+    mqtt_client = MQTTClient(max_inflight=max_inflight)
+    pending = list(range(num_requests))
+
+    @tornado.gen.coroutine
+    def worker():
+        while len(pending):
+            pending.pop()
+            yield mqtt_client.invoke_action(td, ACTION_NAME, 1)
+
+    yield mqtt_client.invoke_action(td, ACTION_NAME, 1)
+
+    start = time.time()
+    yield [worker() for _ in range(concurrency)]
+    elapsed = time.time() - start
+
+    raise tornado.gen.Return(num_requests / elapsed)
+
+
+@tornado.gen.coroutine
+def main(parsed_args):
+    """Starts the server and runs all the scenarios."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(MQTTServer(broker_url=parsed_args.broker))
+    wot = yield servient.start()
+
+    exposed_thing = wot.produce(json.dumps(TD_DOUBLER))
+
+    @tornado.gen.coroutine
+    def action_handler(parameters):
+        raise tornado.gen.Return(parameters.get("input") * 2)
+
+    exposed_thing.set_action_handler(ACTION_NAME, action_handler)
+    exposed_thing.expose()
+
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    print("{:<40}{:>12}".format("client settings", "inv/s"))
+
+    for name, scenario_kwargs in SCENARIOS:
+        rate = yield run_scenario(td, parsed_args.requests, **scenario_kwargs)
+        print("{:<40}{:>12.1f}".format(name, rate))
+
+    yield servient.shutdown()
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="MQTT client concurrency benchmark")
+    parser.add_argument("--broker", dest="broker", default="mqtt://127.0.0.1:1883")
+    parser.add_argument("--requests", dest="requests", default=500, type=int)
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    tornado.ioloop.IOLoop.current().run_sync(lambda: main(parse_args()))
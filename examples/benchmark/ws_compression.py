@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that reports the bytes on the wire and the CPU time spent to deliver
+a stream of telemetry events over WebSockets with and without permessage-deflate.
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+
+import tornado.gen
+import tornado.ioloop
+import tornado.websocket
+from tornado.concurrent import Future
+
+from wotpy.protocols.ws.client import WebsocketClient
+from wotpy.protocols.ws.compression import WebsocketCompression
+from wotpy.protocols.ws.server import WebsocketServer
+from wotpy.wot.servient import Servient
+from wotpy.wot.td import ThingDescription
+
+EVENT_NAME = "telemetry"
+
+TD_TELEMETRY = {
+    "id": "urn:wotpy:benchmark:compression",
+    "name": "Telemetry",
+    "events": {
+        EVENT_NAME: {
+            "type": "object"
+        }
+    }
+}
+
+SCENARIOS = [
+    ("disabled", None),
+    ("level=1", WebsocketCompression(level=1)),
+    ("level=6", WebsocketCompression(level=6)),
+    ("level=9,mem_level=9", WebsocketCompression(level=9, mem_level=9)),
+    ("level=6,min_size=128", WebsocketCompression(level=6, min_size=128))
+]
+
+
+class WireCounter(object):
+    """Counts the bytes of all the WebSockets frames written in the process."""
+
+    def __init__(self):
+        self.total = 0
+        self._write_frame = tornado.websocket.WebSocketProtocol13._write_frame
+
+    def __enter__(self):
+        write_frame = self._write_frame
+        counter = self
+
+        def write_frame_spy(protocol, fin, opcode, data, flags=0):
+            counter.total += len(data)
+            return write_frame(protocol, fin, opcode, data, flags=flags)
+
+        tornado.websocket.WebSocketProtocol13._write_frame = write_frame_spy
+
+        return self
+
+    def __exit__(self, *args):
+        tornado.websocket.WebSocketProtocol13._write_frame = self._write_frame
+
+
+def build_payload(idx):
+    """Builds a telemetry event payload."""
+
+    return {
+        "deviceId": "sensor-{}".format(idx % 10),
+        "timestamp": time.time(),
+        "temperature": round(random.uniform(15.0, 30.0), 2),
+        "humidity": round(random.uniform(30.0, 70.0), 2),
+        "status": "OK",
+        "tags": ["building-a", "floor-3", "zone-{}".format(idx % 4)]
+    }
+
+
+@tornado.gen.coroutine
+def run_scenario(port, compression, num_events):
+    """Starts a servient with the given compression settings and
+    consumes the given number of events with a WebSockets client."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(WebsocketServer(port=port, compression=compression))
+    wot = yield servient.start()
+
+    exposed_thing = wot.produce(json.dumps(TD_TELEMETRY))
+    exposed_thing.expose()
+
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    ws_client = WebsocketClient(compression=compression)
+    future_done = Future()
+    received = []
+
+    def on_next(ev):
+        received.append(ev)
+
+        if len(received) == num_events and not future_done.done():
+            future_done.set_result(True)
+
+    subscription = ws_client.on_event(td, EVENT_NAME).subscribe(on_next)
+
+    while not len(received):
+        exposed_thing.emit_event(EVENT_NAME, build_payload(0))
+        yield tornado.gen.sleep(0.05)
+
+    del received[:]
+    yield tornado.gen.sleep(0.1)
+    del received[:]
+
+    with WireCounter() as counter:
+        cpu_start = time.process_time()
+
+        for idx in range(num_events):
+            exposed_thing.emit_event(EVENT_NAME, build_payload(idx))
+
+            if idx % 100 == 0:
+                yield tornado.gen.moment
+
+        yield future_done
+
+        cpu_secs = time.process_time() - cpu_start
+
+    subscription.dispose()
+    yield servient.shutdown()
+
+    raise tornado.gen.Return((counter.total, cpu_secs))
+
+
+@tornado.gen.coroutine
+def main(parsed_args):
+    """Runs all the scenarios and prints the results."""
+
+    print("{:<24}{:>14}{:>10}{:>12}".format("compression", "wire bytes", "ratio", "CPU (s)"))
+
+    baseline = None
+
+    for name, compression in SCENARIOS:
+        total, cpu_secs = yield run_scenario(parsed_args.port, compression, parsed_args.events)
+        baseline = baseline or total
+        print("{:<24}{:>14}{:>10.2f}{:>12.3f}".format(name, total, float(total) / baseline, cpu_secs))
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="WebSockets compression benchmark")
+    parser.add_argument("--port", dest="port", default=9393, type=int)
+    parser.add_argument("--events", dest="events", default=5000, type=int)
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    random.seed(uuid.uuid4().int)
+    tornado.ioloop.IOLoop.current().run_sync(lambda: main(parse_args()))
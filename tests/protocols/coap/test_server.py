@@ -3,6 +3,7 @@
 
 import datetime
 import json
+import uuid
 
 import aiocoap
 import pytest
@@ -15,7 +16,7 @@ from faker import Faker
 from tests.utils import find_free_port, run_test_coroutine
 from wotpy.protocols.coap.server import CoAPServer
 from wotpy.protocols.enums import InteractionVerbs
-from wotpy.wot.dictionaries.interaction import ActionFragmentDict
+from wotpy.wot.dictionaries.interaction import ActionFragmentDict, PropertyFragmentDict
 
 
 def _get_property_href(exp_thing, prop_name, server):
@@ -147,6 +148,44 @@ def test_property_write(coap_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_properties_write_errors(coap_server):
+    """Invalid requests to update multiple Properties are rejected with client error responses."""
+
+    exposed_thing = next(coap_server.exposed_things)
+    prop_name_rw = next(six.iterkeys(exposed_thing.thing.properties))
+    prop_name_ro = uuid.uuid4().hex
+
+    exposed_thing.add_property(prop_name_ro, PropertyFragmentDict({
+        "type": "number",
+        "readOnly": True
+    }), value=Faker().pyint())
+
+    forms = coap_server.build_thing_forms("127.0.0.1", exposed_thing.thing)
+    href = next(item.href for item in forms if item.op == InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        value_rw = Faker().pystr()
+        yield exposed_thing.properties[prop_name_rw].write(value_rw)
+        coap_client = yield aiocoap.Context.create_client_context()
+
+        @tornado.gen.coroutine
+        def put_properties(payload):
+            request_msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
+            response = yield coap_client.request(request_msg).response
+            raise tornado.gen.Return(response)
+
+        values = {prop_name_ro: Faker().pyint(), prop_name_rw: Faker().pystr()}
+        response_ro = yield put_properties(json.dumps({"values": values}).encode("utf-8"))
+        response_json = yield put_properties(b"{invalid")
+
+        assert response_ro.code == aiocoap.Code.BAD_REQUEST
+        assert response_json.code == aiocoap.Code.BAD_REQUEST
+        assert (yield exposed_thing.properties[prop_name_rw].read()) == value_rw
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_property_subscription(coap_server):
     """Properties exposed in an CoAP server can be observed for value updates."""
 
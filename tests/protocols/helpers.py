@@ -12,6 +12,7 @@ from faker import Faker
 from rx.concurrency import IOLoopScheduler
 
 from tests.utils import run_test_coroutine
+from wotpy.protocols.enums import InteractionVerbs
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict, EventFragmentDict, ActionFragmentDict
 from wotpy.wot.td import ThingDescription
 
@@ -179,6 +180,51 @@ def client_test_write_property(servient, protocol_client_cls, timeout=None):
     run_test_coroutine(test_coroutine)
 
 
+def client_test_read_write_multiple_properties(servient, protocol_client_cls, timeout=None):
+    """Helper function to test bulk Property reads and writes on bindings clients."""
+
+    exposed_thing = next(servient.exposed_things)
+
+    prop_names = [uuid.uuid4().hex for _ in range(3)]
+
+    for prop_name in prop_names:
+        exposed_thing.add_property(prop_name, PropertyFragmentDict({
+            "type": "string",
+            "observable": True
+        }), value=Faker().sentence())
+
+    servient.refresh_forms()
+
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        protocol_client = protocol_client_cls()
+
+        assert protocol_client.is_supported_thing_operation(td, InteractionVerbs.READ_ALL_PROPERTIES)
+        assert protocol_client.is_supported_thing_operation(td, InteractionVerbs.READ_MULTIPLE_PROPERTIES)
+        assert protocol_client.is_supported_thing_operation(td, InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        all_values = yield protocol_client.read_multiple_properties(td, timeout=timeout)
+        expected_values = yield exposed_thing.read_all_properties()
+
+        assert all_values == expected_values
+
+        values = {prop_name: Faker().sentence() for prop_name in prop_names[:2]}
+
+        yield protocol_client.write_multiple_properties(td, values, timeout=timeout)
+
+        for prop_name, value in six.iteritems(values):
+            curr_value = yield exposed_thing.properties[prop_name].read()
+            assert curr_value == value
+
+        read_values = yield protocol_client.read_multiple_properties(td, names=prop_names[:2], timeout=timeout)
+
+        assert read_values == values
+
+    run_test_coroutine(test_coroutine)
+
+
 def client_test_invoke_action(servient, protocol_client_cls, timeout=None):
     """Helper function to test Action invocations on bindings clients."""
 
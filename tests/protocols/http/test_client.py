@@ -1,15 +1,32 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import datetime
+
+import tornado.gen
+import tornado.ioloop
+import tornado.web
+from mock import patch
+from six.moves.urllib import parse
+from tornado.concurrent import Future
+
 from tests.protocols.helpers import \
     client_test_on_property_change, \
     client_test_on_event, \
     client_test_read_property, \
     client_test_write_property, \
+    client_test_read_write_multiple_properties, \
     client_test_invoke_action, \
     client_test_invoke_action_error, \
     client_test_on_property_change_error
+from tests.utils import run_test_coroutine
 from wotpy.protocols.http.client import HTTPClient
+from wotpy.protocols.http.enums import HTTPSubprotocols
+from wotpy.protocols.http.handlers.event import EventObserverHandler
+from wotpy.protocols.http.handlers.property import PropertyObserverHandler
+from wotpy.protocols.http.server import HTTPServer
+from wotpy.protocols.http.sse import SSEStream
+from wotpy.wot.td import ThingDescription
 
 
 def test_read_property(http_servient):
@@ -24,6 +41,12 @@ def test_write_property(http_servient):
     client_test_write_property(http_servient, HTTPClient)
 
 
+def test_read_write_multiple_properties(http_servient):
+    """The HTTP client can read and write multiple properties in a single request."""
+
+    client_test_read_write_multiple_properties(http_servient, HTTPClient)
+
+
 def test_invoke_action(http_servient):
     """The HTTP client can invoke actions."""
 
@@ -53,3 +76,216 @@ def test_on_property_change_error(http_servient):
     observation are propagated to the subscription as expected."""
 
     client_test_on_property_change_error(http_servient, HTTPClient)
+
+
+def test_on_event_stream_reconnect(http_servient):
+    """Event subscriptions use Server-Sent Events and resume
+    from the last received emission when the stream is interrupted."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    event_name = next(iter(td.events.keys()))
+    http_server = next(iter(http_servient.servers.values()))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = HTTPClient()
+        received = []
+        resumed_ids = []
+        future_done = Future()
+        total = 30
+
+        attach = SSEStream.attach
+
+        def attach_spy(stream, listener, last_event_id=None):
+            if last_event_id is not None:
+                resumed_ids.append(last_event_id)
+
+            return attach(stream, listener, last_event_id=last_event_id)
+
+        def on_next(ev):
+            received.append(ev.data)
+
+            if received[-1] == total - 1 and not future_done.done():
+                future_done.set_result(True)
+
+        with patch.object(SSEStream, "attach", attach_spy):
+            subscription = http_client.on_event(td, event_name).subscribe(on_next)
+
+            while not len(received):
+                exposed_thing.emit_event(event_name, -1)
+                yield tornado.gen.sleep(0.05)
+
+            for idx in range(total):
+                exposed_thing.emit_event(event_name, idx)
+
+                if idx == total // 2:
+                    for stream in list(http_server._sse_streams.values()):
+                        for listener in list(stream.listeners):
+                            listener.close_stream()
+
+                yield tornado.gen.sleep(0.01)
+
+            yield future_done
+
+        subscription.dispose()
+
+        assert len(resumed_ids) >= 1
+        assert [item for item in received if item != -1] == list(range(total))
+
+    run_test_coroutine(test_coroutine)
+
+
+def _patch_pick_http_href(exclude_subprotocols):
+    """Patches HTTPClient.pick_http_href to ignore the Forms with the given subprotocols."""
+
+    pick_http_href = HTTPClient.pick_http_href
+
+    def pick_http_href_exclude(td, forms, op=None, subprotocol=None):
+        if subprotocol in exclude_subprotocols:
+            return None
+
+        return pick_http_href(td, forms, op=op, subprotocol=subprotocol)
+
+    return patch.object(HTTPClient, "pick_http_href", staticmethod(pick_http_href_exclude))
+
+
+def test_on_event_subscription_cursor(http_servient):
+    """The HTTP client polls subscription cursors when Server-Sent Events are not available."""
+
+    with _patch_pick_http_href([HTTPSubprotocols.SSE]):
+        client_test_on_event(http_servient, HTTPClient)
+        client_test_on_property_change(http_servient, HTTPClient)
+        client_test_on_property_change_error(http_servient, HTTPClient)
+
+
+def test_on_event_subscription_cursor_not_allowed(http_servient):
+    """The HTTP client reverts to a plain long-poll when
+    the server rejects the creation of subscription cursors."""
+
+    with _patch_pick_http_href([HTTPSubprotocols.SSE]), \
+         patch.object(EventObserverHandler, "post", tornado.web.RequestHandler.post), \
+         patch.object(PropertyObserverHandler, "post", tornado.web.RequestHandler.post):
+        client_test_on_event(http_servient, HTTPClient)
+        client_test_on_property_change(http_servient, HTTPClient)
+
+
+def test_on_event_long_poll(http_servient):
+    """The HTTP client long-polls the plain observation Forms
+    when neither SSE nor subscription cursors are advertised."""
+
+    def create_subscription_cursor(*args, **kwargs):
+        raise AssertionError("Unexpected subscription cursor")
+
+    with _patch_pick_http_href([HTTPSubprotocols.SSE, HTTPSubprotocols.CURSOR]), \
+         patch.object(HTTPServer, "create_subscription_cursor", create_subscription_cursor):
+        client_test_on_event(http_servient, HTTPClient)
+        client_test_on_property_change(http_servient, HTTPClient)
+
+
+def test_invoke_action_long_poll(http_servient):
+    """The HTTP client long-polls the invocation status when
+    the result is not available within the requested wait."""
+
+    with patch.object(HTTPClient, "ACTION_WAIT_SECS", 0), \
+         patch.object(HTTPClient, "ACTION_POLL_SECS", 0.01):
+        client_test_invoke_action(http_servient, HTTPClient)
+        client_test_invoke_action_error(http_servient, HTTPClient)
+
+
+def test_invoke_action_href_query(http_servient):
+    """The HTTP client keeps the query string of the Action Form href
+    when adding the parameters of the invocation requests."""
+
+    pick_http_href = HTTPClient.pick_http_href
+
+    def pick_http_href_query(td, forms, op=None, subprotocol=None):
+        href = pick_http_href(td, forms, op=op, subprotocol=subprotocol)
+        return "{}?lang=en".format(href) if href and "/action/" in href else href
+
+    fetch = HTTPClient._fetch
+    queries = []
+
+    def fetch_spy(self, http_request, **kwargs):
+        if "/action/" in http_request.url:
+            queries.append(parse.parse_qs(parse.urlparse(http_request.url).query))
+
+        return fetch(self, http_request, **kwargs)
+
+    with patch.object(HTTPClient, "pick_http_href", staticmethod(pick_http_href_query)), \
+         patch.object(HTTPClient, "_fetch", fetch_spy), \
+         patch.object(HTTPClient, "ACTION_WAIT_SECS", 0), \
+         patch.object(HTTPClient, "ACTION_POLL_SECS", 0.01):
+        client_test_invoke_action(http_servient, HTTPClient)
+
+    assert len(queries)
+    assert all(query.get("lang") == ["en"] and "wait" in query for query in queries)
+
+
+def test_max_clients_per_host(http_servient):
+    """The number of concurrent requests to the same host can be limited."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+    max_clients_per_host = 3
+    state = {"running": 0, "max_running": 0}
+
+    @tornado.gen.coroutine
+    def read_handler():
+        state["running"] += 1
+        state["max_running"] = max(state["running"], state["max_running"])
+        yield tornado.gen.sleep(0.05)
+        state["running"] -= 1
+        raise tornado.gen.Return(prop_name)
+
+    exposed_thing.set_property_read_handler(prop_name, read_handler)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = HTTPClient(max_clients_per_host=max_clients_per_host, keep_alive=False)
+        results = yield [http_client.read_property(td, prop_name) for _ in range(10)]
+
+        assert results == [prop_name] * 10
+        assert state["max_running"] == max_clients_per_host
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_max_clients_per_host_observations(http_servient):
+    """Long-polled observations do not count against the per-host limit of the other requests."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(iter(td.properties.keys()))
+    event_name = next(iter(td.events.keys()))
+    http_server = next(iter(http_servient.servers.values()))
+    max_clients_per_host = 2
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = HTTPClient(max_clients_per_host=max_clients_per_host)
+
+        with _patch_pick_http_href([HTTPSubprotocols.SSE]):
+            subscriptions = [
+                http_client.on_event(td, event_name).subscribe(lambda item: None)
+                for _ in range(max_clients_per_host + 1)
+            ]
+
+            while len(http_server.subscription_cursors) < len(subscriptions):
+                yield tornado.gen.sleep(0.05)
+
+            yield tornado.gen.sleep(0.1)
+
+            value = yield tornado.gen.with_timeout(
+                datetime.timedelta(seconds=5),
+                http_client.read_property(td, prop_name))
+
+            yield tornado.gen.with_timeout(
+                datetime.timedelta(seconds=5),
+                http_client.write_property(td, prop_name, value))
+
+        for subscription in subscriptions:
+            subscription.dispose()
+
+    run_test_coroutine(test_coroutine)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import tornado.gen
+from tornado.concurrent import Future
+
+from tests.utils import run_test_coroutine
+from wotpy.protocols.http.invocations import InvocationStore
+
+
+def _done_future(result=None):
+    """Returns a Future that is already resolved with the given result."""
+
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def test_expiry_after_completion():
+    """Invocations expire once their TTL has passed since they completed."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        store = InvocationStore(max_size=10, ttl_secs=0.1)
+
+        future_pending = Future()
+        id_pending = store.add(future_pending)
+        id_done = store.add(_done_future())
+
+        yield tornado.gen.sleep(0.2)
+
+        assert id_done not in store
+        assert store.is_removed(id_done)
+        assert store.get(id_pending) is future_pending
+
+        future_pending.set_result(True)
+
+        yield tornado.gen.sleep(0.05)
+
+        assert id_pending in store
+
+        yield tornado.gen.sleep(0.1)
+
+        assert id_pending not in store
+        assert store.is_removed(id_pending)
+        assert not store.is_removed("unknown")
+        assert len(store) == 0
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_eviction():
+    """The store is bounded, evicting completed invocations before pending ones."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        store = InvocationStore(max_size=3, ttl_secs=60)
+
+        ids_pending = [store.add(Future()) for _ in range(2)]
+        id_done = store.add(_done_future())
+
+        yield tornado.gen.moment
+
+        id_new = store.add(Future())
+
+        assert len(store) == 3
+        assert store.is_removed(id_done)
+        assert all(item in store for item in ids_pending + [id_new])
+
+        store.add(Future())
+
+        assert len(store) == 3
+        assert store.is_removed(ids_pending[0])
+        assert ids_pending[1] in store
+
+        store.clear()
+
+        assert len(store) == 0
+
+    run_test_coroutine(test_coroutine)
@@ -17,9 +17,10 @@ from tornado.concurrent import Future
 
 from tests.utils import find_free_port, run_test_coroutine
 from wotpy.protocols.enums import InteractionVerbs
-from wotpy.protocols.http.enums import HTTPSchemes
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
 from wotpy.protocols.http.server import HTTPServer
-from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+from wotpy.protocols.http.sse import SSEParser, SSE_CONTENT_TYPE, encode_event_data
+from wotpy.wot.dictionaries.interaction import PropertyFragmentDict, EventFragmentDict, ActionFragmentDict
 from wotpy.wot.exposed.thing import ExposedThing
 from wotpy.wot.servient import Servient
 from wotpy.wot.thing import Thing
@@ -60,6 +61,14 @@ def _get_event_observe_href(exp_thing, event_name, server):
     return next(item.href for item in event_forms if InteractionVerbs.SUBSCRIBE_EVENT in item.op)
 
 
+def _get_event_stream_href(exp_thing, event_name, server):
+    """Helper function to retrieve the Event SSE stream href."""
+
+    event = exp_thing.thing.events[event_name]
+    event_forms = server.build_forms("localhost", event)
+    return next(item.href for item in event_forms if item.subprotocol == HTTPSubprotocols.SSE)
+
+
 def test_property_get(http_server):
     """Properties exposed in an HTTP server can be read with an HTTP GET request."""
 
@@ -313,3 +322,307 @@ def test_ssl_context(self_signed_ssl_context):
         yield server.stop()
 
     run_test_coroutine(test_coroutine)
+
+
+def test_event_stream(http_server):
+    """Events can be streamed with Server-Sent Events and the emissions
+    missed while disconnected are replayed when resuming with Last-Event-ID."""
+
+    exposed_thing = next(http_server.exposed_things)
+    event_name = next(six.iterkeys(exposed_thing.thing.events))
+    event = exposed_thing.thing.events[event_name]
+    href = _get_event_stream_href(exposed_thing, event_name, http_server)
+
+    form = next(item for item in http_server.build_forms("localhost", event) if item.href == href)
+    assert form.content_type == SSE_CONTENT_TYPE
+    assert InteractionVerbs.SUBSCRIBE_EVENT in form.op
+
+    @tornado.gen.coroutine
+    def read_stream(is_done, on_first=None, last_event_id=None):
+        parser = SSEParser()
+        messages = []
+        headers = {"Last-Event-ID": last_event_id} if last_event_id else {}
+
+        def on_chunk(chunk):
+            for msg in parser.feed(chunk):
+                messages.append(msg)
+
+                if len(messages) == 1 and on_first:
+                    on_first()
+
+            if is_done(messages):
+                raise Exception("Done")
+
+        http_client = tornado.httpclient.AsyncHTTPClient(force_instance=True)
+        http_request = tornado.httpclient.HTTPRequest(
+            href, method="GET", headers=headers, streaming_callback=on_chunk, request_timeout=10)
+
+        periodic_emit = tornado.ioloop.PeriodicCallback(
+            lambda: not len(messages) and exposed_thing.emit_event(event_name, "ready"), 20)
+
+        if not last_event_id:
+            periodic_emit.start()
+
+        try:
+            yield http_client.fetch(http_request)
+        except Exception:
+            pass
+        finally:
+            periodic_emit.stop()
+            http_client.close()
+
+        raise tornado.gen.Return(messages)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        def emit_first():
+            exposed_thing.emit_event(event_name, {"idx": 0})
+
+        def is_first_done(msgs):
+            return len(msgs) > 0 and json.loads(msgs[-1].data) == {"payload": {"idx": 0}}
+
+        messages = yield read_stream(is_first_done, on_first=emit_first)
+
+        for idx in range(1, 4):
+            exposed_thing.emit_event(event_name, {"idx": idx})
+
+        yield tornado.gen.sleep(0.1)
+
+        messages_resumed = yield read_stream(lambda msgs: len(msgs) >= 3, last_event_id=messages[-1].id)
+
+        assert [json.loads(msg.data) for msg in messages_resumed] == [
+            {"payload": {"idx": idx}} for idx in range(1, 4)
+        ]
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_subscription_cursor(http_server):
+    """Subscription cursors buffer the emissions between polls
+    and return all the unacknowledged items in a single response."""
+
+    exposed_thing = next(http_server.exposed_things)
+    event_name = next(six.iterkeys(exposed_thing.thing.events))
+    href = _get_event_observe_href(exposed_thing, event_name, http_server)
+    parsed = parse.urlparse(href)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        response = yield http_client.fetch(tornado.httpclient.HTTPRequest(href, method="POST", body=""))
+        cursor_url = json.loads(response.body).get("subscription")
+        cursor_href = "{}://{}{}".format(parsed.scheme, parsed.netloc, cursor_url)
+
+        @tornado.gen.coroutine
+        def poll(ack, timeout):
+            poll_href = "{}?ack={}&timeout={}".format(cursor_href, ack, timeout)
+            poll_res = yield http_client.fetch(tornado.httpclient.HTTPRequest(poll_href, method="GET"))
+            raise tornado.gen.Return(json.loads(poll_res.body))
+
+        periodic_emit = tornado.ioloop.PeriodicCallback(
+            lambda: exposed_thing.emit_event(event_name, "ready"), 20)
+
+        periodic_emit.start()
+        result = yield poll(0, 5)
+        periodic_emit.stop()
+
+        assert len(result["items"]) > 0
+        ack = result["items"][-1]["seq"]
+
+        for idx in range(5):
+            exposed_thing.emit_event(event_name, {"idx": idx})
+
+        yield tornado.gen.sleep(0.05)
+
+        result = yield poll(ack, 5)
+        items = [item for item in result["items"] if item["data"]["payload"] != "ready"]
+
+        assert [item["data"]["payload"] for item in items] == [{"idx": idx} for idx in range(5)]
+        assert result["dropped"] == 0
+
+        result_repeated = yield poll(ack, 0)
+
+        assert result_repeated["items"] == result["items"]
+
+        result_acked = yield poll(result["items"][-1]["seq"], 0)
+
+        assert result_acked["items"] == []
+
+        yield http_client.fetch(tornado.httpclient.HTTPRequest(cursor_href, method="DELETE"))
+
+        with pytest.raises(tornado.httpclient.HTTPError) as exc_info:
+            yield poll(0, 0)
+
+        assert exc_info.value.code == 404
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_subscription_cursor_expiration():
+    """Subscription cursors drop the oldest items when the
+    buffer is full and expire when they are not polled."""
+
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    event_name = uuid.uuid4().hex
+    exposed_thing.add_event(event_name, EventFragmentDict({"type": "number"}))
+
+    server = HTTPServer(port=find_free_port(), subscription_buffer_size=3, subscription_idle_secs=0.2)
+    server.add_exposed_thing(exposed_thing)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        yield server.start()
+
+        cursor = server.create_subscription_cursor(
+            exposed_thing.events[event_name], encode_event_data)
+
+        while not len((yield cursor.poll(timeout=0.01))):
+            exposed_thing.emit_event(event_name, -1)
+
+        for idx in range(5):
+            exposed_thing.emit_event(event_name, idx)
+
+        yield tornado.gen.sleep(0.05)
+
+        items = yield cursor.poll(timeout=0)
+
+        assert [json.loads(data)["payload"] for _, data in items] == [2, 3, 4]
+        assert cursor.dropped >= 2
+        assert cursor.id in server.subscription_cursors
+
+        yield tornado.gen.sleep(0.4)
+
+        assert cursor.id not in server.subscription_cursors
+
+        yield server.stop()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_action_invocation_expiration():
+    """Action invocations can be checked until their TTL expires,
+    responding with 410 afterwards and with 404 for unknown invocations."""
+
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    action_name = uuid.uuid4().hex
+
+    @tornado.gen.coroutine
+    def handler(parameters):
+        raise tornado.gen.Return(parameters.get("input"))
+
+    exposed_thing.add_action(action_name, ActionFragmentDict({
+        "input": {"type": "number"},
+        "output": {"type": "number"}
+    }), handler)
+
+    server = HTTPServer(port=find_free_port(), action_ttl_secs=0.1)
+    server.add_exposed_thing(exposed_thing)
+
+    href = _get_action_href(exposed_thing, action_name, server)
+    parsed = parse.urlparse(href)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        yield server.start()
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        response = yield http_client.fetch(tornado.httpclient.HTTPRequest(
+            href, method="POST", body=json.dumps({"input": 5}), headers=JSON_HEADERS))
+
+        invocation_url = json.loads(response.body).get("invocation")
+        invocation_href = "{}://{}{}".format(parsed.scheme, parsed.netloc, invocation_url)
+
+        response = yield http_client.fetch(tornado.httpclient.HTTPRequest(invocation_href, method="GET"))
+
+        assert json.loads(response.body) == {"done": True, "result": 5}
+
+        yield tornado.gen.sleep(0.2)
+
+        with pytest.raises(tornado.httpclient.HTTPError) as exc_info:
+            yield http_client.fetch(tornado.httpclient.HTTPRequest(invocation_href, method="GET"))
+
+        assert exc_info.value.code == 410
+
+        with pytest.raises(tornado.httpclient.HTTPError) as exc_info:
+            yield http_client.fetch(tornado.httpclient.HTTPRequest(
+                "{}://{}/invocation/{}".format(parsed.scheme, parsed.netloc, uuid.uuid4().hex), method="GET"))
+
+        assert exc_info.value.code == 404
+
+        yield server.stop()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_action_wait_and_long_poll():
+    """Action results are returned inline when they complete within the requested wait
+    and the invocation status can be long-polled with a timeout otherwise."""
+
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    action_name = uuid.uuid4().hex
+    action_futures = []
+
+    @tornado.gen.coroutine
+    def handler(parameters):
+        if parameters.get("input") is None:
+            action_futures.append(Future())
+            yield action_futures[-1]
+
+        raise tornado.gen.Return(parameters.get("input"))
+
+    exposed_thing.add_action(action_name, ActionFragmentDict({
+        "input": {"type": "number"},
+        "output": {"type": "number"}
+    }), handler)
+
+    server = HTTPServer(port=find_free_port())
+    server.add_exposed_thing(exposed_thing)
+
+    href = _get_action_href(exposed_thing, action_name, server)
+    parsed = parse.urlparse(href)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        yield server.start()
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        @tornado.gen.coroutine
+        def invoke(input_value, wait):
+            response = yield http_client.fetch(tornado.httpclient.HTTPRequest(
+                "{}?wait={}".format(href, wait), method="POST",
+                body=json.dumps({"input": input_value}), headers=JSON_HEADERS))
+
+            raise tornado.gen.Return(json.loads(response.body))
+
+        @tornado.gen.coroutine
+        def check(invocation_url, timeout):
+            response = yield http_client.fetch(tornado.httpclient.HTTPRequest(
+                "{}://{}{}?timeout={}".format(parsed.scheme, parsed.netloc, invocation_url, timeout)))
+
+            raise tornado.gen.Return(json.loads(response.body))
+
+        result = yield invoke(5, 5)
+
+        assert result.get("done") is True
+        assert result.get("result") == 5
+
+        result = yield invoke(None, 0.05)
+
+        assert result.get("done", None) is None
+
+        status = yield check(result.get("invocation"), 0.05)
+
+        assert status == {"done": False}
+
+        tornado.ioloop.IOLoop.current().call_later(0.1, lambda: action_futures[-1].set_result(None))
+
+        status = yield check(result.get("invocation"), 5)
+
+        assert status == {"done": True, "result": None}
+
+        yield server.stop()
+
+    run_test_coroutine(test_coroutine)
@@ -2,7 +2,9 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+import json
 import random
+import uuid
 
 import pytest
 import six
@@ -15,12 +17,14 @@ from tests.protocols.helpers import \
     client_test_on_event, \
     client_test_read_property, \
     client_test_write_property, \
+    client_test_read_write_multiple_properties, \
     client_test_invoke_action, \
     client_test_invoke_action_error
 from tests.protocols.mqtt.broker import is_test_broker_online, BROKER_SKIP_REASON
 from tests.utils import run_test_coroutine, DEFAULT_TIMEOUT_SECS
-from wotpy.protocols.exceptions import ClientRequestTimeout
+from wotpy.protocols.exceptions import ClientRequestTimeout, ProtocolClientException
 from wotpy.protocols.mqtt.client import MQTTClient
+from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
 from wotpy.wot.td import ThingDescription
 
 pytestmark = pytest.mark.skipif(is_test_broker_online() is False, reason=BROKER_SKIP_REASON)
@@ -38,6 +42,12 @@ def test_write_property(mqtt_servient):
     client_test_write_property(mqtt_servient, MQTTClient)
 
 
+def test_read_write_multiple_properties(mqtt_servient):
+    """Multiple Properties may be retrieved and updated in a single request using the MQTT binding client."""
+
+    client_test_read_write_multiple_properties(mqtt_servient, MQTTClient)
+
+
 def test_invoke_action(mqtt_servient):
     """Actions may be invoked using the MQTT binding client."""
 
@@ -202,3 +212,134 @@ def test_stop_timeout(mqtt_servient):
                 yield mqtt_client.read_property(td, prop_name, timeout=timeout)
 
     run_test_coroutine(test_coroutine)
+
+
+def test_correlated_responses(mqtt_servient):
+    """Concurrent Action invocations are resolved with their own results
+    among a large number of responses to other requests."""
+
+    exposed_thing = next(mqtt_servient.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.actions))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    href = MQTTClient._pick_mqtt_href(td, td.get_action_forms(action_name))
+    topic_result = ActionMQTTHandler.to_result_topic(MQTTClient._parse_href(href)["topic"])
+    num_others = 500
+    delivered = []
+
+    def _build_message(data):
+        return MagicMock(topic=topic_result, data=json.dumps(data).encode())
+
+    # noinspection PyUnusedLocal
+    def _effect_publish(topic, payload, **kwargs):
+        request_id = json.loads(payload.decode())["id"]
+        delivered.extend(_build_message({"id": uuid.uuid4().hex}) for _ in range(num_others))
+        delivered.append(_build_message({"id": request_id, "result": request_id}))
+        return _effect_dummy()
+
+    # noinspection PyUnusedLocal
+    def _effect_deliver(*args, **kwargs):
+        if not len(delivered):
+            return _effect_raise_timeout()
+
+        @tornado.gen.coroutine
+        def _coro():
+            yield tornado.gen.moment
+            raise tornado.gen.Return(delivered.pop(0))
+
+        return _coro()
+
+    mqtt_mock = _build_hbmqtt_mock(_effect_deliver)
+    mqtt_mock.return_value.publish.side_effect = _effect_publish
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mqtt_mock):
+            mqtt_client = MQTTClient()
+
+            results = yield [
+                mqtt_client.invoke_action(td, action_name, None, timeout=DEFAULT_TIMEOUT_SECS)
+                for _ in range(3)
+            ]
+
+            assert len(set(results)) == len(results)
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_publish_error_discards_pending_requests(mqtt_servient):
+    """Requests that can not be published raise errors and do not leave pending correlated responses."""
+
+    exposed_thing = next(mqtt_servient.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.actions))
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    # noinspection PyUnusedLocal
+    def _effect_publish(*args, **kwargs):
+        raise asyncio.TimeoutError("Publish error")
+
+    mqtt_mock = _build_hbmqtt_mock(_effect_raise_timeout)
+    mqtt_mock.return_value.publish.side_effect = _effect_publish
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mqtt_mock):
+            mqtt_client = MQTTClient()
+
+            with pytest.raises(asyncio.TimeoutError):
+                yield mqtt_client.invoke_action(td, action_name, None)
+
+            with pytest.raises(asyncio.TimeoutError):
+                yield mqtt_client.write_property(td, prop_name, Faker().pystr())
+
+            with pytest.raises(asyncio.TimeoutError):
+                yield mqtt_client.read_multiple_properties(td, [prop_name])
+
+            assert not any(len(waiters) for waiters in mqtt_client._correlations.values())
+
+            with pytest.raises(ProtocolClientException):
+                yield mqtt_client._publish(Faker().url(), Faker().pystr(), b"", qos=0)
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_concurrent_publish_window(mqtt_servient):
+    """Concurrent Property writes are published concurrently up to
+    the in-flight window and share a single subscription round trip."""
+
+    exposed_thing = next(mqtt_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    max_inflight = 3
+    num_writes = 10
+    state = {"inflight": 0, "peak": 0}
+
+    # noinspection PyUnusedLocal
+    def _effect_publish(*args, **kwargs):
+        @tornado.gen.coroutine
+        def _coro():
+            state["inflight"] += 1
+            state["peak"] = max(state["peak"], state["inflight"])
+            yield tornado.gen.sleep(0.05)
+            state["inflight"] -= 1
+
+        return _coro()
+
+    mqtt_mock = _build_hbmqtt_mock(_effect_raise_timeout)
+    mqtt_mock.return_value.publish.side_effect = _effect_publish
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mqtt_mock):
+            mqtt_client = MQTTClient(max_inflight=max_inflight)
+
+            yield [
+                mqtt_client.write_property(td, prop_name, Faker().pystr(), wait_ack=False)
+                for _ in range(num_writes)
+            ]
+
+            assert state["peak"] == max_inflight
+            assert mqtt_mock.return_value.publish.call_count == num_writes
+            assert mqtt_mock.return_value.subscribe.call_count == 1
+
+    run_test_coroutine(test_coroutine)
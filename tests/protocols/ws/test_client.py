@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import json
 import random
 import uuid
 
@@ -8,7 +9,6 @@ import six
 import tornado.concurrent
 import tornado.gen
 import tornado.ioloop
-import tornado.locks
 import tornado.websocket
 from mock import patch
 from rx.concurrency import IOLoopScheduler
@@ -18,12 +18,14 @@ from tests.protocols.helpers import \
     client_test_on_event, \
     client_test_read_property, \
     client_test_write_property, \
+    client_test_read_write_multiple_properties, \
     client_test_invoke_action, \
     client_test_invoke_action_error, \
     client_test_on_property_change_error
 from tests.utils import run_test_coroutine
 from wotpy.protocols.exceptions import ProtocolClientException, ClientRequestTimeout
 from wotpy.protocols.ws.client import WebsocketClient
+from wotpy.protocols.ws.compression import WebsocketCompression
 from wotpy.wot.td import ThingDescription
 
 
@@ -55,6 +57,12 @@ def test_write_property(websocket_servient):
     client_test_write_property(websocket_servient, WebsocketClient)
 
 
+def test_read_write_multiple_properties(websocket_servient):
+    """The Websockets client can read and write multiple properties in a single request."""
+
+    client_test_read_write_multiple_properties(websocket_servient, WebsocketClient)
+
+
 def test_invoke_action(websocket_servient):
     """The Websockets client can invoke actions."""
 
@@ -150,21 +158,24 @@ def test_on_property_change_error(websocket_servient):
 
 
 # noinspection PyUnusedLocal
-def _condition_coro(*args, **kwargs):
-    """Coroutine mock side effect that returns a Condition that is never notified."""
+def _never_resolved(*args, **kwargs):
+    """Mock side effect that returns a Future that is never resolved."""
+
+    return Future()
 
-    @tornado.gen.coroutine
-    def _coro():
-        raise tornado.gen.Return(tornado.locks.Condition())
 
-    return _coro()
+# noinspection PyUnusedLocal
+def _raise_write_error(*args, **kwargs):
+    """Mock side effect that fails to write a message."""
+
+    raise ProtocolClientException("Write error")
 
 
 def test_timeout_read_property(websocket_servient):
     """Timeouts can be defined on Property reads."""
 
     # noinspection PyUnresolvedReferences
-    with patch.object(WebsocketClient, '_send_message', _condition_coro):
+    with patch.object(WebsocketClient, '_send_message', _never_resolved):
         with pytest.raises(ClientRequestTimeout):
             client_test_read_property(websocket_servient, WebsocketClient, timeout=random.random())
 
@@ -173,7 +184,7 @@ def test_timeout_write_property(websocket_servient):
     """Timeouts can be defined on Property writes."""
 
     # noinspection PyUnresolvedReferences
-    with patch.object(WebsocketClient, '_send_message', _condition_coro):
+    with patch.object(WebsocketClient, '_send_message', _never_resolved):
         with pytest.raises(ClientRequestTimeout):
             client_test_write_property(websocket_servient, WebsocketClient, timeout=random.random())
 
@@ -182,6 +193,320 @@ def test_timeout_invoke_action(websocket_servient):
     """Timeouts can be defined on Action invocations."""
 
     # noinspection PyUnresolvedReferences
-    with patch.object(WebsocketClient, '_send_message', _condition_coro):
+    with patch.object(WebsocketClient, '_send_message', _never_resolved):
         with pytest.raises(ClientRequestTimeout):
             client_test_invoke_action(websocket_servient, WebsocketClient, timeout=random.random())
+
+
+def test_batch_requests(websocket_servient):
+    """Requests issued on the same loop iteration are sent to the server in a single batch message."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_names = list(td.properties.keys())
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient()
+        prop_values = {name: uuid.uuid4().hex for name in prop_names}
+
+        for name, value in six.iteritems(prop_values):
+            yield exposed_thing.write_property(name, value)
+
+        write_message = tornado.websocket.WebSocketClientConnection.write_message
+        raw_msgs = []
+
+        def write_message_spy(conn, message, *args, **kwargs):
+            raw_msgs.append(message)
+            return write_message(conn, message, *args, **kwargs)
+
+        with patch.object(tornado.websocket.WebSocketClientConnection, "write_message", write_message_spy):
+            values = yield [ws_client.read_property(td, name) for name in prop_names]
+
+        assert values == [prop_values[name] for name in prop_names]
+        assert len(raw_msgs) == 1
+        assert len(json.loads(raw_msgs[0])) == len(prop_names)
+
+    run_test_coroutine(test_coroutine)
+
+
+def _spy_websocket_connect(connect_urls):
+    """Returns a replacement for websocket_connect that records the connected URLs."""
+
+    websocket_connect = tornado.websocket.websocket_connect
+
+    def websocket_connect_spy(url, *args, **kwargs):
+        connect_urls.append(url)
+        return websocket_connect(url, *args, **kwargs)
+
+    return websocket_connect_spy
+
+
+def test_shared_subscriptions_connection(websocket_servient):
+    """Subscriptions to the same Thing are multiplexed over one WebSockets connection."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    event_name = next(six.iterkeys(td.events))
+    prop_name = next(six.iterkeys(td.properties))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient(idle_timeout_secs=0)
+        num_subscriptions = 10
+
+        connect_urls = []
+
+        future_events = [Future() for _ in range(num_subscriptions)]
+        future_prop = Future()
+
+        def build_on_next(fut):
+            def on_next(ev):
+                if not fut.done():
+                    fut.set_result(ev.data)
+
+            return on_next
+
+        with patch("tornado.websocket.websocket_connect", _spy_websocket_connect(connect_urls)):
+            subscriptions = [
+                ws_client.on_event(td, event_name).subscribe(build_on_next(fut))
+                for fut in future_events
+            ]
+
+            subscriptions.append(ws_client.on_property_change(td, prop_name).subscribe(build_on_next(future_prop)))
+
+            payload = uuid.uuid4().hex
+            prop_value = uuid.uuid4().hex
+
+            while not all(fut.done() for fut in future_events) or not future_prop.done():
+                exposed_thing.emit_event(event_name, payload)
+                yield exposed_thing.write_property(prop_name, prop_value)
+                yield tornado.gen.sleep(0.05)
+
+        assert len(connect_urls) == 1
+        assert all(fut.result() == payload for fut in future_events)
+        assert future_prop.result().value == prop_value
+
+        for subscription in subscriptions:
+            subscription.dispose()
+
+        while len(ws_client._conns):
+            yield tornado.gen.sleep(0.05)
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_dispose_before_subscription_response(websocket_servient):
+    """Subscriptions disposed before the server has acknowledged them
+    are disposed on the server once the acknowledgement arrives."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    event_name = next(six.iterkeys(td.events))
+    ws_server = next(six.itervalues(websocket_servient.servers))
+
+    def server_subscriptions():
+        return sum(len(handler._subscriptions) for handler in ws_server._handlers)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient()
+        gate = Future()
+        dispatch_msg = WebsocketClient._dispatch_msg
+
+        @tornado.gen.coroutine
+        def dispatch_msg_delayed(client, ws_url, msg):
+            yield gate
+            dispatch_msg(client, ws_url, msg)
+
+        with patch.object(WebsocketClient, "_dispatch_msg", dispatch_msg_delayed):
+            subscription_kept = ws_client.on_event(td, event_name).subscribe(lambda item: None)
+            subscription_disposed = ws_client.on_event(td, event_name).subscribe(lambda item: None)
+
+            while server_subscriptions() < 2:
+                yield tornado.gen.sleep(0.02)
+
+            assert sum(len(reqs) for reqs in ws_client._subscription_requests.values()) == 2
+
+            subscription_disposed.dispose()
+            yield tornado.gen.moment
+
+            gate.set_result(True)
+
+            while server_subscriptions() > 1:
+                yield tornado.gen.sleep(0.02)
+
+        assert sum(len(subs) for subs in ws_client._subscriptions.values()) == 1
+        assert not any(len(reqs) for reqs in ws_client._cancelled_requests.values())
+
+        subscription_kept.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_receive_timeout_deprecated():
+    """The unused receive_timeout_secs argument is deprecated."""
+
+    with pytest.warns(DeprecationWarning):
+        WebsocketClient(receive_timeout_secs=1.0)
+
+
+def test_persistent_connection(websocket_servient):
+    """Requests reuse a single connection that is kept alive until the idle timeout
+    expires, and pending requests are removed once they are completed or time out."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(six.iterkeys(td.properties))
+    idle_timeout_secs = 0.3
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient(idle_timeout_secs=idle_timeout_secs)
+        connect_urls = []
+        prop_value = uuid.uuid4().hex
+
+        yield exposed_thing.write_property(prop_name, prop_value)
+
+        with patch("tornado.websocket.websocket_connect", _spy_websocket_connect(connect_urls)):
+            values = yield [ws_client.read_property(td, prop_name) for _ in range(20)]
+
+            for _ in range(5):
+                values.append((yield ws_client.read_property(td, prop_name)))
+
+        assert all(value == prop_value for value in values)
+        assert len(connect_urls) == 1
+        assert len(ws_client._conns) == 1
+        assert not any(len(pending) for pending in ws_client._pending.values())
+
+        with patch.object(WebsocketClient, "_write_request", _never_resolved):
+            future_read = ws_client.read_property(td, prop_name, timeout=0.05)
+            yield tornado.gen.moment
+
+            assert any(len(pending) for pending in ws_client._pending.values())
+
+            with pytest.raises(ClientRequestTimeout):
+                yield future_read
+
+        assert not any(len(pending) for pending in ws_client._pending.values())
+
+        with patch.object(WebsocketClient, "_write_raw", _raise_write_error):
+            with pytest.raises(ProtocolClientException):
+                yield ws_client.read_property(td, prop_name)
+
+        assert not any(len(pending) for pending in ws_client._pending.values())
+
+        yield tornado.gen.sleep(idle_timeout_secs * 2)
+
+        assert not len(ws_client._conns)
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_reconnect(websocket_servient):
+    """The client reconnects transparently when the connection is closed."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(six.iterkeys(td.properties))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient()
+        connect_urls = []
+        prop_value = uuid.uuid4().hex
+
+        yield exposed_thing.write_property(prop_name, prop_value)
+
+        with patch("tornado.websocket.websocket_connect", _spy_websocket_connect(connect_urls)):
+            assert (yield ws_client.read_property(td, prop_name)) == prop_value
+
+            for conn in list(ws_client._conns.values()):
+                conn.close()
+
+            while len(ws_client._conns):
+                yield tornado.gen.sleep(0.05)
+
+            assert (yield ws_client.read_property(td, prop_name)) == prop_value
+
+        assert len(connect_urls) == 2
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_compression(websocket_servient):
+    """The client can request compression and keeps working when the server does not support it."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(six.iterkeys(td.properties))
+    ws_server = next(iter(websocket_servient.servers.values()))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        prop_value = uuid.uuid4().hex * 10
+        yield exposed_thing.write_property(prop_name, prop_value)
+
+        ws_client = WebsocketClient(compression=WebsocketCompression(level=1, mem_level=4, min_size=100))
+        assert (yield ws_client.read_property(td, prop_name)) == prop_value
+
+        conn = next(iter(ws_client._conns.values()))
+        assert "permessage-deflate" not in conn.headers.get("Sec-WebSocket-Extensions", "")
+
+        with patch.object(ws_server, "_compression", WebsocketCompression()):
+            ws_client = WebsocketClient(compression=WebsocketCompression(level=1, mem_level=4, min_size=100))
+            yield ws_client.write_property(td, prop_name, prop_value)
+            assert (yield ws_client.read_property(td, prop_name)) == prop_value
+
+            conn = next(iter(ws_client._conns.values()))
+            assert "permessage-deflate" in conn.headers.get("Sec-WebSocket-Extensions", "")
+            assert conn.protocol._compressor._compression_level == 1
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_compression_tornado_internals(websocket_servient):
+    """The private Tornado attributes used to tune compression exist in the installed
+    version and are left untouched on versions that are not known to have them."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(six.iterkeys(td.properties))
+    ws_server = next(iter(websocket_servient.servers.values()))
+
+    assert WebsocketCompression.supports_tornado_internals()
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        prop_value = uuid.uuid4().hex * 10
+        yield exposed_thing.write_property(prop_name, prop_value)
+        compression = WebsocketCompression(level=1, mem_level=4, min_size=100)
+
+        with patch.object(ws_server, "_compression", WebsocketCompression()):
+            ws_client = WebsocketClient(compression=compression)
+            assert (yield ws_client.read_property(td, prop_name)) == prop_value
+
+            protocol = next(iter(ws_client._conns.values())).protocol
+            compressor = protocol._compressor
+
+            assert compressor._mem_level == 4
+            assert callable(compressor._create_compressor)
+
+            with compression.uncompressed(protocol):
+                assert protocol._compressor is None
+
+            assert protocol._compressor is compressor
+
+            with patch.object(WebsocketCompression, "TORNADO_INTERNALS_VERSIONS", ((0, 0), (0, 0))):
+                ws_client = WebsocketClient(compression=compression)
+                assert (yield ws_client.read_property(td, prop_name)) == prop_value
+
+                protocol = next(iter(ws_client._conns.values())).protocol
+                compressor = protocol._compressor
+
+                assert compressor._mem_level != 4
+
+                with compression.uncompressed(protocol):
+                    assert protocol._compressor is compressor
+
+    run_test_coroutine(test_coroutine)
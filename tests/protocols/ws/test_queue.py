@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import tornado.gen
+from tornado.concurrent import Future
+
+from tests.utils import run_test_coroutine
+from wotpy.protocols.ws.enums import WebsocketOverflowPolicies
+from wotpy.protocols.ws.queue import WebsocketSendQueue
+
+
+class _BlockedConnection(object):
+    """Fake connection whose writes are only flushed on demand."""
+
+    def __init__(self):
+        self.written = []
+        self.closed = False
+        self._futures = []
+
+    def write(self, raw_msg):
+        self.written.append(raw_msg)
+        future = Future()
+        self._futures.append(future)
+        return future
+
+    def close(self):
+        self.closed = True
+
+    @tornado.gen.coroutine
+    def flush(self):
+        """Flushes the pending writes and lets the queue write the next message."""
+
+        while len(self._futures):
+            self._futures.pop(0).set_result(None)
+
+        yield tornado.gen.moment
+
+
+def _build_queue(conn, overflow_policy):
+    return WebsocketSendQueue(
+        write=conn.write, close=conn.close,
+        high_water=4, low_water=2,
+        overflow_policy=overflow_policy)
+
+
+def test_invalid_settings():
+    """Queues cannot be built with an unknown policy or inverted water marks."""
+
+    conn = _BlockedConnection()
+
+    with pytest.raises(ValueError):
+        WebsocketSendQueue(conn.write, conn.close, overflow_policy="unknown")
+
+    with pytest.raises(ValueError):
+        WebsocketSendQueue(conn.write, conn.close, high_water=10, low_water=10)
+
+
+def test_drop_oldest():
+    """Once the high water mark is reached the oldest emitted items are dropped,
+    while responses are always kept and the queue recovers at the low water mark."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        conn = _BlockedConnection()
+        queue = _build_queue(conn, WebsocketOverflowPolicies.DROP_OLDEST)
+
+        queue.put("res")
+
+        for idx in range(10):
+            queue.put("item-{}".format(idx), subscription_id="sub")
+
+        queue.put("res-late")
+
+        assert conn.written == ["res"]
+        assert queue.overflowing
+        assert queue.stats() == {"depth": 5, "dropped": 6, "coalesced": 0, "overflows": 1}
+
+        while queue.depth:
+            yield conn.flush()
+
+        assert conn.written == ["res", "item-6", "item-7", "item-8", "item-9", "res-late"]
+        assert not queue.overflowing
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_coalesce():
+    """On overflow the queued item of each subscription is replaced with its latest value."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        conn = _BlockedConnection()
+        queue = _build_queue(conn, WebsocketOverflowPolicies.COALESCE)
+
+        for idx in range(5):
+            queue.put("a-{}".format(idx), subscription_id="a")
+
+        for idx in range(3):
+            queue.put("b-{}".format(idx), subscription_id="b")
+            queue.put("a-{}".format(idx + 5), subscription_id="a")
+
+        assert queue.stats()["coalesced"] == 5
+        assert queue.stats()["dropped"] == 1
+        assert queue.depth == 4
+
+        while queue.depth:
+            yield conn.flush()
+
+        assert conn.written == ["a-0", "a-2", "a-3", "a-7", "b-2"]
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_close():
+    """The connection is closed when the queue overflows with the close policy."""
+
+    conn = _BlockedConnection()
+    queue = _build_queue(conn, WebsocketOverflowPolicies.CLOSE)
+
+    for idx in range(10):
+        queue.put("item-{}".format(idx), subscription_id="sub")
+
+    assert conn.closed
+    assert queue.depth == 0
+    assert queue.stats()["overflows"] == 1
+
+
+def test_stalled_writer_bounded():
+    """Dropped items are removed from the queue while a write is stalled."""
+
+    conn = _BlockedConnection()
+    queue = _build_queue(conn, WebsocketOverflowPolicies.DROP_OLDEST)
+
+    for idx in range(1000):
+        queue.put("item-{}".format(idx), subscription_id="sub-{}".format(idx % 3))
+
+    assert conn.written == ["item-0"]
+    assert len(queue._entries) <= queue._high_water
+    assert len(queue._emitted) <= queue._high_water
+    assert len(queue._latest) <= 3
+    assert queue.stats()["dropped"] == 1000 - 1 - queue.depth
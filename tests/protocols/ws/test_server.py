@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import datetime
+import json
 import ssl
 import uuid
 
@@ -12,17 +13,20 @@ import tornado.ioloop
 import tornado.testing
 import tornado.websocket
 from faker import Faker
+from mock import patch
 
 from tests.protocols.ws.conftest import build_websocket_url
 from tests.utils import find_free_port, run_test_coroutine
-from wotpy.protocols.ws.enums import WebsocketMethods, WebsocketErrors, WebsocketSchemes
+from wotpy.protocols.ws.compression import WebsocketCompression
+from wotpy.protocols.ws.enums import WebsocketMethods, WebsocketErrors, WebsocketSchemes, WebsocketOverflowPolicies
 from wotpy.protocols.ws.messages import \
     WebsocketMessageRequest, \
     WebsocketMessageResponse, \
     WebsocketMessageError, \
     WebsocketMessageEmittedItem
 from wotpy.protocols.ws.server import WebsocketServer
-from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+from wotpy.wot import events
+from wotpy.wot.dictionaries.interaction import PropertyFragmentDict, EventFragmentDict
 from wotpy.wot.exposed.thing import ExposedThing
 from wotpy.wot.servient import Servient
 from wotpy.wot.thing import Thing
@@ -427,6 +431,78 @@ def test_dispose(websocket_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_batch(websocket_server):
+    """Batches of requests are processed concurrently and answered in a single message."""
+
+    url_thing_01 = websocket_server.pop("url_thing_01")
+    exposed_thing_01 = websocket_server.pop("exposed_thing_01")
+    prop_name_01 = websocket_server.pop("prop_name_01")
+    prop_name_02 = websocket_server.pop("prop_name_02")
+    prop_value_01 = websocket_server.pop("prop_value_01")
+    prop_value_02 = websocket_server.pop("prop_value_02")
+    action_name = websocket_server.pop("action_name_01")
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        conn = yield tornado.websocket.websocket_connect(url_thing_01)
+
+        input_value = Faker().pystr()
+
+        requests = [
+            WebsocketMessageRequest(
+                method=WebsocketMethods.INVOKE_ACTION,
+                params={"name": action_name, "parameters": input_value},
+                msg_id=uuid.uuid4().hex),
+            WebsocketMessageRequest(
+                method=WebsocketMethods.READ_PROPERTY,
+                params={"name": prop_name_01},
+                msg_id=uuid.uuid4().hex),
+            WebsocketMessageRequest(
+                method=WebsocketMethods.READ_PROPERTY,
+                params={"name": prop_name_02},
+                msg_id=uuid.uuid4().hex),
+            WebsocketMessageRequest(
+                method=WebsocketMethods.ON_PROPERTY_CHANGE,
+                params={"name": prop_name_01},
+                msg_id=uuid.uuid4().hex)
+        ]
+
+        batch = [req.to_dict() for req in requests]
+        batch.append({"jsonrpc": "2.0", "method": WebsocketMethods.READ_PROPERTY, "params": {}, "id": 1})
+
+        conn.write_message(json.dumps(batch))
+
+        raw_resp = yield conn.read_message()
+        responses = json.loads(raw_resp)
+
+        assert isinstance(responses, list)
+        assert [item["id"] for item in responses] == [req.id for req in requests] + [1]
+        assert responses[0]["result"] == input_value.lower()
+        assert responses[1]["result"] == prop_value_01
+        assert responses[2]["result"] == prop_value_02
+        assert responses[4]["error"]["code"] == WebsocketErrors.INVALID_METHOD_PARAMS
+
+        subscription_id = WebsocketMessageResponse.from_msg(responses[3]).result
+
+        yield exposed_thing_01.write_property(prop_name_01, Faker().sentence())
+
+        msg_emitted_raw = yield conn.read_message()
+        msg_emitted = WebsocketMessageEmittedItem.from_raw(msg_emitted_raw)
+
+        assert msg_emitted.subscription_id == subscription_id
+
+        conn.write_message(json.dumps([]))
+
+        raw_error = yield conn.read_message()
+        ws_error = WebsocketMessageError.from_raw(raw_error)
+
+        assert ws_error.code == WebsocketErrors.INVALID_REQUEST
+
+        yield conn.close()
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_ssl_context(self_signed_ssl_context):
     """An SSL context can be passed to the WebSockets server to enable encryption."""
 
@@ -481,3 +557,184 @@ def test_ssl_context(self_signed_ssl_context):
         yield server.stop()
 
     run_test_coroutine(test_coroutine)
+
+
+def test_send_queue_overflow():
+    """Emitted items for slow connections are dropped once the send queue
+    reaches its high water mark and the drops are reported by the server."""
+
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    event_name = uuid.uuid4().hex
+    exposed_thing.add_event(event_name, EventFragmentDict({"type": "number"}))
+
+    port = find_free_port()
+
+    server = WebsocketServer(
+        port=port,
+        send_queue_high_water=4,
+        send_queue_low_water=2,
+        overflow_policy=WebsocketOverflowPolicies.DROP_OLDEST)
+
+    server.add_exposed_thing(exposed_thing)
+
+    write_message = tornado.websocket.WebSocketHandler.write_message
+
+    @tornado.gen.coroutine
+    def slow_write_message(handler, message, *args, **kwargs):
+        yield tornado.gen.sleep(0.02)
+        yield write_message(handler, message, *args, **kwargs)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        yield server.start()
+
+        with patch.object(tornado.websocket.WebSocketHandler, "write_message", slow_write_message):
+            conn = yield tornado.websocket.websocket_connect(build_websocket_url(exposed_thing, server, port))
+
+            msg_req = WebsocketMessageRequest(
+                method=WebsocketMethods.ON_EVENT,
+                params={"name": event_name},
+                msg_id=Faker().pyint())
+
+            conn.write_message(msg_req.to_json())
+            WebsocketMessageResponse.from_raw((yield conn.read_message()))
+
+            num_events = 20
+
+            for idx in range(num_events):
+                exposed_thing.emit_event(event_name, idx)
+                yield tornado.gen.moment
+
+            received = []
+
+            while not len(received) or received[-1] != num_events - 1:
+                msg_item = WebsocketMessageEmittedItem.from_raw((yield conn.read_message()))
+                received.append(msg_item.data)
+
+        stats = server.send_queue_stats()
+
+        assert len(stats) == 1
+        assert stats[0]["thing"] == exposed_thing.thing.url_name
+        assert stats[0]["dropped"] > 0
+        assert stats[0]["dropped"] + len(received) == num_events
+        assert received == sorted(received)
+
+        yield conn.close()
+        yield server.stop()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_compression():
+    """Compression is negotiated with clients that request it and
+    messages below the minimum size are sent uncompressed."""
+
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    prop_name = uuid.uuid4().hex
+    exposed_thing.add_property(prop_name, PropertyFragmentDict({"type": "string"}), value="")
+
+    port = find_free_port()
+    min_size = 200
+    server = WebsocketServer(port=port, compression=WebsocketCompression(level=9, min_size=min_size))
+    server.add_exposed_thing(exposed_thing)
+
+    compress = tornado.websocket._PerMessageDeflateCompressor.compress
+    compressed = []
+
+    def compress_spy(compressor, data):
+        compressed.append(data)
+        return compress(compressor, data)
+
+    @tornado.gen.coroutine
+    def read_value(conn):
+        msg_req = WebsocketMessageRequest(
+            method=WebsocketMethods.READ_PROPERTY,
+            params={"name": prop_name},
+            msg_id=Faker().pyint())
+
+        conn.write_message(msg_req.to_json())
+        msg_resp = WebsocketMessageResponse.from_raw((yield conn.read_message()))
+
+        raise tornado.gen.Return(msg_resp.result)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        yield server.start()
+
+        ws_url = build_websocket_url(exposed_thing, server, port)
+
+        conn_plain = yield tornado.websocket.websocket_connect(ws_url)
+        assert "permessage-deflate" not in conn_plain.headers.get("Sec-WebSocket-Extensions", "")
+        conn_plain.close()
+
+        conn = yield tornado.websocket.websocket_connect(ws_url, compression_options={})
+        assert "permessage-deflate" in conn.headers.get("Sec-WebSocket-Extensions", "")
+
+        with patch.object(tornado.websocket._PerMessageDeflateCompressor, "compress", compress_spy):
+            short_value = Faker().pystr(max_chars=10)
+            yield exposed_thing.write_property(prop_name, short_value)
+            assert (yield read_value(conn)) == short_value
+            assert not any(short_value.encode() in data for data in compressed)
+
+            long_value = "value" * min_size
+            yield exposed_thing.write_property(prop_name, long_value)
+            assert (yield read_value(conn)) == long_value
+            assert any(long_value.encode() in data for data in compressed)
+
+        conn.close()
+        yield server.stop()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_emitted_item_encoded_once(websocket_server):
+    """The data of an emission is encoded once and shared by all the subscriptions."""
+
+    url_thing_01 = websocket_server.pop("url_thing_01")
+    exposed_thing_01 = websocket_server.pop("exposed_thing_01")
+    event_name = websocket_server.pop("event_name_01")
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        num_conns = 3
+        num_subscriptions = 4
+
+        conns = yield [tornado.websocket.websocket_connect(url_thing_01) for _ in range(num_conns)]
+
+        for conn in conns:
+            conn.write_message(json.dumps([
+                WebsocketMessageRequest(
+                    method=WebsocketMethods.ON_EVENT,
+                    params={"name": event_name},
+                    msg_id=uuid.uuid4().hex).to_dict()
+                for _ in range(num_subscriptions)
+            ]))
+
+            yield conn.read_message()
+
+        to_json_obj = events.to_json_obj
+        encoded = []
+
+        def to_json_obj_spy(obj):
+            encoded.append(obj)
+            return to_json_obj(obj)
+
+        payload = {uuid.uuid4().hex for _ in range(5)}
+
+        with patch.object(events, "to_json_obj", to_json_obj_spy):
+            exposed_thing_01.emit_event(event_name, payload)
+
+            items = []
+
+            for conn in conns:
+                for _ in range(num_subscriptions):
+                    items.append(WebsocketMessageEmittedItem.from_raw((yield conn.read_message())))
+
+        assert len(encoded) == 1
+        assert len(set(item.subscription_id for item in items)) == num_conns * num_subscriptions
+        assert all(sorted(item.data) == sorted(payload) for item in items)
+
+        for conn in conns:
+            conn.close()
+
+    run_test_coroutine(test_coroutine)
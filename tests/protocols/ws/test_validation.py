@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+from faker import Faker
+from jsonschema import ValidationError, validate
+
+from wotpy.protocols.ws.enums import WebsocketMethods
+from wotpy.protocols.ws.messages import \
+    WebsocketMessageRequest, \
+    WebsocketMessageException, \
+    WebsocketMessageParamsException
+from wotpy.protocols.ws.schemas import SCHEMA_REQUEST_METHODS, SCHEMA_PARAMS
+from wotpy.protocols.ws.validation import FAST_REQUEST_VALIDATORS, validate_request, is_params_error
+
+
+def _build_request(method, params, msg_id=1):
+    """Builds a request message dict."""
+
+    return {"jsonrpc": "2.0", "method": method, "params": params, "id": msg_id}
+
+
+def _is_valid(validator, msg):
+    """Returns True if the given validator accepts the message."""
+
+    try:
+        validator(msg)
+        return True
+    except ValidationError:
+        return False
+
+
+FAST_VALIDATOR_MESSAGES = [
+    _build_request(WebsocketMethods.READ_PROPERTY, {"name": "prop"}),
+    _build_request(WebsocketMethods.READ_PROPERTY, {"name": "prop"}, msg_id="abc"),
+    _build_request(WebsocketMethods.READ_PROPERTY, {"name": "prop"}, msg_id=None),
+    _build_request(WebsocketMethods.READ_PROPERTY, {"name": "prop"}, msg_id=True),
+    _build_request(WebsocketMethods.READ_PROPERTY, {"name": "prop"}, msg_id=1.5),
+    _build_request(WebsocketMethods.READ_PROPERTY, {"name": 10}),
+    _build_request(WebsocketMethods.READ_PROPERTY, {}),
+    _build_request(WebsocketMethods.READ_PROPERTY, ["prop"]),
+    _build_request(WebsocketMethods.WRITE_PROPERTY, {"name": "prop", "value": None}),
+    _build_request(WebsocketMethods.WRITE_PROPERTY, {"name": "prop", "value": [1, 2]}),
+    _build_request(WebsocketMethods.WRITE_PROPERTY, {"name": "prop"}),
+    _build_request(WebsocketMethods.INVOKE_ACTION, {"name": "action"}),
+    _build_request(WebsocketMethods.INVOKE_ACTION, {"name": "action", "parameters": {"a": 1}}),
+    _build_request(WebsocketMethods.INVOKE_ACTION, {"name": None}),
+    dict(_build_request(WebsocketMethods.INVOKE_ACTION, {"name": "action"}), jsonrpc="1.0")
+]
+
+
+@pytest.mark.parametrize("msg", FAST_VALIDATOR_MESSAGES)
+def test_fast_validators_match_schemas(msg):
+    """The hand-written request validators agree with the JSON schemas."""
+
+    method = msg["method"]
+
+    def validate_schema(item):
+        validate(item, SCHEMA_REQUEST_METHODS[method])
+
+    assert _is_valid(FAST_REQUEST_VALIDATORS[method], msg) == _is_valid(validate_schema, msg)
+
+
+def test_validate_request_params_errors():
+    """Errors in the params of a request can be told apart from errors in the envelope."""
+
+    for method in SCHEMA_PARAMS:
+        validate_request(_build_request(method, {
+            "name": "name",
+            "value": 1,
+            "values": {"name": 1},
+            "subscription": "sub"
+        }))
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_request(_build_request(WebsocketMethods.ON_EVENT, {}))
+
+    assert is_params_error(exc_info.value)
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_request(dict(_build_request(WebsocketMethods.ON_EVENT, {"name": "name"}), jsonrpc="1.0"))
+
+    assert not is_params_error(exc_info.value)
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_request(_build_request(Faker().pystr(), {}))
+
+    assert not is_params_error(exc_info.value)
+
+
+def test_request_from_raw():
+    """Requests are parsed from raw messages and invalid params are reported with the message ID."""
+
+    msg_id = Faker().pystr()
+    params = {"name": Faker().pystr(), "value": Faker().pystr()}
+    raw_msg = json.dumps(_build_request(WebsocketMethods.WRITE_PROPERTY, params, msg_id=msg_id))
+    req = WebsocketMessageRequest.from_raw(raw_msg)
+
+    assert req.method == WebsocketMethods.WRITE_PROPERTY
+    assert req.params == params
+    assert req.id == msg_id
+
+    raw_msg_params = json.dumps(_build_request(WebsocketMethods.WRITE_PROPERTY, {}, msg_id=msg_id))
+
+    with pytest.raises(WebsocketMessageParamsException) as exc_info:
+        WebsocketMessageRequest.from_raw(raw_msg_params)
+
+    assert exc_info.value.msg_id == msg_id
+
+    with pytest.raises(WebsocketMessageException) as exc_info:
+        WebsocketMessageRequest.from_raw("{")
+
+    assert not isinstance(exc_info.value, WebsocketMessageParamsException)
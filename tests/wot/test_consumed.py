@@ -7,6 +7,7 @@ import six
 import tornado.gen
 import tornado.ioloop
 from faker import Faker
+from mock import patch
 from rx.concurrency import IOLoopScheduler
 from tornado.concurrent import Future
 
@@ -354,6 +355,9 @@ def test_thing_interaction_dict_behaviour(consumed_exposed_pair):
     assert prop_name
     assert len(consumed_thing.properties) > 0
     assert prop_name in consumed_thing.properties
+    assert prop_name.upper() in consumed_thing.properties
+    assert prop_name not in consumed_thing.actions
+    assert consumed_thing.properties[prop_name.upper()].description
 
 
 def test_consumed_client_protocols_preference():
@@ -423,3 +427,75 @@ def test_consumed_client_protocols_preference():
     assert client_02_class in six.iterkeys(client_server_map)
 
     tornado.ioloop.IOLoop.current().run_sync(servient_shutdown)
+
+
+def test_read_write_multiple_properties(consumed_exposed_pair):
+    """A ConsumedThing is able to read and write multiple properties
+    even if no client supports the Thing-level operations."""
+
+    consumed_thing = consumed_exposed_pair.pop("consumed_thing")
+    exposed_thing = consumed_exposed_pair.pop("exposed_thing")
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        prop_name = next(six.iterkeys(consumed_thing.td.properties))
+
+        values_exposed = yield exposed_thing.read_all_properties()
+        values_consumed = yield consumed_thing.read_all_properties()
+
+        assert values_consumed == values_exposed
+
+        value = Faker().sentence()
+
+        yield consumed_thing.write_multiple_properties({prop_name: value})
+        values = yield consumed_thing.read_multiple_properties([prop_name])
+
+        assert values == {prop_name: value}
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_consumed_multiple_properties_single_request():
+    """A ConsumedThing reads and writes multiple properties in a single
+    request when the Thing Description contains the Thing-level forms."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(HTTPServer(port=find_free_port()))
+
+    prop_names = [uuid.uuid4().hex for _ in range(3)]
+
+    td_produce = ThingDescription({
+        "id": uuid.uuid4().urn,
+        "name": uuid.uuid4().hex,
+        "properties": {
+            prop_name: {"observable": True, "type": "string"}
+            for prop_name in prop_names
+        }
+    })
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        wot = yield servient.start()
+
+        exposed_thing = wot.produce(td_produce.to_str())
+        exposed_thing.expose()
+
+        td = ThingDescription.from_thing(exposed_thing.thing)
+
+        assert len(td.get_thing_forms())
+
+        consumed_thing = wot.consume(td.to_str())
+        values = {prop_name: Faker().sentence() for prop_name in prop_names}
+
+        with patch.object(HTTPClient, "read_property", side_effect=AssertionError), \
+                patch.object(HTTPClient, "write_property", side_effect=AssertionError):
+            yield consumed_thing.write_multiple_properties(values)
+            values_all = yield consumed_thing.read_all_properties()
+            values_some = yield consumed_thing.read_multiple_properties(prop_names[:2])
+
+        assert values_all == values
+        assert values_some == {prop_name: values[prop_name] for prop_name in prop_names[:2]}
+
+        yield servient.shutdown()
+
+    run_test_coroutine(test_coroutine)
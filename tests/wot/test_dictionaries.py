@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import json
+import sys
 
 import pytest
 import six
@@ -236,3 +237,132 @@ def test_thing_fragment_setters():
     thing_fragment.version = version_updated
 
     assert thing_fragment.version.instance == version_updated.instance
+
+
+def _legacy_to_dict(wot_dict):
+    """Reference implementation of the dict serialization that
+    looks up the existing fields on each call with dir()."""
+
+    from wotpy.utils.utils import to_snake
+
+    def serialize(val):
+        if isinstance(val, list) and len(val) and hasattr(val[0], "to_dict"):
+            return [_legacy_to_dict(item) for item in val]
+
+        if isinstance(val, dict) and len(val) and hasattr(next(six.itervalues(val)), "to_dict"):
+            return {key: _legacy_to_dict(item) for key, item in six.iteritems(val)}
+
+        if hasattr(val, "to_dict"):
+            return _legacy_to_dict(val)
+
+        return val
+
+    ret = {
+        name: serialize(getattr(wot_dict, to_snake(name)))
+        for name in wot_dict.Meta.fields
+        if name in wot_dict._init or (
+                to_snake(name) in dir(wot_dict) and
+                getattr(wot_dict, to_snake(name)) is not None)
+    }
+
+    if isinstance(wot_dict, PropertyFragmentDict):
+        ret.update(_legacy_to_dict(wot_dict.data_schema))
+
+    return ret
+
+
+def test_dictionaries_slots():
+    """WoT dictionaries do not allocate a per-instance attribute dict."""
+
+    thing_fragment = ThingFragment(THING_INIT)
+
+    items = [thing_fragment, thing_fragment.version] + thing_fragment.security
+    items += list(thing_fragment.properties.values())
+    items += list(thing_fragment.actions.values())
+    items += list(thing_fragment.events.values())
+
+    for item in items:
+        assert not hasattr(item, "__dict__")
+
+
+def test_dictionaries_memoized_wrappers():
+    """Nested wrappers are built once and rebuilt after the fragment is updated."""
+
+    thing_fragment = ThingFragment(THING_INIT)
+
+    prop_fragment = thing_fragment.properties["status"]
+
+    assert thing_fragment.properties["status"] is prop_fragment
+    assert prop_fragment.forms[0] is prop_fragment.forms[0]
+
+    prop_fragment.forms.pop()
+
+    assert len(prop_fragment.forms) == 1
+
+    # noinspection PyPropertyAccess
+    thing_fragment.properties = {"status": PropertyFragmentDict(type=DataType.NUMBER)}
+
+    assert thing_fragment.properties["status"] is not prop_fragment
+    assert thing_fragment.properties["status"].type == DataType.NUMBER
+
+
+@pytest.mark.skipif(sys.version_info < (3, 4), reason="Requires tracemalloc")
+def test_dictionaries_memory():
+    """WoT dictionaries take less memory than objects that keep the same internal dict in an attribute dict."""
+
+    class DictBackedForm(object):
+        """Reference dictionary that allocates a per-instance attribute dict."""
+
+        def __init__(self, init):
+            self._init = dict(init)
+            self._wrappers = None
+
+    import tracemalloc
+
+    def traced_size(builder, num_items=1000):
+        form_inits = [{"href": "/prop{}".format(idx), "op": "readproperty"} for idx in range(num_items)]
+
+        tracemalloc.start()
+
+        try:
+            size_start = tracemalloc.get_traced_memory()[0]
+            items = [builder(form_init) for form_init in form_inits]
+            size_end = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        assert len(items) == num_items
+
+        return size_end - size_start
+
+    assert not hasattr(FormDict(href="/prop"), "__dict__")
+    assert hasattr(DictBackedForm({"href": "/prop"}), "__dict__")
+    assert traced_size(FormDict) < traced_size(DictBackedForm)
+
+
+def test_dictionaries_serialization_reference():
+    """The serialization of a Thing fragment with hundreds of interactions
+    is equal to that of the reference dir()-based implementation."""
+
+    fragment_init = {
+        "id": THING_INIT["id"],
+        "properties": {
+            "prop{}".format(idx): {
+                "type": "number",
+                "observable": True,
+                "forms": [{"href": "/prop{}".format(idx), "op": ["readproperty"]}]
+            }
+            for idx in range(200)
+        },
+        "actions": {
+            "action{}".format(idx): {
+                "input": {"type": "object", "properties": {"val": {"type": "string"}}},
+                "forms": [{"href": "/action{}".format(idx)}]
+            }
+            for idx in range(200)
+        }
+    }
+
+    thing_fragment = ThingFragment(fragment_init)
+
+    assert thing_fragment.to_dict() == _legacy_to_dict(thing_fragment)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from wotpy.wot.events import EmittedEvent, PropertyChangeEmittedEvent, PropertyChangeEventInit
+
+
+def test_json_data():
+    """Emission data is serialized to JSON, falling back to the attributes of objects."""
+
+    assert json.loads(EmittedEvent(init={"a": [1, 2]}, name="ev").json_data) == {"a": [1, 2]}
+
+    init = PropertyChangeEventInit(name="prop", value=3)
+    assert json.loads(PropertyChangeEmittedEvent(init=init).json_data) == {"name": "prop", "value": 3}
+
+
+def test_json_data_not_serializable():
+    """A ValueError is raised when the emission data cannot be serialized."""
+
+    with pytest.raises(ValueError):
+        EmittedEvent(init=object(), name="ev").json_data
+
+    with pytest.raises(ValueError):
+        EmittedEvent(init={"a", object()}, name="ev").json_data
+
+    init = PropertyChangeEventInit(name="prop", value={object()})
+
+    with pytest.raises(ValueError):
+        PropertyChangeEmittedEvent(init=init).json_data
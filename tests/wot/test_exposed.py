@@ -141,6 +141,50 @@ def test_write_non_writable_property(exposed_thing):
     run_test_coroutine(test_coroutine)
 
 
+def test_read_write_multiple_properties(exposed_thing, property_fragment):
+    """Multiple Properties may be retrieved and updated at once on ExposedThings."""
+
+    prop_init_non_writable = PropertyFragmentDict({
+        "type": "string",
+        "readOnly": True
+    })
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        prop_names = [uuid.uuid4().hex for _ in range(3)]
+
+        for prop_name in prop_names:
+            exposed_thing.add_property(prop_name, property_fragment)
+
+        values = {prop_name: Faker().sentence() for prop_name in prop_names}
+
+        yield exposed_thing.write_multiple_properties(values)
+
+        values_all = yield exposed_thing.read_all_properties()
+        values_some = yield exposed_thing.read_multiple_properties(prop_names[:2])
+
+        assert values_all == values
+        assert values_some == {prop_name: values[prop_name] for prop_name in prop_names[:2]}
+
+        with pytest.raises(KeyError):
+            yield exposed_thing.read_multiple_properties([prop_names[0], uuid.uuid4().hex])
+
+        non_writable_name = uuid.uuid4().hex
+        exposed_thing.add_property(non_writable_name, prop_init_non_writable)
+
+        with pytest.raises(TypeError):
+            yield exposed_thing.write_multiple_properties({
+                prop_names[0]: Faker().sentence(),
+                non_writable_name: Faker().sentence()
+            })
+
+        value = yield exposed_thing.read_property(prop_names[0])
+
+        assert value == values[prop_names[0]]
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_invoke_action(exposed_thing, action_fragment):
     """Actions can be invoked on ExposedThings."""
 
@@ -307,6 +351,51 @@ def test_on_event(exposed_thing, event_fragment):
     subscription.dispose()
 
 
+def test_on_event_topics(exposed_thing, event_fragment, property_fragment):
+    """Emissions only reach the observers of their own event or property."""
+
+    event_names = [uuid.uuid4().hex for _ in range(3)]
+    prop_names = [uuid.uuid4().hex for _ in range(3)]
+
+    for name in event_names:
+        exposed_thing.add_event(name, event_fragment)
+
+    for name in prop_names:
+        exposed_thing.add_property(name, property_fragment)
+
+    received = {name: [] for name in event_names + prop_names}
+
+    def build_on_next(name):
+        return lambda ev: received[name].append(ev)
+
+    subscriptions = [
+        exposed_thing.on_event(name).subscribe(build_on_next(name))
+        for name in event_names
+    ] + [
+        exposed_thing.on_property_change(name).subscribe(build_on_next(name))
+        for name in prop_names
+    ]
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        exposed_thing.emit_event(event_names[0], Faker().pystr())
+        yield exposed_thing.write_property(prop_names[0], Faker().pystr())
+
+        assert len(received[event_names[0]]) == 1
+        assert len(received[prop_names[0]]) == 1
+        assert received[prop_names[0]][0].data.name == prop_names[0]
+
+        for name in event_names[1:] + prop_names[1:]:
+            assert not len(received[name])
+
+        for subscription in subscriptions:
+            subscription.dispose()
+
+        assert not len(exposed_thing._events_dispatcher.topics)
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_on_td_change(exposed_thing, property_fragment, event_fragment, action_fragment):
     """Thing Description changes can be observed."""
 
@@ -316,6 +405,58 @@ def test_on_td_change(exposed_thing, property_fragment, event_fragment, action_f
     _test_td_change_events(exposed_thing, property_fragment, event_fragment, action_fragment, subscribe_func)
 
 
+def test_batch_changes(exposed_thing, property_fragment, event_fragment, action_fragment):
+    """Thing Description changes in a batch are applied immediately and notified in one event."""
+
+    events = []
+    subscription = exposed_thing.on_td_change().subscribe(events.append)
+
+    prop_names = [Faker().pystr() for _ in range(10)]
+    event_name = Faker().pystr()
+    action_name = Faker().pystr()
+
+    with exposed_thing.batch_changes():
+        for prop_name in prop_names:
+            exposed_thing.add_property(prop_name, property_fragment)
+
+        with exposed_thing.batch_changes():
+            exposed_thing.add_event(event_name, event_fragment)
+            exposed_thing.add_action(action_name, action_fragment)
+
+        exposed_thing.remove_action(action_name)
+
+        assert exposed_thing.thing.find_interaction(prop_names[0])
+        assert exposed_thing.thing.find_interaction(event_name)
+        assert not len(events)
+
+    assert len(events) == 1
+
+    event_data = events[0].data
+
+    assert event_data.method == TDChangeMethod.CHANGE
+    assert len(event_data.changes) == len(prop_names) + 3
+    assert event_data.changes[-1]["method"] == TDChangeMethod.REMOVE
+    assert event_data.changes[-1]["name"] == action_name
+    assert set(prop_names).issubset(set(event_data.description["properties"].keys()))
+    assert event_name in event_data.description["events"]
+    assert action_name not in event_data.description.get("actions", {})
+
+    with exposed_thing.batch_changes():
+        exposed_thing.remove_event(event_name)
+
+    assert len(events) == 2
+    assert events[1].data.td_change_type == TDChangeType.EVENT
+    assert events[1].data.method == TDChangeMethod.REMOVE
+    assert events[1].data.name == event_name
+
+    with exposed_thing.batch_changes():
+        pass
+
+    assert len(events) == 2
+
+    subscription.dispose()
+
+
 def test_thing_property_get(exposed_thing, property_fragment):
     """Property values can be retrieved on ExposedThings using the map-like interface."""
 
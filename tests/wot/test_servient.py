@@ -3,6 +3,8 @@
 
 import json
 import random
+import subprocess
+import sys
 import uuid
 
 import pytest
@@ -12,14 +14,16 @@ import tornado.httpclient
 import tornado.ioloop
 import tornado.websocket
 from faker import Faker
+from mock import patch
 
 from tests.utils import find_free_port, run_test_coroutine
 from wotpy.protocols.enums import Protocols
+from wotpy.protocols.http.client import HTTPClient
 from wotpy.protocols.ws.client import WebsocketClient
 from wotpy.protocols.ws.server import WebsocketServer
 from wotpy.wot.constants import WOT_TD_CONTEXT_URL
 from wotpy.wot.consumed.thing import ConsumedThing
-from wotpy.wot.servient import Servient
+from wotpy.wot.servient import Servient, DefaultClientBuilder
 from wotpy.wot.td import ThingDescription
 from wotpy.wot.wot import WoT
 
@@ -251,6 +255,59 @@ def test_catalogue_disabled_things(servient):
     run_test_coroutine(test_coroutine)
 
 
+def test_catalogue_etag(servient):
+    """The Servient TD catalogue replies with 304 Not Modified
+    for fresh ETags and updates them when the Things change."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        wot = WoT(servient=servient)
+
+        exposed_thing = wot.produce(json.dumps(TD_DICT_01))
+        exposed_thing.expose()
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+        base_url = "http://localhost:{}".format(servient.catalogue_port)
+
+        urls = [
+            "{}/{}".format(base_url, exposed_thing.thing.url_name),
+            "{}/?expanded=true".format(base_url)
+        ]
+
+        for url in urls:
+            response = yield http_client.fetch(url)
+            etag = response.headers.get("Etag")
+
+            assert etag
+
+            response = yield http_client.fetch(
+                url, headers={"If-None-Match": etag}, raise_error=False)
+
+            assert response.code == 304
+            assert not response.body
+
+        responses_prev = yield [http_client.fetch(url) for url in urls]
+
+        prop_name = uuid.uuid4().hex
+
+        exposed_thing.add_property(prop_name, {"type": "string"})
+
+        for url, response_prev in zip(urls, responses_prev):
+            response = yield http_client.fetch(
+                url, headers={"If-None-Match": response_prev.headers.get("Etag")})
+
+            assert response.code == 200
+            assert response.headers.get("Etag") != response_prev.headers.get("Etag")
+            assert prop_name in response.body.decode()
+
+        catalogue_expanded = yield fetch_catalogue(servient, expanded=True)
+        td = ThingDescription(catalogue_expanded[TD_DICT_01["id"]])
+
+        assert prop_name in td.properties
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_clients_subset():
     """Although all clients are enabled by default, the user may only enable a subset."""
 
@@ -268,6 +325,166 @@ def test_clients_config():
     """Custom configuration arguments can be passed to the Servient default protocol clients."""
 
     connect_timeout = random.random()
-    servient = Servient(clients_config={Protocols.HTTP: {"connect_timeout": connect_timeout}})
+    max_clients = random.randint(1, 1000)
+
+    servient = Servient(clients_config={Protocols.HTTP: {
+        "connect_timeout": connect_timeout,
+        "max_clients": max_clients
+    }})
 
     assert servient.clients[Protocols.HTTP].connect_timeout == connect_timeout
+    assert servient.clients[Protocols.HTTP].max_clients == max_clients
+
+
+def test_batch_changes_forms():
+    """Forms are regenerated once for each batch of changes on an enabled ExposedThing."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(WebsocketServer(port=find_free_port()))
+
+    wot = WoT(servient=servient)
+    exposed_thing = wot.produce(json.dumps(TD_DICT_02))
+    exposed_thing.expose()
+
+    prop_names = [Faker().pystr() for _ in range(5)]
+    refresh_forms = servient.refresh_exposed_thing_forms
+
+    with patch.object(servient, "refresh_exposed_thing_forms", wraps=refresh_forms) as refresh_mock:
+        with exposed_thing.batch_changes():
+            for prop_name in prop_names:
+                exposed_thing.add_property(prop_name, {"type": "string"})
+
+        assert refresh_mock.call_count == 1
+
+    for prop_name in prop_names:
+        forms = exposed_thing.thing.properties[prop_name].forms
+        assert len(forms) and all(form.protocol == Protocols.WEBSOCKETS for form in forms)
+
+
+def test_enable_exposed_things():
+    """ExposedThings can be enabled in bulk and only the Forms of the enabled Things are generated."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(WebsocketServer(port=find_free_port()))
+
+    wot = WoT(servient=servient)
+
+    exposed_things = [
+        wot.produce(json.dumps({"id": uuid.uuid4().urn, "title": Faker().pystr()}))
+        for _ in range(5)
+    ]
+
+    for exposed_thing in exposed_things:
+        exposed_thing.add_property(Faker().pystr(), {"type": "string"})
+
+    servient.enable_exposed_things([item.id for item in exposed_things[:-1]])
+
+    assert len(list(servient.enabled_exposed_things)) == len(exposed_things) - 1
+
+    add_forms = servient._add_interaction_forms
+
+    with patch.object(servient, "_add_interaction_forms", wraps=add_forms) as add_forms_mock:
+        exposed_things[-1].expose()
+        assert add_forms_mock.call_count == 1
+        assert add_forms_mock.call_args[0][1] is exposed_things[-1]
+
+    for exposed_thing in exposed_things:
+        for prop in six.itervalues(exposed_thing.thing.properties):
+            assert len(prop.forms) == 1
+
+    exposed_things[0].destroy()
+
+    assert len(list(servient.enabled_exposed_things)) == len(exposed_things) - 1
+
+    for prop in six.itervalues(exposed_things[0].thing.properties):
+        assert not len(prop.forms)
+
+    with pytest.raises(ValueError):
+        servient.enable_exposed_things([uuid.uuid4().urn])
+
+
+def test_default_clients_lazy_build():
+    """Default Protocol Binding clients are only built when they are selected."""
+
+    prop_name = Faker().pystr()
+
+    td = ThingDescription({
+        "id": uuid.uuid4().urn,
+        "title": Faker().sentence(),
+        "properties": {
+            prop_name: {
+                "type": "string",
+                "forms": [{"href": "http://localhost:8080/{}".format(prop_name)}]
+            }
+        }
+    })
+
+    servient = Servient(catalogue_port=None)
+
+    assert all(isinstance(item, DefaultClientBuilder) for item in six.itervalues(servient._clients))
+
+    client = servient.select_client(td, prop_name)
+
+    assert isinstance(client, HTTPClient)
+    assert servient.select_client(td, prop_name) is client
+    assert isinstance(servient._clients[Protocols.WEBSOCKETS], DefaultClientBuilder)
+    assert not any(isinstance(item, DefaultClientBuilder) for item in six.itervalues(servient.clients))
+
+
+def test_default_clients_support_checks():
+    """Default client builders and the clients agree on the Forms that are supported."""
+
+    prop_name = Faker().pystr()
+    href = "http://localhost:8080/{}".format(prop_name)
+
+    def build_td(subprotocol):
+        return ThingDescription({
+            "id": uuid.uuid4().urn,
+            "title": Faker().sentence(),
+            "properties": {prop_name: {"type": "string", "forms": [{"href": href, "subprotocol": subprotocol}]}}
+        })
+
+    servient = Servient(catalogue_port=None)
+    builder = servient._clients[Protocols.HTTP]
+    http_client = HTTPClient()
+
+    for td in [build_td("longpoll"), build_td("sse")]:
+        assert builder.is_supported_interaction(td, prop_name)
+        assert http_client.is_supported_interaction(td, prop_name)
+
+    td_longpoll = build_td("longpoll")
+
+    assert HTTPClient.pick_http_href(td_longpoll, td_longpoll.get_property_forms(prop_name)) == href
+    assert HTTPClient.pick_http_href(td_longpoll, td_longpoll.get_property_forms(prop_name), subprotocol="sse") is None
+
+
+LAZY_IMPORT_MODULES = [
+    "tornado.web",
+    "tornado.websocket",
+    "tornado.httpclient",
+    "aiocoap",
+    "hbmqtt",
+    "wotpy.protocols.http.client",
+    "wotpy.protocols.ws.client",
+    "wotpy.protocols.coap.client",
+    "wotpy.protocols.mqtt.client"
+]
+
+
+def test_servient_lazy_imports():
+    """Importing the servient and building an instance does not import the Protocol Binding modules."""
+
+    code = "\n".join([
+        "import json, sys",
+        "from wotpy.wot.servient import Servient",
+        "Servient(catalogue_port=None)",
+        "print(json.dumps(sorted(sys.modules.keys())))"
+    ])
+
+    output = subprocess.check_output([sys.executable, "-c", code])
+    modules = json.loads(output.decode().strip().splitlines()[-1])
+
+    assert "wotpy.wot.servient" in modules
+
+    for module_name in LAZY_IMPORT_MODULES:
+        assert module_name not in modules
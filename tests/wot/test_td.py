@@ -50,6 +50,24 @@ def test_from_dict():
     assert td.description == TD_EXAMPLE.get("description")
 
 
+def test_from_thing_trusted():
+    """ThingDescription objects built from Thing objects skip validation unless requested."""
+
+    thing = Thing(id="invalid thing id")
+
+    td = ThingDescription.from_thing(thing)
+
+    assert td.id == thing.id
+
+    with pytest.raises(InvalidDescription):
+        ThingDescription.from_thing(thing, validate=True)
+
+    with pytest.raises(InvalidDescription):
+        ThingDescription(td.to_dict())
+
+    ThingDescription(td.to_dict(), validate=False)
+
+
 def test_from_thing():
     """ThingDescription objects can be built from Thing objects."""
 
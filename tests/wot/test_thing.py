@@ -83,6 +83,8 @@ def test_find_interaction():
     assert thing.find_interaction(interaction_02.name) is interaction_02
     assert thing.find_interaction(slugify(interaction_01.name)) is interaction_01
     assert thing.find_interaction(slugify(interaction_02.name)) is interaction_02
+    assert thing.find_interaction_by_url_name(slugify(interaction_02.name)) is interaction_02
+    assert thing.find_interaction_by_url_name(interaction_02.name) is None
 
 
 def test_remove_interaction():
@@ -157,3 +159,42 @@ def test_duplicated_forms():
 
     with pytest.raises(ValueError):
         interaction.add_form(form_06)
+
+
+def test_cached_derived_values():
+    """Values derived from the Thing are cached and invalidated on each update."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+
+    url_name = thing.url_name
+    fragment = thing.thing_fragment
+
+    assert thing.thing_fragment is fragment
+    assert thing.url_name == url_name
+    assert thing.uuid == thing.uuid
+
+    revision = thing.revision
+    thing.title = uuid.uuid4().hex
+
+    assert thing.revision > revision
+    assert thing.url_name != url_name
+    assert thing.url_name == slugify("{}-{}".format(thing.title, thing.uuid))
+    assert thing.thing_fragment.title == thing.title
+
+    interaction = Action(thing=thing, name="my_interaction")
+    thing.add_interaction(interaction)
+
+    assert interaction.name in thing.thing_fragment.actions
+
+    form = Form(interaction=interaction, protocol=Protocols.HTTP, href="/href-01")
+    interaction.add_form(form)
+
+    assert len(thing.thing_fragment.actions[interaction.name].forms) == 1
+
+    interaction.remove_form(form)
+
+    assert len(thing.thing_fragment.actions[interaction.name].forms) == 0
+
+    thing.remove_interaction(interaction.name)
+
+    assert interaction.name not in thing.thing_fragment.actions
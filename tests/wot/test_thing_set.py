@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import uuid
+
+import pytest
+from faker import Faker
+from mock import patch, PropertyMock
+
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.exposed.thing_set import ExposedThingSet
+from wotpy.wot.interaction import Action
+from wotpy.wot.servient import Servient
+from wotpy.wot.thing import Thing
+
+
+def test_find_by_thing_id():
+    """ExposedThings may be retrieved from a set by Thing ID or URL name."""
+
+    servient = Servient()
+    thing_set = ExposedThingSet()
+
+    exp_things = [
+        ExposedThing(servient=servient, thing=Thing(id=uuid.uuid4().urn))
+        for _ in range(5)
+    ]
+
+    for exp_thing in exp_things:
+        thing_set.add(exp_thing)
+
+    for exp_thing in exp_things:
+        assert thing_set.contains(exp_thing)
+        assert thing_set.find_by_thing_id(exp_thing.thing.id) is exp_thing
+        assert thing_set.find_by_thing_id(exp_thing.thing.url_name) is exp_thing
+
+    assert thing_set.find_by_thing_id(uuid.uuid4().urn) is None
+
+    with pytest.raises(ValueError):
+        thing_set.add(exp_things[0])
+
+    thing_set.remove(exp_things[0].thing.url_name)
+    thing_set.remove(exp_things[1].thing.id)
+
+    assert not thing_set.contains(exp_things[0])
+    assert not thing_set.contains(exp_things[1])
+    assert thing_set.find_by_thing_id(exp_things[0].thing.id) is None
+    assert thing_set.find_by_thing_id(exp_things[1].thing.url_name) is None
+    assert len(list(thing_set.exposed_things)) == len(exp_things) - 2
+
+    with pytest.raises(ValueError):
+        thing_set.remove(exp_things[0].thing.id)
+
+
+def test_find_by_url_name_updated_title():
+    """ExposedThings can be found by URL name after the Thing title is updated."""
+
+    thing_set = ExposedThingSet()
+    exp_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    thing_set.add(exp_thing)
+
+    url_name_prev = exp_thing.thing.url_name
+    exp_thing.title = Faker().pystr()
+
+    assert exp_thing.thing.url_name != url_name_prev
+    assert thing_set.find_by_thing_id(url_name_prev) is None
+    assert thing_set.find_by_thing_id(exp_thing.thing.url_name) is exp_thing
+
+    thing_set.remove(exp_thing.thing.id)
+    exp_thing.title = Faker().pystr()
+
+    assert thing_set.find_by_thing_id(exp_thing.thing.url_name) is None
+    assert not len(thing_set._url_names)
+
+
+def test_find_by_url_name_miss():
+    """Lookups of unknown names do not rebuild the URL name index."""
+
+    thing_set = ExposedThingSet()
+
+    for _ in range(5):
+        thing_set.add(ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn)))
+
+    with patch.object(Thing, "url_name", new_callable=PropertyMock) as url_name_mock:
+        assert thing_set.find_by_thing_id(Faker().pystr()) is None
+        assert not url_name_mock.called
+
+
+def test_find_by_interaction():
+    """ExposedThings may be retrieved from a set by one of their Interactions."""
+
+    servient = Servient()
+    thing_set = ExposedThingSet()
+
+    exp_thing_01 = ExposedThing(servient=servient, thing=Thing(id=uuid.uuid4().urn))
+    exp_thing_02 = ExposedThing(servient=servient, thing=Thing(id=uuid.uuid4().urn))
+
+    thing_set.add(exp_thing_01)
+
+    action_01 = Action(thing=exp_thing_01.thing, name=Faker().pystr())
+    action_02 = Action(thing=exp_thing_02.thing, name=Faker().pystr())
+
+    assert thing_set.find_by_interaction(action_01) is exp_thing_01
+    assert thing_set.find_by_interaction(action_02) is None
+    assert not thing_set.contains(exp_thing_02)
@@ -14,6 +14,7 @@ Implementations of the supported Protocol Binding templates.
     wotpy.protocols.client
     wotpy.protocols.enums
     wotpy.protocols.exceptions
+    wotpy.protocols.forms
     wotpy.protocols.server
     wotpy.protocols.utils
 """
@@ -29,6 +29,12 @@ class BaseProtocolClient(object):
 
         raise NotImplementedError()
 
+    def is_supported_thing_operation(self, td, op):
+        """Returns True if any of the Thing-level Forms for the given
+        operation is supported in this Protocol Binding client."""
+
+        return False
+
     @abstractmethod
     def invoke_action(self, td, name, input_value, timeout=None):
         """Invokes an Action on a remote Thing.
@@ -50,6 +56,19 @@ class BaseProtocolClient(object):
 
         raise NotImplementedError()
 
+    def read_multiple_properties(self, td, names=None, timeout=None):
+        """Reads the values of multiple Properties on a remote Thing in a single request.
+        All Properties are read if names is None.
+        Returns a Future that resolves with a dict of values by Property name."""
+
+        raise NotImplementedError()
+
+    def write_multiple_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing in a single request.
+        Returns a Future."""
+
+        raise NotImplementedError()
+
     @abstractmethod
     def on_event(self, td, name):
         """Subscribes to an event on a remote Thing.
@@ -10,6 +10,7 @@ CoAP Protocol Binding implementation.
     wotpy.protocols.coap.resources
     wotpy.protocols.coap.client
     wotpy.protocols.coap.enums
+    wotpy.protocols.coap.forms
     wotpy.protocols.coap.server
 """
 
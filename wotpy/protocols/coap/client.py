@@ -16,13 +16,12 @@ import tornado.gen
 import tornado.ioloop
 import tornado.locks
 from rx import Observable
-from six.moves.urllib_parse import urlparse
+from six.moves.urllib_parse import urlencode, urlparse
 
 from wotpy.protocols.client import BaseProtocolClient
-from wotpy.protocols.coap.enums import CoAPSchemes
+from wotpy.protocols.coap.forms import CoAPFormPicker
 from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.exceptions import FormNotFoundException, ProtocolClientException, ClientRequestTimeout
-from wotpy.protocols.utils import is_scheme_form
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import PropertyChangeEventInit, PropertyChangeEmittedEvent, EmittedEvent
 
@@ -41,23 +40,7 @@ class CoAPClient(BaseProtocolClient):
     def _pick_coap_href(cls, td, forms, op=None):
         """Picks the most appropriate CoAP form href from the given list of forms."""
 
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
-
-        def find_href(scheme):
-            try:
-                return next(
-                    form.href for form in forms
-                    if is_scheme_form(form, td.base, scheme) and is_op_form(form))
-            except StopIteration:
-                return None
-
-        form_coaps = find_href(CoAPSchemes.COAPS)
-
-        return form_coaps if form_coaps is not None else find_href(CoAPSchemes.COAP)
+        return CoAPFormPicker.pick_href(td, forms, op=op)
 
     @classmethod
     def _assert_success(cls, res):
@@ -146,14 +129,13 @@ class CoAPClient(BaseProtocolClient):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
 
-        forms = td.get_forms(name)
+        return CoAPFormPicker.is_supported_interaction(td, name)
 
-        forms_coap = [
-            form for form in forms
-            if is_scheme_form(form, td.base, CoAPSchemes.list())
-        ]
+    def is_supported_thing_operation(self, td, op):
+        """Returns True if any of the Thing-level Forms for the given
+        operation is supported in this Protocol Binding client."""
 
-        return len(forms_coap) > 0
+        return CoAPFormPicker.is_supported_thing_operation(td, op)
 
     async def _invocation_create(self, coap_client, href, input_value, timeout=None):
         """Creates a new action invocation by sending a POST request."""
@@ -298,6 +280,66 @@ class CoAPClient(BaseProtocolClient):
         finally:
             await coap_client.shutdown()
 
+    async def read_multiple_properties(self, td, names=None, timeout=None):
+        """Reads the values of multiple Properties on a remote Thing in a single request.
+        All Properties are read if names is None."""
+
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None \
+            else InteractionVerbs.READ_MULTIPLE_PROPERTIES
+
+        href = self._pick_coap_href(td, td.get_thing_forms(), op=op)
+
+        if href is None:
+            raise FormNotFoundException()
+
+        if names is not None:
+            href = "{}{}{}".format(
+                href, "&" if "?" in href else "?",
+                urlencode([("name", name) for name in names]))
+
+        coap_client = await aiocoap.Context.create_client_context()
+
+        try:
+            msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href)
+            request = coap_client.request(msg)
+
+            try:
+                response = await asyncio.wait_for(request.response, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise ClientRequestTimeout
+
+            self._assert_success(response)
+
+            return json.loads(response.payload).get("values")
+        finally:
+            await coap_client.shutdown()
+
+    async def write_multiple_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing in a single request."""
+
+        href = self._pick_coap_href(
+            td, td.get_thing_forms(),
+            op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        if href is None:
+            raise FormNotFoundException()
+
+        coap_client = await aiocoap.Context.create_client_context()
+
+        try:
+            payload = json.dumps({"values": values}).encode("utf-8")
+            msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
+            request = coap_client.request(msg)
+
+            try:
+                response = await asyncio.wait_for(request.response, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise ClientRequestTimeout
+
+            self._assert_success(response)
+        finally:
+            await coap_client.shutdown()
+
     def on_property_change(self, td, name):
         """Subscribes to property changes on a remote Thing.
         Returns an Observable"""
@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Form selection rules of the CoAP client.
+"""
+
+from wotpy.protocols.coap.enums import CoAPSchemes
+from wotpy.protocols.forms import BaseFormPicker
+
+
+class CoAPFormPicker(BaseFormPicker):
+    """Picks CoAPS Forms before CoAP Forms."""
+
+    SCHEMES = [CoAPSchemes.COAPS, CoAPSchemes.COAP]
@@ -43,6 +43,16 @@ def get_thing_event(server, request):
         raise aiocoap.error.NotFound("Event not found")
 
 
+def _encode_event_payload(emitted_event):
+    """Encodes the CoAP payload for an event emission.
+    The payload is shared by all the observers of the emission."""
+
+    return '{{"name": {}, "data": {}, "time": {}}}'.format(
+        json.dumps(emitted_event.name),
+        emitted_event.json_data,
+        int(time.time() * 1000)).encode("utf-8")
+
+
 class EventResource(aiocoap.resource.ObservableResource):
     """CoAP resource to observe Event emissions."""
 
@@ -73,13 +83,12 @@ class EventResource(aiocoap.resource.ObservableResource):
             return
 
         def on_next(item):
-            event_item = {
-                "name": item.name,
-                "data": item.data,
-                "time": int(time.time() * 1000)
-            }
+            try:
+                self._last_events[self._event_key(thing_event)] = item.encode_once(_encode_event_payload)
+            except ValueError as ex:
+                self._logr.warning("Error encoding emission of {}: {}".format(thing_event, ex))
+                return
 
-            self._last_events[self._event_key(thing_event)] = event_item
             server_observation.trigger()
 
         def on_error(err):
@@ -98,8 +107,7 @@ class EventResource(aiocoap.resource.ObservableResource):
         """Returns a CoAP response with the last observed event emission."""
 
         thing_event = get_thing_event(self._server, request)
-        last_item = self._last_events.get(self._event_key(thing_event), None)
-        payload = json.dumps(last_item).encode("utf-8") if last_item else b""
+        payload = self._last_events.get(self._event_key(thing_event), b"")
         response = aiocoap.Message(code=aiocoap.Code.CONTENT, payload=payload)
         response.opt.content_format = JSON_CONTENT_FORMAT
 
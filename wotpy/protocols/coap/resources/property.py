@@ -13,7 +13,9 @@ import aiocoap.error
 import aiocoap.resource
 import tornado.gen
 
-from wotpy.protocols.coap.resources.utils import parse_request_opt_query
+from wotpy.protocols.coap.resources.utils import \
+    parse_request_opt_query, \
+    parse_request_opt_query_list
 
 JSON_CONTENT_FORMAT = 50
 
@@ -54,6 +56,23 @@ def get_thing_property(server, request):
         raise aiocoap.error.NotFound("Property not found")
 
 
+def get_exposed_thing(server, request):
+    """Takes a CoAP request and returns the ExposedThing
+    identified by the request arguments."""
+
+    url_name_thing = parse_request_opt_query(request).get("thing")
+
+    if not url_name_thing:
+        raise aiocoap.error.BadRequest("Missing query arguments")
+
+    exposed_thing = server.exposed_thing_set.find_by_thing_id(url_name_thing)
+
+    if not exposed_thing:
+        raise aiocoap.error.NotFound("Thing not found")
+
+    return exposed_thing
+
+
 class PropertyResource(aiocoap.resource.Resource):
     """CoAP resource that implements the Property read, write and observe verbs."""
 
@@ -112,3 +131,58 @@ class PropertyResource(aiocoap.resource.Resource):
         response = aiocoap.Message(code=aiocoap.Code.CHANGED)
 
         raise tornado.gen.Return(response)
+
+
+class PropertiesResource(aiocoap.resource.Resource):
+    """CoAP resource to read or write multiple Properties of a Thing in a single request."""
+
+    def __init__(self, server):
+        super(PropertiesResource, self).__init__()
+        self._server = server
+
+    @tornado.gen.coroutine
+    def render_get(self, request):
+        """Returns a CoAP response with the values of the Properties given
+        in the 'name' query arguments (or of all Properties if there are none)."""
+
+        exposed_thing = get_exposed_thing(self._server, request)
+        names = parse_request_opt_query_list(request, "name")
+
+        try:
+            if len(names):
+                values = yield exposed_thing.read_multiple_properties(names)
+            else:
+                values = yield exposed_thing.read_all_properties()
+        except KeyError as ex:
+            raise aiocoap.error.NotFound(str(ex))
+
+        payload = json.dumps({"values": values}).encode("utf-8")
+        response = aiocoap.Message(code=aiocoap.Code.CONTENT, payload=payload)
+        response.opt.content_format = JSON_CONTENT_FORMAT
+
+        raise tornado.gen.Return(response)
+
+    @tornado.gen.coroutine
+    def render_put(self, request):
+        """Updates the Properties with the values retrieved from the CoAP request payload."""
+
+        exposed_thing = get_exposed_thing(self._server, request)
+
+        try:
+            request_payload = json.loads(request.payload)
+        except (TypeError, json.decoder.JSONDecodeError):
+            raise aiocoap.error.BadRequest("Invalid JSON payload")
+
+        if not isinstance(request_payload, dict) or not isinstance(request_payload.get("values", None), dict):
+            raise aiocoap.error.BadRequest()
+
+        try:
+            yield exposed_thing.write_multiple_properties(request_payload.get("values"))
+        except KeyError as ex:
+            raise aiocoap.error.NotFound(str(ex))
+        except TypeError as ex:
+            raise aiocoap.error.BadRequest(str(ex))
+
+        response = aiocoap.Message(code=aiocoap.Code.CHANGED)
+
+        raise tornado.gen.Return(response)
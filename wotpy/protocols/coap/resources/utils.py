@@ -16,3 +16,10 @@ def parse_request_opt_query(request):
 
     parsed_dict = parse.parse_qs("&".join(request.opt.uri_query))
     return {key: val[0] for key, val in six.iteritems(parsed_dict) if len(val)}
+
+
+def parse_request_opt_query_list(request, key):
+    """Takes a CoAP Request and returns the list with all
+    the values of the given (repeated) URI query parameter."""
+
+    return parse.parse_qs("&".join(request.opt.uri_query)).get(key, [])
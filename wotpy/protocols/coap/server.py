@@ -20,7 +20,7 @@ from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.coap.enums import CoAPSchemes
 from wotpy.protocols.coap.resources.action import ActionResource
 from wotpy.protocols.coap.resources.event import EventResource
-from wotpy.protocols.coap.resources.property import PropertyResource
+from wotpy.protocols.coap.resources.property import PropertyResource, PropertiesResource
 from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.utils.utils import get_main_ipv4_address
@@ -143,6 +143,29 @@ class CoAPServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction, hostname)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns the CoAP Form instances to read
+        or write multiple Properties of the given Thing."""
+
+        href_props = "{}://{}:{}/properties?thing={}".format(
+            self.scheme, hostname.rstrip("/").lstrip("/"), self.port, thing.url_name)
+
+        ops = [
+            InteractionVerbs.READ_ALL_PROPERTIES,
+            InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+            InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+        ]
+
+        return [
+            Form(
+                interaction=thing,
+                protocol=self.protocol,
+                href=href_props,
+                content_type=MediaTypes.JSON,
+                op=op)
+            for op in ops
+        ]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
@@ -167,6 +190,10 @@ class CoAPServer(BaseProtocolServer):
             ("property",),
             PropertyResource(self))
 
+        root.add_resource(
+            ("properties",),
+            PropertiesResource(self))
+
         root.add_resource(
             ("action",),
             ActionResource(self, clear_ms=self._action_clear_ms))
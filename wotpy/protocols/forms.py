@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Base class for the Form selection rules of the Protocol Binding clients.
+"""
+
+from wotpy.protocols.utils import pick_form
+
+
+class BaseFormPicker(object):
+    """Class-level rules that a Protocol Binding client follows to pick the Form of an interaction.
+    Pickers only depend on the enums of their binding, so they can be used to check whether
+    a client supports a Thing without importing the client module."""
+
+    SCHEMES = []
+
+    @classmethod
+    def pick_form(cls, td, forms, op=None):
+        """Picks the most appropriate Form from the given list of forms or returns None."""
+
+        return pick_form(td, forms, cls.SCHEMES, op=op)
+
+    @classmethod
+    def pick_href(cls, td, forms, op=None):
+        """Picks the href of the most appropriate Form from the given list of forms or returns None."""
+
+        form = cls.pick_form(td, forms, op=op)
+
+        return form.href if form is not None else None
+
+    @classmethod
+    def is_supported_interaction(cls, td, name):
+        """Returns True if any of the Forms for the Interaction with the given name can be picked."""
+
+        return cls.pick_form(td, td.get_forms(name)) is not None
+
+    @classmethod
+    def is_supported_thing_operation(cls, td, op):
+        """Returns True if any of the Thing-level Forms for the given operation can be picked."""
+
+        return cls.pick_form(td, td.get_thing_forms(), op=op) is not None
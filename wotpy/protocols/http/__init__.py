@@ -10,5 +10,9 @@ HTTP Protocol Binding implementation.
     wotpy.protocols.http.handlers
     wotpy.protocols.http.client
     wotpy.protocols.http.enums
+    wotpy.protocols.http.forms
+    wotpy.protocols.http.invocations
     wotpy.protocols.http.server
+    wotpy.protocols.http.sse
+    wotpy.protocols.http.subscription
 """
@@ -13,53 +13,86 @@ import tornado.concurrent
 import tornado.gen
 import tornado.httpclient
 import tornado.ioloop
+import tornado.locks
+import tornado.simple_httpclient
 from rx import Observable
 from six.moves.urllib import parse
+from tornado.httpclient import HTTPError
 from tornado.simple_httpclient import HTTPTimeoutError
 
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.exceptions import FormNotFoundException, ClientRequestTimeout
-from wotpy.protocols.http.enums import HTTPSchemes
-from wotpy.protocols.utils import is_scheme_form
+from wotpy.protocols.http.enums import HTTPSubprotocols
+from wotpy.protocols.http.forms import HTTPFormPicker
+from wotpy.protocols.http.sse import SSEParser, SSE_CONTENT_TYPE
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import EmittedEvent, PropertyChangeEmittedEvent, PropertyChangeEventInit
 
 
 class HTTPClient(BaseProtocolClient):
-    """Implementation of the protocol client interface for the HTTP protocol."""
+    """Implementation of the protocol client interface for the HTTP protocol.
+    Observations use Server-Sent Events when the Form offers them, reconnecting
+    with the Last-Event-ID header. Otherwise they long-poll a subscription cursor
+    when a Form advertises the cursor subprotocol (each poll acknowledges the items
+    received in the previous one) or the plain observation Form if it does not.
+    Requests go through an AsyncHTTPClient owned by this instance that runs up to
+    max_clients concurrent requests (and max_clients_per_host to a single host).
+    Long-polls (subscription cursors and Action invocation status) go through a
+    separate AsyncHTTPClient that ignores the per-host limit, so that open
+    observations do not starve the other requests to the same host.
+    The curl backend (which requires pycurl) may be enabled with use_curl; it is the
+    only one that reuses connections, unless keep_alive is disabled."""
 
     JSON_HEADERS = {"Content-Type": "application/json"}
     DEFAULT_CON_TIMEOUT = 60
     DEFAULT_REQ_TIMEOUT = 60
+    DEFAULT_MAX_CLIENTS = 100
+    SSE_STREAM_TIMEOUT = 300
+    SSE_DEFAULT_RETRY_MS = 1000
+    SSE_MAX_FAILED_CONNECTS = 5
+    HTTP_CODE_CONNECTION_ERROR = 599
+    HTTP_CODE_NOT_FOUND = 404
+    HTTP_CODE_METHOD_NOT_ALLOWED = 405
+    SUBSCRIPTION_POLL_SECS = 30
+    ACTION_WAIT_SECS = 5
+    ACTION_POLL_SECS = 30
+    ACTION_BACKOFF_INITIAL_SECS = 0.05
+    ACTION_BACKOFF_MAX_SECS = 2
+
+    def __init__(self, connect_timeout=DEFAULT_CON_TIMEOUT, request_timeout=DEFAULT_REQ_TIMEOUT,
+                 max_clients=DEFAULT_MAX_CLIENTS, max_clients_per_host=None,
+                 keep_alive=True, use_curl=False):
+        if use_curl:
+            from tornado.curl_httpclient import CurlAsyncHTTPClient
+            self._http_client_cls = CurlAsyncHTTPClient
+        else:
+            self._http_client_cls = tornado.simple_httpclient.SimpleAsyncHTTPClient
 
-    def __init__(self, connect_timeout=DEFAULT_CON_TIMEOUT, request_timeout=DEFAULT_REQ_TIMEOUT):
         self._connect_timeout = connect_timeout
         self._request_timeout = request_timeout
+        self._max_clients = max_clients
+        self._max_clients_per_host = max_clients_per_host
+        self._keep_alive = keep_alive
+        self._http_client = None
+        self._long_poll_client = None
+        self._http_client_loop = None
+        self._host_semaphores = {}
         self._logr = logging.getLogger(__name__)
         super(HTTPClient, self).__init__()
 
     @classmethod
-    def pick_http_href(cls, td, forms, op=None):
-        """Picks the most appropriate HTTP form href from the given list of forms."""
+    def pick_http_href(cls, td, forms, op=None, subprotocol=None):
+        """Picks the most appropriate HTTP form href from the given list of forms.
+        Only the forms with the given subprotocol (or without subprotocol if None) are considered."""
 
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
-
-        def find_href(scheme):
-            try:
-                return next(
-                    form.href for form in forms
-                    if is_scheme_form(form, td.base, scheme) and is_op_form(form))
-            except StopIteration:
-                return None
+        return HTTPFormPicker.pick_href(td, forms, op=op, subprotocol=subprotocol)
 
-        form_https = find_href(HTTPSchemes.HTTPS)
+    @classmethod
+    def _build_query_href(cls, href, query):
+        """Appends the given query parameters to the href, which may already contain a query string."""
 
-        return form_https if form_https is not None else find_href(HTTPSchemes.HTTP)
+        return "{}{}{}".format(href, "&" if "?" in href else "?", parse.urlencode(query))
 
     @property
     def protocol(self):
@@ -68,6 +101,12 @@ class HTTPClient(BaseProtocolClient):
 
         return Protocols.HTTP
 
+    @property
+    def max_clients(self):
+        """Maximum number of concurrent requests."""
+
+        return self._max_clients
+
     @property
     def connect_timeout(self):
         """Returns the default connection timeout for all HTTP requests."""
@@ -80,26 +119,88 @@ class HTTPClient(BaseProtocolClient):
 
         return self._request_timeout
 
+    def _build_http_client(self):
+        """Builds a new AsyncHTTPClient instance with the settings of this client."""
+
+        return self._http_client_cls(force_instance=True, max_clients=self._max_clients)
+
+    def _get_http_client(self, long_poll=False):
+        """Returns the AsyncHTTPClient shared by all the requests (or all the long-polls) on the current IOLoop."""
+
+        io_loop = tornado.ioloop.IOLoop.current()
+
+        if self._http_client is None or self._http_client_loop is not io_loop:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._long_poll_client.close()
+
+            self._http_client = self._build_http_client()
+            self._long_poll_client = self._build_http_client()
+            self._http_client_loop = io_loop
+            self._host_semaphores = {}
+
+        return self._long_poll_client if long_poll else self._http_client
+
+    def _get_host_semaphore(self, url):
+        """Returns the Semaphore that limits the concurrent requests to the host of the given URL."""
+
+        if not self._max_clients_per_host:
+            return None
+
+        netloc = parse.urlparse(url).netloc
+
+        if netloc not in self._host_semaphores:
+            self._host_semaphores[netloc] = tornado.locks.Semaphore(self._max_clients_per_host)
+
+        return self._host_semaphores[netloc]
+
+    def _prepare_request(self, http_request):
+        """Updates the headers of a request according to the settings of this client."""
+
+        if not self._keep_alive:
+            http_request.headers["Connection"] = "close"
+
+        return http_request
+
+    @tornado.gen.coroutine
+    def _fetch(self, http_request, long_poll=False, **kwargs):
+        """Fetches the given request with the shared AsyncHTTPClient,
+        waiting for a free slot if the per-host limit has been reached.
+        Long-polls are fetched with their own AsyncHTTPClient and are not subject to the per-host limit."""
+
+        http_client = self._get_http_client(long_poll=long_poll)
+        http_request = self._prepare_request(http_request)
+        semaphore = None if long_poll else self._get_host_semaphore(http_request.url)
+
+        if semaphore is None:
+            response = yield http_client.fetch(http_request, **kwargs)
+            raise tornado.gen.Return(response)
+
+        with (yield semaphore.acquire()):
+            response = yield http_client.fetch(http_request, **kwargs)
+            raise tornado.gen.Return(response)
+
     def is_supported_interaction(self, td, name):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
 
-        forms = td.get_forms(name)
+        return HTTPFormPicker.is_supported_interaction(td, name)
 
-        forms_http = [
-            form for form in forms
-            if is_scheme_form(form, td.base, HTTPSchemes.list())
-        ]
+    def is_supported_thing_operation(self, td, op):
+        """Returns True if any of the Thing-level Forms for the given
+        operation is supported in this Protocol Binding client."""
 
-        return len(forms_http) > 0
+        return HTTPFormPicker.is_supported_thing_operation(td, op)
 
     @tornado.gen.coroutine
     def invoke_action(self, td, name, input_value, timeout=None):
         """Invokes an Action on a remote Thing.
+        The server is asked to wait a few seconds to return the result inline.
+        Otherwise the invocation status is long-polled, backing off exponentially
+        when the server replies before the invocation is done.
         Returns a Future."""
 
         con_timeout = timeout if timeout else self._connect_timeout
-        req_timeout = timeout if timeout else self._request_timeout
 
         now = time.time()
 
@@ -108,61 +209,63 @@ class HTTPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        body = json.dumps({"input": input_value})
-        http_client = tornado.httpclient.AsyncHTTPClient()
+        def get_wait_secs(secs):
+            return secs if not timeout else max(0, min(secs, timeout - (time.time() - now)))
+
+        def get_req_timeout(wait_secs):
+            return timeout if timeout else self._request_timeout + wait_secs
+
+        def get_outcome(status):
+            if status.get("error") is not None:
+                return Exception(status.get("error"))
+            else:
+                return tornado.gen.Return(status.get("result"))
+
+        wait_secs = get_wait_secs(self.ACTION_WAIT_SECS)
+
+        http_request = tornado.httpclient.HTTPRequest(
+            self._build_query_href(href, {"wait": wait_secs}),
+            method="POST",
+            body=json.dumps({"input": input_value}),
+            headers=self.JSON_HEADERS,
+            connect_timeout=con_timeout,
+            request_timeout=get_req_timeout(wait_secs))
 
         try:
-            http_request = tornado.httpclient.HTTPRequest(
-                href, method="POST",
-                body=body,
-                headers=self.JSON_HEADERS,
-                connect_timeout=con_timeout,
-                request_timeout=req_timeout)
+            response = yield self._fetch(http_request)
         except HTTPTimeoutError:
             raise ClientRequestTimeout
 
-        response = yield http_client.fetch(http_request)
-        invocation_url = json.loads(response.body).get("invocation")
+        status = json.loads(response.body)
+        invocation_url = status.get("invocation")
+        invoc_href = parse.urljoin(href, invocation_url)
+        backoff_secs = self.ACTION_BACKOFF_INITIAL_SECS
 
-        @tornado.gen.coroutine
-        def check_invocation():
-            parsed = parse.urlparse(href)
+        while not status.get("done"):
+            if timeout and (time.time() - now) > timeout:
+                raise ClientRequestTimeout
 
-            invoc_href = "{}://{}/{}".format(
-                parsed.scheme,
-                parsed.netloc,
-                invocation_url.lstrip("/"))
+            wait_secs = get_wait_secs(self.ACTION_POLL_SECS)
 
             invoc_http_req = tornado.httpclient.HTTPRequest(
-                invoc_href, method="GET",
+                self._build_query_href(invoc_href, {"timeout": wait_secs}),
+                method="GET",
                 connect_timeout=con_timeout,
-                request_timeout=req_timeout)
+                request_timeout=get_req_timeout(wait_secs))
 
             self._logr.debug("Checking invocation: {}".format(invocation_url))
 
             try:
-                invoc_res = yield http_client.fetch(invoc_http_req)
+                invoc_res = yield self._fetch(invoc_http_req, long_poll=True)
+                status = json.loads(invoc_res.body)
             except HTTPTimeoutError:
-                self._logr.debug("Timeout checking invocation: {}".format(invocation_url))
-                raise tornado.gen.Return((False, None))
-
-            status = json.loads(invoc_res.body)
-
-            if status.get("done") is False:
-                raise tornado.gen.Return((False, None))
-
-            if status.get("error") is not None:
-                raise tornado.gen.Return((True, Exception(status.get("error"))))
-            else:
-                raise tornado.gen.Return((True, tornado.gen.Return(status.get("result"))))
+                self._logr.debug("Timeout checking invocation: {}".format(invocation_url))
 
-        while True:
-            done, result = yield check_invocation()
+            if not status.get("done"):
+                yield tornado.gen.sleep(get_wait_secs(backoff_secs))
+                backoff_secs = min(backoff_secs * 2, self.ACTION_BACKOFF_MAX_SECS)
 
-            if done:
-                raise result
-            elif timeout and (time.time() - now) > timeout:
-                raise ClientRequestTimeout
+        raise get_outcome(status)
 
     @tornado.gen.coroutine
     def write_property(self, td, name, value, timeout=None):
@@ -177,7 +280,6 @@ class HTTPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        http_client = tornado.httpclient.AsyncHTTPClient()
         body = json.dumps({"value": value})
 
         try:
@@ -189,7 +291,7 @@ class HTTPClient(BaseProtocolClient):
         except HTTPTimeoutError:
             raise ClientRequestTimeout
 
-        yield http_client.fetch(http_request)
+        yield self._fetch(http_request)
 
     @tornado.gen.coroutine
     def read_property(self, td, name, timeout=None):
@@ -204,8 +306,6 @@ class HTTPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        http_client = tornado.httpclient.AsyncHTTPClient()
-
         try:
             http_request = tornado.httpclient.HTTPRequest(
                 href, method="GET",
@@ -214,79 +314,240 @@ class HTTPClient(BaseProtocolClient):
         except HTTPTimeoutError:
             raise ClientRequestTimeout
 
-        response = yield http_client.fetch(http_request)
+        response = yield self._fetch(http_request)
         result = json.loads(response.body)
         result = result.get("value", result)
 
         raise tornado.gen.Return(result)
 
-    def on_event(self, td, name):
-        """Subscribes to an event on a remote Thing.
-        Returns an Observable."""
+    @tornado.gen.coroutine
+    def read_multiple_properties(self, td, names=None, timeout=None):
+        """Reads the values of multiple Properties on a remote Thing in a single request.
+        All Properties are read if names is None.
+        Returns a Future that resolves with a dict of values by Property name."""
+
+        con_timeout = timeout if timeout else self._connect_timeout
+        req_timeout = timeout if timeout else self._request_timeout
 
-        href = self.pick_http_href(td, td.get_event_forms(name))
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None \
+            else InteractionVerbs.READ_MULTIPLE_PROPERTIES
+
+        href = self.pick_http_href(td, td.get_thing_forms(), op=op)
 
         if href is None:
             raise FormNotFoundException()
 
-        def subscribe(observer):
-            """Subscription function to observe events using the HTTP protocol."""
+        if names is not None:
+            href = self._build_query_href(href, [("name", name) for name in names])
 
-            state = {"active": True}
+        try:
+            http_request = tornado.httpclient.HTTPRequest(
+                href, method="GET",
+                connect_timeout=con_timeout,
+                request_timeout=req_timeout)
+        except HTTPTimeoutError:
+            raise ClientRequestTimeout
 
-            @handle_observer_finalization(observer)
-            @tornado.gen.coroutine
-            def callback():
-                http_client = tornado.httpclient.AsyncHTTPClient()
-                http_request = tornado.httpclient.HTTPRequest(href, method="GET")
+        response = yield self._fetch(http_request)
 
-                while state["active"]:
-                    try:
-                        response = yield http_client.fetch(http_request)
-                        payload = json.loads(response.body).get("payload")
-                        observer.on_next(EmittedEvent(init=payload, name=name))
-                    except HTTPTimeoutError:
-                        pass
+        raise tornado.gen.Return(json.loads(response.body).get("values"))
 
-            def unsubscribe():
-                state["active"] = False
+    @tornado.gen.coroutine
+    def write_multiple_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing in a single request.
+        Returns a Future."""
 
-            tornado.ioloop.IOLoop.current().add_callback(callback)
+        con_timeout = timeout if timeout else self._connect_timeout
+        req_timeout = timeout if timeout else self._request_timeout
 
-            return unsubscribe
+        href = self.pick_http_href(
+            td, td.get_thing_forms(),
+            op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
 
-        # noinspection PyUnresolvedReferences
-        return Observable.create(subscribe)
+        if href is None:
+            raise FormNotFoundException()
 
-    def on_property_change(self, td, name):
-        """Subscribes to property changes on a remote Thing.
-        Returns an Observable"""
+        body = json.dumps({"values": values})
 
-        href = self.pick_http_href(td, td.get_property_forms(name), op=InteractionVerbs.OBSERVE_PROPERTY)
+        try:
+            http_request = tornado.httpclient.HTTPRequest(
+                href, method="PUT", body=body,
+                headers=self.JSON_HEADERS,
+                connect_timeout=con_timeout,
+                request_timeout=req_timeout)
+        except HTTPTimeoutError:
+            raise ClientRequestTimeout
 
-        if href is None:
-            raise FormNotFoundException()
+        yield self._fetch(http_request)
+
+    @tornado.gen.coroutine
+    def _stream_sse(self, href, state, on_data):
+        """Reads the SSE stream on the given URL and passes the data of each message to on_data
+        while the state is active. Reconnects with the ID of the last received
+        message when the connection is closed, the stream times out or fails."""
+
+        http_client = self._build_http_client()
+        parser = SSEParser()
+        failed_connects = 0
+
+        def on_chunk(chunk):
+            if not state["active"]:
+                raise Exception("Unsubscribed from SSE stream")
+
+            state["received"] = True
+
+            for msg in parser.feed(chunk):
+                on_data(json.loads(msg.data))
+
+        try:
+            while state["active"]:
+                headers = {"Accept": SSE_CONTENT_TYPE}
+
+                if parser.last_event_id is not None:
+                    headers["Last-Event-ID"] = parser.last_event_id
+
+                http_request = tornado.httpclient.HTTPRequest(
+                    href, method="GET",
+                    headers=headers,
+                    streaming_callback=on_chunk,
+                    connect_timeout=self._connect_timeout,
+                    request_timeout=self.SSE_STREAM_TIMEOUT)
+
+                state["received"] = False
+                parser.reset()
+
+                try:
+                    yield http_client.fetch(http_request)
+                except HTTPError as ex:
+                    if state["active"] and ex.code != self.HTTP_CODE_CONNECTION_ERROR:
+                        raise
+                except Exception as ex:
+                    self._logr.debug("SSE stream interrupted: {}".format(ex))
+
+                if not state["active"]:
+                    break
+
+                failed_connects = 0 if state["received"] else failed_connects + 1
+
+                if failed_connects >= self.SSE_MAX_FAILED_CONNECTS:
+                    raise Exception("Unable to connect to SSE stream: {}".format(href))
+
+                retry_ms = parser.retry_ms if parser.retry_ms is not None else self.SSE_DEFAULT_RETRY_MS
+                yield tornado.gen.sleep(retry_ms / 1000.0)
+        finally:
+            http_client.close()
+
+    @tornado.gen.coroutine
+    def _long_poll(self, href, state, on_data):
+        """Long-polls the given URL while the state is active, passing the data of each response to on_data.
+        Items emitted between two consecutive requests are not received."""
+
+        while state["active"]:
+            http_request = tornado.httpclient.HTTPRequest(
+                href, method="GET",
+                connect_timeout=self._connect_timeout,
+                request_timeout=self._request_timeout)
+
+            try:
+                response = yield self._fetch(http_request, long_poll=True)
+            except HTTPTimeoutError:
+                continue
+
+            if state["active"]:
+                on_data(json.loads(response.body))
+
+    @tornado.gen.coroutine
+    def _poll_subscription(self, href, state, on_data):
+        """Creates a subscription cursor on the given URL and polls it while the state is active,
+        passing the data of each received item to on_data. The cursor is created again if it expires.
+        Reverts to a plain long-poll on the same URL if the server rejects the creation of the cursor."""
+
+        cursor_href = None
+        ack = 0
+        dropped = 0
+
+        try:
+            while state["active"]:
+                if cursor_href is None:
+                    http_request = tornado.httpclient.HTTPRequest(
+                        href, method="POST", body="",
+                        connect_timeout=self._connect_timeout,
+                        request_timeout=self._request_timeout)
+
+                    try:
+                        response = yield self._fetch(http_request)
+                    except HTTPError as ex:
+                        if ex.code not in [self.HTTP_CODE_NOT_FOUND, self.HTTP_CODE_METHOD_NOT_ALLOWED]:
+                            raise
+
+                        self._logr.debug("Subscription cursors not supported ({}): {}".format(ex.code, href))
+                        yield self._long_poll(href, state, on_data)
+                        return
+
+                    cursor_url = json.loads(response.body).get("subscription")
+                    cursor_href = parse.urljoin(href, cursor_url)
+                    ack, dropped = 0, 0
+
+                poll_href = self._build_query_href(cursor_href, {
+                    "ack": ack,
+                    "timeout": self.SUBSCRIPTION_POLL_SECS
+                })
+
+                http_request = tornado.httpclient.HTTPRequest(
+                    poll_href, method="GET",
+                    connect_timeout=self._connect_timeout,
+                    request_timeout=self.SUBSCRIPTION_POLL_SECS + self._request_timeout)
+
+                try:
+                    response = yield self._fetch(http_request, long_poll=True)
+                except HTTPTimeoutError:
+                    continue
+                except HTTPError as ex:
+                    if ex.code != self.HTTP_CODE_NOT_FOUND:
+                        raise
+
+                    self._logr.debug("Subscription cursor expired: {}".format(cursor_href))
+                    cursor_href = None
+                    continue
+
+                result = json.loads(response.body)
+
+                if result.get("dropped", 0) > dropped:
+                    self._logr.warning("Dropped {} items on subscription: {}".format(
+                        result.get("dropped") - dropped, cursor_href))
+                    dropped = result.get("dropped")
+
+                for item in result.get("items", []):
+                    if not state["active"]:
+                        break
+
+                    ack = item.get("seq")
+                    on_data(item.get("data"))
+
+                if result.get("error") is not None:
+                    raise Exception(result.get("error"))
+        finally:
+            if cursor_href is not None:
+                self._fetch(
+                    tornado.httpclient.HTTPRequest(cursor_href, method="DELETE"),
+                    raise_error=False)
+
+    def _build_observe_subscribe(self, observe, href, build_item):
+        """Builds the subscribe function for an Observable of the items built from the data
+        passed to the callback of the given observe coroutine (SSE stream, subscription cursor or long-poll)."""
 
         def subscribe(observer):
-            """Subscription function to observe property updates using the HTTP protocol."""
+            """Subscription function to observe an HTTP resource."""
 
             state = {"active": True}
 
+            def on_data(data):
+                observer.on_next(build_item(data))
+
             @handle_observer_finalization(observer)
             @tornado.gen.coroutine
             def callback():
-                http_client = tornado.httpclient.AsyncHTTPClient()
-                http_request = tornado.httpclient.HTTPRequest(href, method="GET")
-
-                while state["active"]:
-                    try:
-                        response = yield http_client.fetch(http_request)
-                        value = json.loads(response.body)
-                        value = value.get("value", value)
-                        init = PropertyChangeEventInit(name=name, value=value)
-                        observer.on_next(PropertyChangeEmittedEvent(init=init))
-                    except HTTPTimeoutError:
-                        pass
+                yield observe(href, state, on_data)
 
             def unsubscribe():
                 state["active"] = False
@@ -295,8 +556,47 @@ class HTTPClient(BaseProtocolClient):
 
             return unsubscribe
 
-        # noinspection PyUnresolvedReferences
-        return Observable.create(subscribe)
+        return subscribe
+
+    def _observe_forms(self, td, forms, build_item, op=None):
+        """Returns an Observable for the items built from the data received on the most
+        appropriate observation Form (SSE stream, subscription cursor or plain long-poll)."""
+
+        observe_subprotocols = [
+            (HTTPSubprotocols.SSE, self._stream_sse),
+            (HTTPSubprotocols.CURSOR, self._poll_subscription),
+            (None, self._long_poll)
+        ]
+
+        for subprotocol, observe in observe_subprotocols:
+            href = self.pick_http_href(td, forms, op=op, subprotocol=subprotocol)
+
+            if href is not None:
+                # noinspection PyUnresolvedReferences
+                return Observable.create(self._build_observe_subscribe(observe, href, build_item))
+
+        raise FormNotFoundException()
+
+    def on_event(self, td, name):
+        """Subscribes to an event on a remote Thing.
+        Returns an Observable."""
+
+        def build_event(data):
+            return EmittedEvent(init=data.get("payload"), name=name)
+
+        return self._observe_forms(td, td.get_event_forms(name), build_event)
+
+    def on_property_change(self, td, name):
+        """Subscribes to property changes on a remote Thing.
+        Returns an Observable"""
+
+        def build_property_change(data):
+            init = PropertyChangeEventInit(name=name, value=data.get("value"))
+            return PropertyChangeEmittedEvent(init=init)
+
+        return self._observe_forms(
+            td, td.get_property_forms(name), build_property_change,
+            op=InteractionVerbs.OBSERVE_PROPERTY)
 
     def on_td_change(self, url):
         """Subscribes to Thing Description changes on a remote Thing.
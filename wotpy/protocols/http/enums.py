@@ -13,3 +13,11 @@ class HTTPSchemes(EnumListMixin):
 
     HTTP = "http"
     HTTPS = "https"
+
+
+class HTTPSubprotocols(EnumListMixin):
+    """Enumeration of HTTP subprotocols used to observe Interactions."""
+
+    LONGPOLL = "longpoll"
+    SSE = "sse"
+    CURSOR = "cursor"
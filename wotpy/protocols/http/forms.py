@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Form selection rules of the HTTP client.
+"""
+
+from wotpy.protocols.forms import BaseFormPicker
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
+from wotpy.protocols.utils import pick_form
+
+
+class HTTPFormPicker(BaseFormPicker):
+    """Picks HTTPS Forms before HTTP Forms.
+    Forms with a subprotocol that requires a dedicated client implementation (e.g. SSE or cursors)
+    are only picked when that subprotocol is requested. Any other Form (without subprotocol
+    or with a plain request-response subprotocol such as longpoll) is picked otherwise."""
+
+    SCHEMES = [HTTPSchemes.HTTPS, HTTPSchemes.HTTP]
+    EXPLICIT_SUBPROTOCOLS = [HTTPSubprotocols.SSE, HTTPSubprotocols.CURSOR]
+
+    @classmethod
+    def is_subprotocol_form(cls, form, subprotocol):
+        """Returns True if the given Form may be used for the requested subprotocol."""
+
+        if subprotocol is not None:
+            return form.subprotocol == subprotocol
+
+        return form.subprotocol not in cls.EXPLICIT_SUBPROTOCOLS
+
+    @classmethod
+    def pick_form(cls, td, forms, op=None, subprotocol=None):
+        """Picks the most appropriate Form for the given subprotocol or returns None."""
+
+        forms = [form for form in forms if cls.is_subprotocol_form(form, subprotocol)]
+
+        return pick_form(td, forms, cls.SCHEMES, op=op)
+
+    @classmethod
+    def pick_href(cls, td, forms, op=None, subprotocol=None):
+        """Picks the href of the most appropriate Form for the given subprotocol or returns None."""
+
+        form = cls.pick_form(td, forms, op=op, subprotocol=subprotocol)
+
+        return form.href if form is not None else None
+
+    @classmethod
+    def is_supported_interaction(cls, td, name):
+        """Returns True if any of the Forms for the Interaction
+        with the given name may be used by the HTTP client."""
+
+        return any(
+            cls.pick_form(td, td.get_forms(name), subprotocol=subprotocol) is not None
+            for subprotocol in [None] + cls.EXPLICIT_SUBPROTOCOLS)
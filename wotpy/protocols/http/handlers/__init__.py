@@ -10,5 +10,7 @@ HTTP request handlers that implement each of the Interaction verbs.
     wotpy.protocols.http.handlers.action
     wotpy.protocols.http.handlers.event
     wotpy.protocols.http.handlers.property
+    wotpy.protocols.http.handlers.sse
+    wotpy.protocols.http.handlers.subscription
     wotpy.protocols.http.handlers.utils
 """
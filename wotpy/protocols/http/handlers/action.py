@@ -5,12 +5,8 @@
 Request handler for Action interactions.
 """
 
-import logging
-import pprint
-import time
-import uuid
+import datetime
 
-import six
 import tornado.gen
 from tornado.web import HTTPError
 from tornado.web import RequestHandler
@@ -18,6 +14,40 @@ from tornado.web import RequestHandler
 import wotpy.protocols.http.handlers.utils as handler_utils
 
 
+def get_wait_argument(req_handler, name, max_secs, default=0):
+    """Returns the number of seconds in the given query argument capped to max_secs."""
+
+    try:
+        wait_secs = float(req_handler.get_argument(name, default))
+    except ValueError as ex:
+        raise HTTPError(400, log_message="Invalid argument: {}".format(ex))
+
+    return max(0, min(wait_secs, max_secs))
+
+
+@tornado.gen.coroutine
+def wait_invocation_status(future_result, wait_secs):
+    """Waits up to wait_secs for the given invocation Future to complete
+    and returns the status dict of the invocation."""
+
+    if not future_result.done() and wait_secs > 0:
+        try:
+            yield tornado.gen.with_timeout(
+                datetime.timedelta(seconds=wait_secs),
+                future_result,
+                quiet_exceptions=(Exception,))
+        except Exception:
+            pass
+
+    if not future_result.done():
+        raise tornado.gen.Return({"done": False})
+
+    if future_result.exception() is not None:
+        raise tornado.gen.Return({"done": True, "error": str(future_result.exception())})
+
+    raise tornado.gen.Return({"done": True, "result": future_result.result()})
+
+
 # noinspection PyAbstractClass,PyAttributeOutsideInit
 class ActionInvokeHandler(handler_utils.WoTHttpBaseHandler):
     """Handler for Action invocation requests."""
@@ -28,14 +58,24 @@ class ActionInvokeHandler(handler_utils.WoTHttpBaseHandler):
 
     @tornado.gen.coroutine
     def post(self, thing_name, name):
-        """Invokes the action and returns the invocation result."""
+        """Invokes the action and returns the URL to check the invocation status.
+        If the 'wait' argument is given and the invocation completes within
+        that many seconds the status is returned inline as well."""
 
         exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
         input_value = handler_utils.get_argument(self, "input")
+        wait_secs = get_wait_argument(self, "wait", self._server.action_poll_secs)
         future_result = exposed_thing.actions[name].invoke(input_value)
-        invocation_id = uuid.uuid4().hex
-        self._server.pending_actions[invocation_id] = future_result
-        self.write({"invocation": "/invocation/{}".format(invocation_id)})
+        invocation_id = self._server.pending_actions.add(future_result)
+        response = {"invocation": "/invocation/{}".format(invocation_id)}
+
+        if wait_secs > 0:
+            status = yield wait_invocation_status(future_result, wait_secs)
+
+            if status.get("done"):
+                response.update(status)
+
+        self.write(response)
 
 
 # noinspection PyAbstractClass,PyAttributeOutsideInit
@@ -45,43 +85,21 @@ class PendingInvocationHandler(handler_utils.WoTHttpBaseHandler):
     # noinspection PyMethodOverriding
     def initialize(self, http_server):
         self._server = http_server
-        self._logr = logging.getLogger(__name__)
-
-    def _clean_expired(self):
-        """Removes the Action invocations that are expired and
-        have already been checked by at least one client."""
-
-        now = time.time()
-
-        expired_invocations = [
-            inv_id for inv_id, tstamp in six.iteritems(self._server.invocation_check_times)
-            if (now - tstamp) > self._server.action_ttl
-        ]
-
-        if len(expired_invocations):
-            self._logr.debug("Expired invocations: {}".format(pprint.pformat(expired_invocations)))
-
-        for invocation_id in expired_invocations:
-            self._server.invocation_check_times.pop(invocation_id)
-            fut_result = self._server.pending_actions.get(invocation_id, None)
-
-            if fut_result and fut_result.done():
-                self._logr.debug("Removing completed invocation Future: {}".format(invocation_id))
-                self._server.pending_actions.pop(invocation_id, None)
 
     @tornado.gen.coroutine
     def get(self, invocation_id):
-        """Checks and returns the status of the Future that represents an action invocation."""
+        """Waits for the invocation to complete (up to the seconds in the 'timeout' argument)
+        and returns its status. Responds with 410 Gone if the invocation expired or was evicted
+        and 404 if it is unknown."""
 
-        if invocation_id not in self._server.pending_actions:
-            raise HTTPError(log_message="Unknown invocation: {}".format(invocation_id))
+        future_result = self._server.pending_actions.get(invocation_id)
 
-        try:
-            result = yield self._server.pending_actions[invocation_id]
-            self.write({"done": True, "result": result})
-        except Exception as ex:
-            self.write({"done": True, "error": str(ex)})
-        finally:
-            self._logr.debug("Updating invocation check time: {}".format(invocation_id))
-            self._server.invocation_check_times[invocation_id] = time.time()
-            self._clean_expired()
+        if future_result is None and self._server.pending_actions.is_removed(invocation_id):
+            raise HTTPError(410, log_message="Expired invocation: {}".format(invocation_id))
+        elif future_result is None:
+            raise HTTPError(404, log_message="Unknown invocation: {}".format(invocation_id))
+
+        max_secs = self._server.action_poll_secs
+        wait_secs = get_wait_argument(self, "timeout", max_secs, default=max_secs)
+        status = yield wait_invocation_status(future_result, wait_secs)
+        self.write(status)
@@ -12,6 +12,8 @@ from tornado.concurrent import Future
 from tornado.web import RequestHandler
 
 import wotpy.protocols.http.handlers.utils as handler_utils
+from wotpy.protocols.http.handlers.sse import SSEHandler
+from wotpy.protocols.http.sse import encode_event_data
 
 
 # noinspection PyAbstractClass,PyAttributeOutsideInit
@@ -44,6 +46,13 @@ class EventObserverHandler(handler_utils.WoTHttpBaseHandler):
         event_payload = yield future_next
         self.write({"payload": event_payload})
 
+    def post(self, thing_name, name):
+        """Creates a subscription cursor that buffers the Event emissions between polls."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        cursor = self._server.create_subscription_cursor(exposed_thing.events[name], encode_event_data)
+        self.write({"subscription": "/subscription/{}".format(cursor.id)})
+
     def on_finish(self):
         """Destroys the subscription to the observable when the request finishes."""
 
@@ -51,3 +60,14 @@ class EventObserverHandler(handler_utils.WoTHttpBaseHandler):
             self.subscription.dispose()
         except AttributeError:
             pass
+
+
+# noinspection PyAbstractClass
+class EventStreamHandler(SSEHandler):
+    """Handler that streams Event emissions as Server-Sent Events."""
+
+    stream_kind = "event"
+    encoder = staticmethod(encode_event_data)
+
+    def get_interaction(self, exposed_thing, name):
+        return exposed_thing.events[name]
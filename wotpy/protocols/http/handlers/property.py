@@ -9,9 +9,11 @@ import logging
 
 import tornado.gen
 from tornado.concurrent import Future
-from tornado.web import RequestHandler
+from tornado.web import HTTPError, RequestHandler
 
 import wotpy.protocols.http.handlers.utils as handler_utils
+from wotpy.protocols.http.handlers.sse import SSEHandler
+from wotpy.protocols.http.sse import encode_property_data
 
 
 # noinspection PyAbstractClass
@@ -39,6 +41,42 @@ class PropertyReadWriteHandler(handler_utils.WoTHttpBaseHandler):
         yield exposed_thing.properties[name].write(value)
 
 
+# noinspection PyAbstractClass
+class PropertiesReadWriteHandler(handler_utils.WoTHttpBaseHandler):
+    """Handler to read or write multiple Properties in a single request."""
+
+    # noinspection PyMethodOverriding,PyAttributeOutsideInit
+    def initialize(self, http_server):
+        self._server = http_server
+
+    @tornado.gen.coroutine
+    def get(self, thing_name):
+        """Reads and returns the values of the Properties given in the 'name'
+        arguments (which may be repeated) or of all Properties if there are none."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        names = self.get_arguments("name")
+
+        if len(names):
+            values = yield exposed_thing.read_multiple_properties(names)
+        else:
+            values = yield exposed_thing.read_all_properties()
+
+        self.write({"values": values})
+
+    @tornado.gen.coroutine
+    def put(self, thing_name):
+        """Updates the values of all the Properties in the 'values' object."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        values = handler_utils.get_argument(self, "values", None)
+
+        if not isinstance(values, dict):
+            raise HTTPError(400, log_message="Invalid values: {}".format(values))
+
+        yield exposed_thing.write_multiple_properties(values)
+
+
 # noinspection PyAbstractClass,PyAttributeOutsideInit
 class PropertyObserverHandler(handler_utils.WoTHttpBaseHandler):
     """Handler for Property subscription requests."""
@@ -69,6 +107,13 @@ class PropertyObserverHandler(handler_utils.WoTHttpBaseHandler):
         updated_value = yield future_next
         self.write({"value": updated_value})
 
+    def post(self, thing_name, name):
+        """Creates a subscription cursor that buffers the Property updates between polls."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        cursor = self._server.create_subscription_cursor(exposed_thing.properties[name], encode_property_data)
+        self.write({"subscription": "/subscription/{}".format(cursor.id)})
+
     def on_finish(self):
         """Destroys the subscription to the observable when the request finishes."""
 
@@ -76,3 +121,14 @@ class PropertyObserverHandler(handler_utils.WoTHttpBaseHandler):
             self.subscription.dispose()
         except AttributeError:
             pass
+
+
+# noinspection PyAbstractClass
+class PropertyStreamHandler(SSEHandler):
+    """Handler that streams Property updates as Server-Sent Events."""
+
+    stream_kind = "property"
+    encoder = staticmethod(encode_property_data)
+
+    def get_interaction(self, exposed_thing, name):
+        return exposed_thing.properties[name]
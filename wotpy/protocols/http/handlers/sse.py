@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Base request handler for Server-Sent Events streams.
+"""
+
+import logging
+
+import tornado.gen
+import tornado.ioloop
+from tornado.concurrent import Future
+
+import wotpy.protocols.http.handlers.utils as handler_utils
+from wotpy.protocols.http.sse import SSE_CONTENT_TYPE
+
+
+# noinspection PyAbstractClass,PyAttributeOutsideInit
+class SSEHandler(handler_utils.WoTHttpBaseHandler):
+    """Base handler that streams the emissions of an Interaction as Server-Sent Events.
+    Subclasses define the stream kind, how to find the Interaction and how to encode emissions.
+    Connections that fall too far behind are closed and expected to resume with Last-Event-ID."""
+
+    RETRY_MS = 1000
+    MAX_PENDING_FLUSHES = 1000
+
+    stream_kind = None
+    encoder = None
+
+    # noinspection PyMethodOverriding
+    def initialize(self, http_server):
+        self._server = http_server
+        self._stream = None
+        self._future_closed = Future()
+        self._pending_flushes = 0
+        self._periodic_ping = None
+        self._logr = logging.getLogger(__name__)
+
+    def get_interaction(self, exposed_thing, name):
+        """Returns the Interaction that is streamed by this handler."""
+
+        raise NotImplementedError()
+
+    @tornado.gen.coroutine
+    def get(self, thing_name, name):
+        """Streams the emissions of the Interaction until the client disconnects.
+        Emissions missed since the ID in the Last-Event-ID header are replayed first."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        interaction = self.get_interaction(exposed_thing, name)
+
+        self.set_header("Content-Type", SSE_CONTENT_TYPE)
+        self.set_header("Cache-Control", "no-cache")
+        self.send_frame("retry: {}\n\n".format(self.RETRY_MS))
+
+        self._stream = self._server.get_sse_stream(
+            (thing_name, self.stream_kind, name), interaction, self.encoder)
+
+        self._stream.attach(self, last_event_id=self.request.headers.get("Last-Event-ID"))
+
+        self._periodic_ping = tornado.ioloop.PeriodicCallback(
+            lambda: self.send_frame(": ping\n\n"),
+            self._server.sse_ping_secs * 1000)
+
+        self._periodic_ping.start()
+
+        yield self._future_closed
+
+    def send_frame(self, frame):
+        """Writes a raw frame to the client."""
+
+        if self._future_closed.done():
+            return
+
+        if self._pending_flushes >= self.MAX_PENDING_FLUSHES:
+            self._logr.warning("Closing slow SSE connection: {}".format(self.request.remote_ip))
+            self.close_stream()
+            return
+
+        self.write(frame)
+        self._pending_flushes += 1
+        tornado.ioloop.IOLoop.current().add_future(self.flush(), self._on_flushed)
+
+    def _on_flushed(self, future):
+        """Called when a frame has been written to the socket."""
+
+        self._pending_flushes -= 1
+
+        if future.exception() is not None:
+            self.close_stream()
+
+    def close_stream(self):
+        """Ends the response, the client is expected to reconnect."""
+
+        if not self._future_closed.done():
+            self._future_closed.set_result(None)
+
+    def on_connection_close(self):
+        """Called when the client closes the connection."""
+
+        self.close_stream()
+
+    def on_finish(self):
+        """Detaches the connection from the stream when the request finishes."""
+
+        self.close_stream()
+
+        if self._periodic_ping is not None:
+            self._periodic_ping.stop()
+
+        if self._stream is not None:
+            self._stream.detach(self)
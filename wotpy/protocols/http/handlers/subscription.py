@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Request handler for the subscription cursors used in the HTTP long-polling pattern.
+"""
+
+import tornado.gen
+from tornado.web import HTTPError
+
+import wotpy.protocols.http.handlers.utils as handler_utils
+
+
+# noinspection PyAbstractClass,PyAttributeOutsideInit
+class SubscriptionCursorHandler(handler_utils.WoTHttpBaseHandler):
+    """Handler to poll and delete subscription cursors."""
+
+    # noinspection PyMethodOverriding
+    def initialize(self, http_server):
+        self._server = http_server
+
+    def _get_cursor(self, subscription_id):
+        """Returns the cursor with the given ID or raises a 404 HTTPError."""
+
+        cursor = self._server.subscription_cursors.get(subscription_id, None)
+
+        if cursor is None:
+            raise HTTPError(404, log_message="Unknown subscription: {}".format(subscription_id))
+
+        return cursor
+
+    @tornado.gen.coroutine
+    def get(self, subscription_id):
+        """Acknowledges the items up to the sequence number in the 'ack' argument
+        and returns all the buffered items that follow, waiting for the next
+        emission (up to the 'timeout' argument) if there are none."""
+
+        cursor = self._get_cursor(subscription_id)
+
+        try:
+            ack = int(self.get_argument("ack", 0))
+            timeout = float(self.get_argument("timeout", self._server.subscription_poll_secs))
+        except ValueError as ex:
+            raise HTTPError(400, log_message="Invalid argument: {}".format(ex))
+
+        timeout = max(0, min(timeout, self._server.subscription_poll_secs))
+        items = yield cursor.poll(ack=ack, timeout=timeout)
+
+        self.set_header("Content-Type", "application/json; charset=UTF-8")
+        self.write(cursor.to_json(items))
+
+    def delete(self, subscription_id):
+        """Destroys the cursor."""
+
+        self._get_cursor(subscription_id).dispose()
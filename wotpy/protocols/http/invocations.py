@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Bounded store for the pending Action invocations of the HTTP server.
+"""
+
+import collections
+import heapq
+import logging
+import uuid
+
+import tornado.ioloop
+
+
+class InvocationStore(object):
+    """Store of Action invocation Futures indexed by invocation ID.
+    Invocations expire ttl_secs after they complete, driven by an expiry heap and a
+    single IOLoop timeout, so no scan of the store is ever needed. When max_size is
+    reached the invocation that would expire first is evicted (or the oldest pending
+    one if none has completed yet). The IDs of the last removed invocations are kept
+    so that they can be told apart from IDs that never existed."""
+
+    def __init__(self, max_size, ttl_secs):
+        self._max_size = max_size
+        self._ttl_secs = ttl_secs
+        self._entries = collections.OrderedDict()
+        self._removed = collections.OrderedDict()
+        self._expiry_heap = []
+        self._expiry_handle = None
+        self._logr = logging.getLogger(__name__)
+
+    @property
+    def ttl(self):
+        """Time-To-Live (seconds) of the completed invocations."""
+
+        return self._ttl_secs
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, invocation_id):
+        return invocation_id in self._entries
+
+    def get(self, invocation_id):
+        """Returns the Future of the given invocation or None if it does not exist."""
+
+        return self._entries.get(invocation_id, None)
+
+    def is_removed(self, invocation_id):
+        """Returns True if the given invocation existed but expired or was evicted."""
+
+        return invocation_id in self._removed
+
+    def add(self, future):
+        """Adds the Future of a new invocation and returns its ID."""
+
+        while len(self._entries) >= self._max_size:
+            self._evict()
+
+        invocation_id = uuid.uuid4().hex
+        self._entries[invocation_id] = future
+
+        tornado.ioloop.IOLoop.current().add_future(
+            future, lambda _: self._on_done(invocation_id))
+
+        return invocation_id
+
+    def _on_done(self, invocation_id):
+        """Starts counting the TTL of an invocation once it has completed."""
+
+        if invocation_id not in self._entries:
+            return
+
+        deadline = tornado.ioloop.IOLoop.current().time() + self._ttl_secs
+        heapq.heappush(self._expiry_heap, (deadline, invocation_id))
+        self._schedule_expiry()
+
+    def _schedule_expiry(self):
+        """Schedules a timeout for the earliest deadline in the expiry heap.
+        Deadlines are pushed in increasing order, so an existing timeout is never late."""
+
+        if self._expiry_handle is not None or not len(self._expiry_heap):
+            return
+
+        self._expiry_handle = tornado.ioloop.IOLoop.current().call_at(
+            self._expiry_heap[0][0], self._expire)
+
+    def _expire(self):
+        """Removes all the invocations whose deadline has passed."""
+
+        self._expiry_handle = None
+        now = tornado.ioloop.IOLoop.current().time()
+
+        while len(self._expiry_heap) and self._expiry_heap[0][0] <= now:
+            _, invocation_id = heapq.heappop(self._expiry_heap)
+            self._remove(invocation_id)
+
+        self._schedule_expiry()
+
+    def _evict(self):
+        """Removes the completed invocation that would expire first,
+        or the oldest pending invocation if none has completed yet."""
+
+        while len(self._expiry_heap):
+            _, invocation_id = heapq.heappop(self._expiry_heap)
+
+            if invocation_id in self._entries:
+                self._remove(invocation_id)
+                return
+
+        invocation_id = next(iter(self._entries))
+        self._logr.warning("Evicting pending invocation: {}".format(invocation_id))
+        self._remove(invocation_id)
+
+    def _remove(self, invocation_id):
+        """Removes an invocation and remembers its ID."""
+
+        if self._entries.pop(invocation_id, None) is None:
+            return
+
+        self._removed[invocation_id] = True
+
+        while len(self._removed) > self._max_size:
+            self._removed.popitem(last=False)
+
+    def clear(self):
+        """Removes all the invocations and cancels the expiry timeout."""
+
+        if self._expiry_handle is not None:
+            tornado.ioloop.IOLoop.current().remove_timeout(self._expiry_handle)
+            self._expiry_handle = None
+
+        self._entries.clear()
+        self._removed.clear()
+        self._expiry_heap = []
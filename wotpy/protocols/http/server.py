@@ -11,28 +11,73 @@ import tornado.web
 
 from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.enums import Protocols, InteractionVerbs
-from wotpy.protocols.http.enums import HTTPSchemes
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
 from wotpy.protocols.http.handlers.action import ActionInvokeHandler, PendingInvocationHandler
-from wotpy.protocols.http.handlers.event import EventObserverHandler
-from wotpy.protocols.http.handlers.property import PropertyObserverHandler, PropertyReadWriteHandler
+from wotpy.protocols.http.handlers.event import EventObserverHandler, EventStreamHandler
+from wotpy.protocols.http.handlers.property import \
+    PropertiesReadWriteHandler, \
+    PropertyObserverHandler, \
+    PropertyReadWriteHandler, \
+    PropertyStreamHandler
+from wotpy.protocols.http.handlers.subscription import SubscriptionCursorHandler
+from wotpy.protocols.http.invocations import InvocationStore
+from wotpy.protocols.http.sse import SSEStream, SSE_CONTENT_TYPE
+from wotpy.protocols.http.subscription import SubscriptionCursor
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.form import Form
 
 
 class HTTPServer(BaseProtocolServer):
-    """HTTP binding server implementation."""
+    """HTTP binding server implementation.
+    Property updates and Event emissions can be observed with long-polling
+    or streamed as Server-Sent Events. The last sse_buffer_size emissions
+    of each stream are kept to be replayed to clients that reconnect.
+    Long-polling clients may create subscription cursors (advertised in the Forms
+    with the cursor subprotocol) that buffer up to subscription_buffer_size
+    unacknowledged emissions between polls and expire after subscription_idle_secs
+    without being polled.
+    Up to action_max_invocations Action invocations are kept to be checked
+    by clients, each one for action_ttl_secs after it completes. Invocation
+    requests and status checks wait at most action_poll_secs for the result."""
 
     DEFAULT_PORT = 80
-
-    def __init__(self, port=DEFAULT_PORT, ssl_context=None, action_ttl_secs=300):
+    DEFAULT_ACTION_TTL_SECS = 300
+    DEFAULT_ACTION_MAX_INVOCATIONS = 10000
+    DEFAULT_ACTION_POLL_SECS = 30
+    DEFAULT_SSE_BUFFER_SIZE = 100
+    DEFAULT_SSE_LINGER_SECS = 30
+    DEFAULT_SSE_PING_SECS = 15
+    DEFAULT_SUBSCRIPTION_BUFFER_SIZE = 100
+    DEFAULT_SUBSCRIPTION_IDLE_SECS = 60
+    DEFAULT_SUBSCRIPTION_POLL_SECS = 30
+
+    def __init__(self, port=DEFAULT_PORT, ssl_context=None,
+                 action_ttl_secs=DEFAULT_ACTION_TTL_SECS,
+                 action_max_invocations=DEFAULT_ACTION_MAX_INVOCATIONS,
+                 action_poll_secs=DEFAULT_ACTION_POLL_SECS,
+                 sse_buffer_size=DEFAULT_SSE_BUFFER_SIZE,
+                 sse_linger_secs=DEFAULT_SSE_LINGER_SECS,
+                 sse_ping_secs=DEFAULT_SSE_PING_SECS,
+                 subscription_buffer_size=DEFAULT_SUBSCRIPTION_BUFFER_SIZE,
+                 subscription_idle_secs=DEFAULT_SUBSCRIPTION_IDLE_SECS,
+                 subscription_poll_secs=DEFAULT_SUBSCRIPTION_POLL_SECS):
         super(HTTPServer, self).__init__(port=port)
         self._server = None
         self._app = self._build_app()
         self._ssl_context = ssl_context
-        self._action_ttl_secs = action_ttl_secs
-        self._pending_actions = {}
-        self._invocation_check_times = {}
+        self._pending_actions = InvocationStore(
+            max_size=action_max_invocations,
+            ttl_secs=action_ttl_secs)
+        self._action_poll_secs = action_poll_secs
+        self._sse_buffer_size = sse_buffer_size
+        self._sse_linger_secs = sse_linger_secs
+        self._sse_ping_secs = sse_ping_secs
+        self._sse_streams = {}
+        self._subscription_buffer_size = subscription_buffer_size
+        self._subscription_idle_secs = subscription_idle_secs
+        self._subscription_poll_secs = subscription_poll_secs
+        self._subscription_cursors = {}
 
     @property
     def protocol(self):
@@ -63,24 +108,87 @@ class HTTPServer(BaseProtocolServer):
     def action_ttl(self):
         """Returns the Action invocations Time-To-Live (seconds)."""
 
-        return self._action_ttl_secs
+        return self._pending_actions.ttl
+
+    @property
+    def action_poll_secs(self):
+        """Maximum time (seconds) that Action requests wait for an invocation to complete."""
+
+        return self._action_poll_secs
 
     @property
     def pending_actions(self):
-        """Dict of pending action invocations represented as Futures."""
+        """Store of the Action invocations represented as Futures."""
 
         return self._pending_actions
 
     @property
-    def invocation_check_times(self):
-        """Dict that contains the timestamp of the last time an invocation was checked by a client.."""
+    def sse_ping_secs(self):
+        """Interval (seconds) between the keep-alive comments sent on SSE connections."""
+
+        return self._sse_ping_secs
+
+    @property
+    def subscription_poll_secs(self):
+        """Maximum time (seconds) that a poll on a subscription cursor waits for new items."""
+
+        return self._subscription_poll_secs
+
+    @property
+    def subscription_cursors(self):
+        """Dict of the active subscription cursors indexed by ID."""
+
+        return self._subscription_cursors
+
+    def create_subscription_cursor(self, interaction, encoder):
+        """Creates and returns a new subscription cursor for the given Interaction."""
+
+        def on_dispose(cursor):
+            self._subscription_cursors.pop(cursor.id, None)
+
+        cursor = SubscriptionCursor(
+            interaction=interaction,
+            encoder=encoder,
+            buffer_size=self._subscription_buffer_size,
+            idle_secs=self._subscription_idle_secs,
+            on_dispose=on_dispose)
+
+        self._subscription_cursors[cursor.id] = cursor
+        cursor.start()
 
-        return self._invocation_check_times
+        return cursor
+
+    def get_sse_stream(self, key, interaction, encoder):
+        """Returns the SSE stream for the given key,
+        subscribing to the Interaction if the stream does not exist yet."""
+
+        if key in self._sse_streams:
+            return self._sse_streams[key]
+
+        def on_dispose(stream):
+            if self._sse_streams.get(key, None) is stream:
+                self._sse_streams.pop(key)
+
+        stream = SSEStream(
+            interaction=interaction,
+            encoder=encoder,
+            buffer_size=self._sse_buffer_size,
+            linger_secs=self._sse_linger_secs,
+            on_dispose=on_dispose)
+
+        self._sse_streams[key] = stream
+        stream.start()
+
+        return stream
 
     def _build_app(self):
         """Builds and returns the Tornado application for the WebSockets server."""
 
         return tornado.web.Application([(
+            r"/(?P<thing_name>[^\/]+)/properties",
+            PropertiesReadWriteHandler,
+            {"http_server": self}
+        ), (
             r"/(?P<thing_name>[^\/]+)/property/(?P<name>[^\/]+)",
             PropertyReadWriteHandler,
             {"http_server": self}
@@ -88,6 +196,10 @@ class HTTPServer(BaseProtocolServer):
             r"/(?P<thing_name>[^\/]+)/property/(?P<name>[^\/]+)/subscription",
             PropertyObserverHandler,
             {"http_server": self}
+        ), (
+            r"/(?P<thing_name>[^\/]+)/property/(?P<name>[^\/]+)/stream",
+            PropertyStreamHandler,
+            {"http_server": self}
         ), (
             r"/(?P<thing_name>[^\/]+)/action/(?P<name>[^\/]+)",
             ActionInvokeHandler,
@@ -96,10 +208,18 @@ class HTTPServer(BaseProtocolServer):
             r"/invocation/(?P<invocation_id>[^\/]+)",
             PendingInvocationHandler,
             {"http_server": self}
+        ), (
+            r"/subscription/(?P<subscription_id>[^\/]+)",
+            SubscriptionCursorHandler,
+            {"http_server": self}
         ), (
             r"/(?P<thing_name>[^\/]+)/event/(?P<name>[^\/]+)/subscription",
             EventObserverHandler,
             {"http_server": self}
+        ), (
+            r"/(?P<thing_name>[^\/]+)/event/(?P<name>[^\/]+)/stream",
+            EventStreamHandler,
+            {"http_server": self}
         )])
 
     def _build_forms_property(self, proprty, hostname):
@@ -125,7 +245,23 @@ class HTTPServer(BaseProtocolServer):
             content_type=MediaTypes.JSON,
             op=[InteractionVerbs.OBSERVE_PROPERTY])
 
-        return [form_read_write, form_observe]
+        form_cursor = Form(
+            interaction=proprty,
+            protocol=self.protocol,
+            href=href_observe,
+            content_type=MediaTypes.JSON,
+            subprotocol=HTTPSubprotocols.CURSOR,
+            op=[InteractionVerbs.OBSERVE_PROPERTY])
+
+        form_stream = Form(
+            interaction=proprty,
+            protocol=self.protocol,
+            href="{}/stream".format(href_read_write),
+            content_type=SSE_CONTENT_TYPE,
+            subprotocol=HTTPSubprotocols.SSE,
+            op=[InteractionVerbs.OBSERVE_PROPERTY])
+
+        return [form_read_write, form_observe, form_cursor, form_stream]
 
     def _build_forms_action(self, action, hostname):
         """Builds and returns the HTTP Form instances for the given Action interaction."""
@@ -146,10 +282,12 @@ class HTTPServer(BaseProtocolServer):
     def _build_forms_event(self, event, hostname):
         """Builds and returns the HTTP Form instances for the given Event interaction."""
 
-        href_observe = "{}://{}:{}/{}/event/{}/subscription".format(
+        href_event = "{}://{}:{}/{}/event/{}".format(
             self.scheme, hostname.rstrip("/").lstrip("/"), self.port,
             event.thing.url_name, event.url_name)
 
+        href_observe = "{}/subscription".format(href_event)
+
         form_observe = Form(
             interaction=event,
             protocol=self.protocol,
@@ -157,7 +295,23 @@ class HTTPServer(BaseProtocolServer):
             content_type=MediaTypes.JSON,
             op=[InteractionVerbs.SUBSCRIBE_EVENT])
 
-        return [form_observe]
+        form_cursor = Form(
+            interaction=event,
+            protocol=self.protocol,
+            href=href_observe,
+            content_type=MediaTypes.JSON,
+            subprotocol=HTTPSubprotocols.CURSOR,
+            op=[InteractionVerbs.SUBSCRIBE_EVENT])
+
+        form_stream = Form(
+            interaction=event,
+            protocol=self.protocol,
+            href="{}/stream".format(href_event),
+            content_type=SSE_CONTENT_TYPE,
+            subprotocol=HTTPSubprotocols.SSE,
+            op=[InteractionVerbs.SUBSCRIBE_EVENT])
+
+        return [form_observe, form_cursor, form_stream]
 
     def build_forms(self, hostname, interaction):
         """Builds and returns a list with all Form that are
@@ -174,6 +328,26 @@ class HTTPServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction, hostname)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with the Forms to read or write
+        multiple Properties of the given Thing in a single request."""
+
+        href_properties = "{}://{}:{}/{}/properties".format(
+            self.scheme, hostname.rstrip("/").lstrip("/"), self.port, thing.url_name)
+
+        form_properties = Form(
+            interaction=thing,
+            protocol=self.protocol,
+            href=href_properties,
+            content_type=MediaTypes.JSON,
+            op=[
+                InteractionVerbs.READ_ALL_PROPERTIES,
+                InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+            ])
+
+        return [form_properties]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
@@ -198,5 +372,13 @@ class HTTPServer(BaseProtocolServer):
         if not self._server:
             return
 
+        for stream in list(self._sse_streams.values()):
+            stream.dispose()
+
+        for cursor in list(self._subscription_cursors.values()):
+            cursor.dispose()
+
+        self._pending_actions.clear()
+
         self._server.stop()
         self._server = None
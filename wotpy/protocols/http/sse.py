@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Classes to stream and parse Server-Sent Events (text/event-stream).
+"""
+
+import collections
+import json
+import logging
+import uuid
+
+import tornado.ioloop
+
+from wotpy.utils.utils import to_json_obj
+
+SSE_CONTENT_TYPE = "text/event-stream"
+
+
+def encode_event_data(emitted_event):
+    """Encodes the SSE data field for an Event emission."""
+
+    return '{{"payload": {}}}'.format(emitted_event.json_data)
+
+
+def encode_property_data(emitted_event):
+    """Encodes the SSE data field for a Property change emission."""
+
+    return json.dumps({"value": to_json_obj(emitted_event.data.value)})
+
+
+class SSEStream(object):
+    """Fan-out of the emissions of one Interaction to the SSE connections that observe it.
+    The latest emissions are kept in a bounded buffer to be replayed to clients that
+    reconnect with a Last-Event-ID header. Event IDs are prefixed with a random epoch,
+    so IDs issued by a previous stream are never mistaken for IDs of this one.
+    The stream stays subscribed for linger_secs after the last connection leaves."""
+
+    def __init__(self, interaction, encoder, buffer_size, linger_secs, on_dispose):
+        self._interaction = interaction
+        self._encoder = encoder
+        self._buffer = collections.deque(maxlen=buffer_size)
+        self._linger_secs = linger_secs
+        self._on_dispose = on_dispose
+        self._epoch = uuid.uuid4().hex[:8]
+        self._seq = 0
+        self._listeners = set()
+        self._linger_handle = None
+        self._subscription = None
+        self._disposed = False
+        self._logr = logging.getLogger(__name__)
+
+    @property
+    def listeners(self):
+        """Set of SSE connections attached to this stream."""
+
+        return self._listeners
+
+    def start(self):
+        """Subscribes to the Interaction."""
+
+        self._subscription = self._interaction.subscribe(
+            on_next=self._on_next,
+            on_error=self._on_error,
+            on_completed=self.dispose)
+
+        self._schedule_linger()
+
+    def _on_next(self, item):
+        """Encodes an emission and sends it to all the connections."""
+
+        try:
+            data = item.encode_once(self._encoder)
+        except ValueError as ex:
+            self._logr.warning("Error encoding emission of {}: {}".format(self._interaction, ex))
+            return
+
+        self._seq += 1
+        frame = "id: {}-{}\ndata: {}\n\n".format(self._epoch, self._seq, data)
+        self._buffer.append((self._seq, frame))
+
+        for listener in list(self._listeners):
+            listener.send_frame(frame)
+
+    def _on_error(self, err):
+        """Logs the error and closes the stream."""
+
+        self._logr.warning("Error on subscription to {}: {}".format(self._interaction, err))
+        self.dispose()
+
+    def frames_since(self, last_event_id):
+        """Returns the buffered frames that were emitted after the given event ID."""
+
+        try:
+            epoch, seq = last_event_id.rsplit("-", 1)
+            seq = int(seq)
+        except (AttributeError, ValueError):
+            return []
+
+        if epoch != self._epoch:
+            return []
+
+        return [frame for frame_seq, frame in self._buffer if frame_seq > seq]
+
+    def attach(self, listener, last_event_id=None):
+        """Adds a connection to this stream and replays the frames it missed."""
+
+        self._cancel_linger()
+
+        for frame in self.frames_since(last_event_id):
+            listener.send_frame(frame)
+
+        self._listeners.add(listener)
+
+    def detach(self, listener):
+        """Removes a connection from this stream."""
+
+        self._listeners.discard(listener)
+
+        if not len(self._listeners):
+            self._schedule_linger()
+
+    def _schedule_linger(self):
+        """Schedules the disposal of this stream if it stays without connections."""
+
+        if self._disposed or self._linger_handle is not None:
+            return
+
+        self._linger_handle = tornado.ioloop.IOLoop.current().call_later(
+            self._linger_secs, self.dispose)
+
+    def _cancel_linger(self):
+        """Cancels the scheduled disposal of this stream."""
+
+        if self._linger_handle is not None:
+            tornado.ioloop.IOLoop.current().remove_timeout(self._linger_handle)
+            self._linger_handle = None
+
+    def dispose(self):
+        """Unsubscribes from the Interaction and closes all the connections."""
+
+        if self._disposed:
+            return
+
+        self._disposed = True
+        self._cancel_linger()
+
+        if self._subscription is not None:
+            self._subscription.dispose()
+
+        for listener in list(self._listeners):
+            listener.close_stream()
+
+        self._listeners.clear()
+        self._on_dispose(self)
+
+
+class SSEMessage(object):
+    """Represents a message received in an SSE stream."""
+
+    def __init__(self, data, event_id=None, event=None):
+        self.data = data
+        self.id = event_id
+        self.event = event
+
+
+class SSEParser(object):
+    """Incremental parser for text/event-stream chunks."""
+
+    def __init__(self):
+        self._buffer = b""
+        self.last_event_id = None
+        self.retry_ms = None
+
+    def reset(self):
+        """Discards any incomplete message. Should be called when a new connection is opened.
+        The last event ID is kept to resume the stream."""
+
+        self._buffer = b""
+
+    def feed(self, chunk):
+        """Parses a chunk of the stream and returns the list of complete messages."""
+
+        self._buffer += chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        messages = []
+
+        while b"\n\n" in self._buffer:
+            block, self._buffer = self._buffer.split(b"\n\n", 1)
+            msg = self._parse_block(block.decode("utf-8"))
+
+            if msg is not None:
+                messages.append(msg)
+
+        return messages
+
+    def _parse_block(self, block):
+        """Parses the lines of a single message."""
+
+        data_lines = []
+        event = None
+
+        for line in block.split("\n"):
+            if not line or line.startswith(":"):
+                continue
+
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+
+            if field == "data":
+                data_lines.append(value)
+            elif field == "id":
+                self.last_event_id = value
+            elif field == "event":
+                event = value
+            elif field == "retry" and value.isdigit():
+                self.retry_ms = int(value)
+
+        if not len(data_lines):
+            return None
+
+        return SSEMessage(data="\n".join(data_lines), event_id=self.last_event_id, event=event)
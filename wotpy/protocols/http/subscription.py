@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Server-side cursors that buffer the emissions of an Interaction between long-poll requests.
+"""
+
+import collections
+import datetime
+import json
+import logging
+import uuid
+
+import tornado.gen
+import tornado.ioloop
+from tornado.concurrent import Future
+
+
+class SubscriptionCursor(object):
+    """Subscription to an Interaction that keeps its emissions in a bounded buffer until
+    a client acknowledges them, so nothing is lost while no poll request is pending.
+    Each emission gets an increasing sequence number and a single poll returns all
+    the items that follow the last acknowledged one. Items that fall off the buffer
+    before being acknowledged are counted as dropped.
+    The cursor expires when no poll has been received in idle_secs."""
+
+    def __init__(self, interaction, encoder, buffer_size, idle_secs, on_dispose):
+        self._id = uuid.uuid4().hex
+        self._interaction = interaction
+        self._encoder = encoder
+        self._buffer = collections.deque(maxlen=buffer_size)
+        self._idle_secs = idle_secs
+        self._on_dispose = on_dispose
+        self._seq = 0
+        self._dropped = 0
+        self._error = None
+        self._future_items = Future()
+        self._pending_polls = 0
+        self._idle_handle = None
+        self._subscription = None
+        self._disposed = False
+        self._logr = logging.getLogger(__name__)
+
+    @property
+    def id(self):
+        """Unique ID of this cursor."""
+
+        return self._id
+
+    @property
+    def dropped(self):
+        """Number of items that were discarded before being acknowledged."""
+
+        return self._dropped
+
+    def start(self):
+        """Subscribes to the Interaction."""
+
+        self._subscription = self._interaction.subscribe(
+            on_next=self._on_next,
+            on_error=self._on_error,
+            on_completed=self.dispose)
+
+        self._schedule_idle()
+
+    def _wake_polls(self):
+        """Resolves the Future that pending polls are waiting on."""
+
+        if not self._future_items.done():
+            self._future_items.set_result(None)
+
+    def _on_next(self, item):
+        """Encodes an emission and appends it to the buffer."""
+
+        try:
+            data = item.encode_once(self._encoder)
+        except ValueError as ex:
+            self._logr.warning("Error encoding emission of {}: {}".format(self._interaction, ex))
+            return
+
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+
+        self._seq += 1
+        self._buffer.append((self._seq, data))
+        self._wake_polls()
+
+    def _on_error(self, err):
+        """Keeps the error to be reported on the next poll."""
+
+        self._logr.warning("Error on subscription to {}: {}".format(self._interaction, err))
+        self._error = str(err)
+        self._wake_polls()
+
+    def ack(self, seq):
+        """Removes the items up to (and including) the given sequence number from the buffer."""
+
+        while len(self._buffer) and self._buffer[0][0] <= seq:
+            self._buffer.popleft()
+
+    @tornado.gen.coroutine
+    def poll(self, ack=0, timeout=None):
+        """Acknowledges the items up to the given sequence number and returns the items that follow.
+        Waits up to timeout seconds for the next emission if there is nothing to return yet."""
+
+        self._cancel_idle()
+        self._pending_polls += 1
+
+        try:
+            self.ack(ack)
+
+            if not len(self._buffer) and self._error is None and not self._disposed:
+                if self._future_items.done():
+                    self._future_items = Future()
+
+                try:
+                    yield tornado.gen.with_timeout(
+                        datetime.timedelta(seconds=timeout),
+                        self._future_items)
+                except tornado.gen.TimeoutError:
+                    pass
+
+            raise tornado.gen.Return(list(self._buffer))
+        finally:
+            self._pending_polls -= 1
+
+            if not self._pending_polls:
+                self._schedule_idle()
+
+    def to_json(self, items):
+        """Serializes the given buffered items into the body of a poll response."""
+
+        return '{{"items": [{}], "dropped": {}, "error": {}}}'.format(
+            ", ".join('{{"seq": {}, "data": {}}}'.format(seq, data) for seq, data in items),
+            self._dropped, json.dumps(self._error))
+
+    def _schedule_idle(self):
+        """Schedules the expiration of this cursor."""
+
+        if self._disposed:
+            return
+
+        self._cancel_idle()
+
+        self._idle_handle = tornado.ioloop.IOLoop.current().call_later(
+            self._idle_secs, self.dispose)
+
+    def _cancel_idle(self):
+        """Cancels the scheduled expiration of this cursor."""
+
+        if self._idle_handle is not None:
+            tornado.ioloop.IOLoop.current().remove_timeout(self._idle_handle)
+            self._idle_handle = None
+
+    def dispose(self):
+        """Unsubscribes from the Interaction and releases the pending polls."""
+
+        if self._disposed:
+            return
+
+        self._disposed = True
+        self._cancel_idle()
+
+        if self._subscription is not None:
+            self._subscription.dispose()
+
+        self._wake_polls()
+        self._on_dispose(self)
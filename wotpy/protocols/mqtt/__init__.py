@@ -10,6 +10,7 @@ MQTT Protocol Binding implementation.
     wotpy.protocols.mqtt.handlers
     wotpy.protocols.mqtt.client
     wotpy.protocols.mqtt.enums
+    wotpy.protocols.mqtt.forms
     wotpy.protocols.mqtt.runner
     wotpy.protocols.mqtt.server
 """
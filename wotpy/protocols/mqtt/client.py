@@ -6,6 +6,7 @@ Classes that contain the client logic for the MQTT protocol.
 """
 
 import asyncio
+import collections
 import copy
 import datetime
 import json
@@ -15,6 +16,7 @@ import time
 import uuid
 
 import hbmqtt.client
+import six
 import tornado.concurrent
 import tornado.gen
 import tornado.ioloop
@@ -26,20 +28,29 @@ from six.moves.urllib import parse
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.exceptions import (ClientRequestTimeout,
-                                        FormNotFoundException)
-from wotpy.protocols.mqtt.enums import MQTTSchemes
+                                        FormNotFoundException,
+                                        ProtocolClientException)
+from wotpy.protocols.mqtt.forms import MQTTFormPicker
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
+from wotpy.protocols.mqtt.handlers.properties import PropertiesMQTTHandler
 from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
 from wotpy.protocols.refs import ConnRefCounter
-from wotpy.protocols.utils import is_scheme_form
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import (EmittedEvent, PropertyChangeEmittedEvent,
                               PropertyChangeEventInit)
 
 
 class MQTTClient(BaseProtocolClient):
-    """Implementation of the protocol client interface for the MQTT protocol."""
-
+    """Implementation of the protocol client interface for the MQTT protocol.
+    Delivered messages are kept in a deque for each topic and discarded from the head
+    once they are older than msg_ttl_secs. Responses to requests (Action results,
+    write ACKs and multiple Properties responses) are instead matched by their
+    correlation ID against an index of pending Futures and never stored.
+    Publishes and subscriptions to the same broker proceed concurrently, with at most
+    max_inflight of them awaiting the broker at any time. Concurrent subscriptions
+    to the same topic share a single SUBSCRIBE round trip."""
+
+    CORRELATION_KEYS = ("id", "ack")
     DELIVER_TERMINATE_LOOP_SLEEP_SECS = 0.1
     SLEEP_SECS_DELIVER_ERR = 1.0
 
@@ -47,6 +58,7 @@ class MQTTClient(BaseProtocolClient):
     DEFAULT_MSG_WAIT_TIMEOUT_SECS = 5
     DEFAULT_MSG_TTL_SECS = 15
     DEFAULT_STOP_LOOP_TIMEOUT_SECS = 60
+    DEFAULT_MAX_INFLIGHT = 100
 
     # Highly permissive default keep_alive to avoid
     # disconnections from broker on high throughput scenarios:
@@ -62,18 +74,23 @@ class MQTTClient(BaseProtocolClient):
                  msg_ttl_secs=DEFAULT_MSG_TTL_SECS,
                  timeout_default=None,
                  hbmqtt_config=None,
-                 stop_loop_timeout_secs=DEFAULT_STOP_LOOP_TIMEOUT_SECS):
+                 stop_loop_timeout_secs=DEFAULT_STOP_LOOP_TIMEOUT_SECS,
+                 max_inflight=DEFAULT_MAX_INFLIGHT):
         self._deliver_timeout_secs = deliver_timeout_secs
         self._msg_wait_timeout_secs = msg_wait_timeout_secs
         self._msg_ttl_secs = msg_ttl_secs
         self._timeout_default = timeout_default
         self._hbmqtt_config = hbmqtt_config
         self._stop_loop_timeout_secs = stop_loop_timeout_secs
+        self._max_inflight = max_inflight
         self._lock_client = tornado.locks.Lock()
+        self._inflight = {}
+        self._subscriptions = {}
         self._deliver_stop_events = {}
         self._msg_conditions = {}
         self._clients = {}
         self._messages = {}
+        self._correlations = {}
         self._topics = {}
         self._ref_counter = ConnRefCounter()
         self._logr = logging.getLogger(__name__)
@@ -93,25 +110,84 @@ class MQTTClient(BaseProtocolClient):
         return config
 
     def _new_message(self, broker_url, msg):
-        """Adds the message to the internal queue and notifies all topic listeners."""
+        """Resolves the pending request that the message is a response to or otherwise
+        adds the message to the deque of its topic and notifies all topic listeners."""
 
         assert broker_url in self._msg_conditions, "Unknown broker in conditions"
         assert msg.topic in self._msg_conditions[broker_url], "Unknown topic"
 
+        data = json.loads(msg.data.decode())
+
+        if self._is_correlated(data):
+            self._resolve_correlated(broker_url, msg.topic, data)
+            return
+
         if broker_url not in self._messages:
             self._messages[broker_url] = {}
 
         if msg.topic not in self._messages[broker_url]:
-            self._messages[broker_url][msg.topic] = []
+            self._messages[broker_url][msg.topic] = collections.deque()
 
-        self._messages[broker_url][msg.topic].append({
-            "id": uuid.uuid4().hex,
-            "data": json.loads(msg.data.decode()),
-            "time": time.time()
-        })
+        messages = self._messages[broker_url][msg.topic]
+        messages.append((time.time(), data))
+        self._prune_messages(messages)
 
         self._msg_conditions[broker_url][msg.topic].notify_all()
-        self._clean_messages(broker_url)
+
+    @classmethod
+    def _correlation_id(cls, data, key):
+        """Returns the correlation ID for the given key in the message data or None."""
+
+        value = data.get(key, None) if isinstance(data, dict) else None
+
+        return value if isinstance(value, six.string_types) else None
+
+    @classmethod
+    def _is_correlated(cls, data):
+        """Returns True if the message data is a response that carries a correlation ID."""
+
+        return any(cls._correlation_id(data, key) is not None for key in cls.CORRELATION_KEYS)
+
+    def _resolve_correlated(self, broker_url, topic, data):
+        """Resolves the Future of the pending request that the message data responds to.
+        Responses for requests that are not (or no longer) pending are discarded."""
+
+        waiters = self._correlations.get(broker_url, {})
+
+        for key in self.CORRELATION_KEYS:
+            future = waiters.pop((topic, key, self._correlation_id(data, key)), None)
+
+            if future is not None and not future.done():
+                future.set_result(data)
+                return
+
+    def _expect_correlated(self, broker_url, topic, key, value):
+        """Registers a pending request that waits for a response with the given
+        correlation ID in a topic. Should be called before the request is published.
+        Returns a Future that resolves with the response message data."""
+
+        future = tornado.concurrent.Future()
+        self._correlations.setdefault(broker_url, {})[(topic, key, value)] = future
+
+        return future
+
+    @tornado.gen.coroutine
+    def _wait_correlated(self, broker_url, topic, key, value, future, timeout=None):
+        """Waits for the response to a pending request registered with _expect_correlated."""
+
+        try:
+            if timeout:
+                data = yield tornado.gen.with_timeout(
+                    datetime.timedelta(seconds=timeout), future)
+            else:
+                data = yield future
+        except tornado.gen.TimeoutError:
+            self._logr.warning("Timeout waiting for response on: {}".format(topic))
+            raise ClientRequestTimeout
+        finally:
+            self._correlations.get(broker_url, {}).pop((topic, key, value), None)
+
+        raise tornado.gen.Return(data)
 
     @tornado.gen.coroutine
     def _reconnect_client(self, broker_url):
@@ -240,6 +316,7 @@ class MQTTClient(BaseProtocolClient):
                 broker_url, pprint.pformat(config)))
 
             self._clients[broker_url] = hbmqtt.client.MQTTClient(config=config)
+            self._inflight[broker_url] = tornado.locks.Semaphore(self._max_inflight)
 
             yield self._clients[broker_url].connect(broker_url, cleansession=False)
 
@@ -275,78 +352,110 @@ class MQTTClient(BaseProtocolClient):
                     exc_info=True)
 
             self._clients.pop(broker_url, None)
+            self._inflight.pop(broker_url, None)
+            self._subscriptions.pop(broker_url, None)
             self._messages.pop(broker_url, None)
+            self._correlations.pop(broker_url, None)
             self._msg_conditions.pop(broker_url, None)
             self._topics.pop(broker_url, None)
 
     @tornado.gen.coroutine
     def _subscribe(self, broker_url, topic, qos):
-        """Subscribes to a topic."""
+        """Subscribes to a topic.
+        Waits on the pending SUBSCRIBE for the same topic and QoS if there is one."""
 
-        with (yield self._lock_client.acquire()):
-            if broker_url not in self._clients:
-                return
+        if broker_url not in self._clients:
+            return
+
+        if broker_url not in self._msg_conditions:
+            self._msg_conditions[broker_url] = {}
 
-            if broker_url not in self._msg_conditions:
-                self._msg_conditions[broker_url] = {}
+        if topic not in self._msg_conditions[broker_url]:
+            self._msg_conditions[broker_url][topic] = \
+                tornado.locks.Condition()
 
-            if topic not in self._msg_conditions[broker_url]:
-                self._msg_conditions[broker_url][topic] = \
-                    tornado.locks.Condition()
+        if broker_url not in self._topics:
+            self._topics[broker_url] = set()
 
-            if broker_url not in self._topics:
-                self._topics[broker_url] = set()
+        self._topics[broker_url].add((topic, qos))
 
-            self._topics[broker_url].add((topic, qos))
+        subscriptions = self._subscriptions.setdefault(broker_url, {})
 
-            yield self._clients[broker_url].subscribe([(topic, qos)])
+        if (topic, qos) not in subscriptions:
+            subscriptions[(topic, qos)] = self._send_subscribe(broker_url, topic, qos)
+
+        future = subscriptions[(topic, qos)]
+
+        try:
+            yield future
+        except Exception:
+            if subscriptions.get((topic, qos), None) is future:
+                subscriptions.pop((topic, qos))
+
+            raise
+
+    @tornado.gen.coroutine
+    def _send_subscribe(self, broker_url, topic, qos):
+        """Sends a SUBSCRIBE packet within the in-flight window of the broker."""
+
+        client = self._clients[broker_url]
+
+        with (yield self._inflight[broker_url].acquire()):
+            yield client.subscribe([(topic, qos)])
 
     @tornado.gen.coroutine
     def _publish(self, broker_url, topic, payload, qos):
-        """Publishes a message with the given payload in a topic."""
+        """Publishes a message with the given payload in a topic.
+        Waits for a free slot in the in-flight window of the broker before sending it."""
 
-        with (yield self._lock_client.acquire()):
-            if broker_url not in self._clients:
-                return
+        if broker_url not in self._clients:
+            raise ProtocolClientException("MQTT client not connected to: {}".format(broker_url))
 
-            yield self._clients[broker_url].publish(topic, payload, qos=qos)
+        client = self._clients[broker_url]
 
-    def _topic_messages(self, broker_url, topic, from_time=None, ignore_ids=None):
-        """Returns a generator that yields the messages in the
-        delivered messages queue for the given topic."""
+        with (yield self._inflight[broker_url].acquire()):
+            yield client.publish(topic, payload, qos=qos)
 
-        if broker_url not in self._messages:
-            return
+    @tornado.gen.coroutine
+    def _publish_correlated(self, broker_url, topic, payload, qos, correlation):
+        """Publishes the message of a pending request registered with _expect_correlated.
+        The pending request (a (topic, key, value) tuple) is discarded if the message can not be published."""
 
-        if topic not in self._messages[broker_url]:
-            return
+        try:
+            yield self._publish(broker_url, topic, payload, qos)
+        except Exception:
+            self._correlations.get(broker_url, {}).pop(correlation, None)
+            raise
 
-        for msg in self._messages[broker_url][topic]:
-            is_on_time = from_time is None or msg["time"] >= from_time
-            is_ignored = ignore_ids is not None and msg["id"] in ignore_ids
+    def _prune_messages(self, messages):
+        """Removes the messages that have expired according to the TTL from the head of a topic deque."""
 
-            if is_on_time and not is_ignored:
-                yield msg["id"], msg["data"], msg["time"]
+        expiry = time.time() - self._msg_ttl_secs
 
-    def _clean_messages(self, broker_url):
-        """Removes the messages that have expired according to the TTL."""
+        while len(messages) and messages[0][0] <= expiry:
+            messages.popleft()
 
-        if broker_url not in self._messages:
-            return
+    def _first_message_since(self, broker_url, topic, from_time):
+        """Returns the data of the first message delivered in the topic
+        at or after the given time or None if there is none.
+        The deque is scanned from the tail, so only the newer messages are visited."""
 
-        now = time.time()
+        messages = self._messages.get(broker_url, {}).get(topic, None)
 
-        self._messages[broker_url] = {
-            topic: [
-                msg for msg in self._messages[broker_url][topic]
-                if (now - msg["time"]) < self._msg_ttl_secs
-            ] for topic in self._messages[broker_url]
-        }
+        if not messages:
+            return None
+
+        self._prune_messages(messages)
+
+        match = None
+
+        for msg_time, msg_data in reversed(messages):
+            if msg_time < from_time:
+                break
 
-    def _next_match(self, broker_url, topic, func):
-        """Returns the first message match in the internal messages queue or None."""
+            match = msg_data
 
-        return next((item for item in self._topic_messages(broker_url, topic) if func(item)), None)
+        return match
 
     @tornado.gen.coroutine
     def _wait_on_message(self, broker_url, topic):
@@ -363,16 +472,7 @@ class MQTTClient(BaseProtocolClient):
     def _pick_mqtt_href(cls, td, forms, op=None):
         """Picks the most appropriate MQTT form href from the given list of forms."""
 
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
-
-        return next((
-            form.href for form in forms
-            if is_scheme_form(form, td.base, MQTTSchemes.MQTT) and is_op_form(form)
-        ), None)
+        return MQTTFormPicker.pick_href(td, forms, op=op)
 
     @classmethod
     def _parse_href(cls, href):
@@ -398,14 +498,13 @@ class MQTTClient(BaseProtocolClient):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
 
-        forms = td.get_forms(name)
+        return MQTTFormPicker.is_supported_interaction(td, name)
 
-        forms_mqtt = [
-            form for form in forms
-            if is_scheme_form(form, td.base, MQTTSchemes.list())
-        ]
+    def is_supported_thing_operation(self, td, op):
+        """Returns True if any of the Thing-level Forms for the given
+        operation is supported in this Protocol Binding client."""
 
-        return len(forms_mqtt) > 0
+        return MQTTFormPicker.is_supported_thing_operation(td, op)
 
     @tornado.gen.coroutine
     def invoke_action(self, td, name, input_value, timeout=None,
@@ -436,35 +535,23 @@ class MQTTClient(BaseProtocolClient):
                 "input": input_value
             }
 
-            input_payload = json.dumps(input_data).encode()
-
-            yield self._publish(broker_url, topic_invoke, input_payload, qos_publish)
+            future_result = self._expect_correlated(
+                broker_url, topic_result, "id", input_data["id"])
 
-            ini = time.time()
-
-            while True:
-                self._logr.debug(
-                    "Checking invocation topic: {}".format(topic_result))
-
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning(
-                        "Timeout invoking Action: {}".format(topic_result))
-                    raise ClientRequestTimeout
-
-                msg_match = self._next_match(
-                    broker_url, topic_result,
-                    lambda item: item[1].get("id") == input_data.get("id"))
+            input_payload = json.dumps(input_data).encode()
 
-                if not msg_match:
-                    yield self._wait_on_message(broker_url, topic_result)
-                    continue
+            yield self._publish_correlated(
+                broker_url, topic_invoke, input_payload, qos_publish,
+                (topic_result, "id", input_data["id"]))
 
-                msg_id, msg_data, msg_time = msg_match
+            msg_data = yield self._wait_correlated(
+                broker_url, topic_result, "id", input_data["id"],
+                future_result, timeout=timeout)
 
-                if msg_data.get("error", None) is not None:
-                    raise Exception(msg_data.get("error"))
-                else:
-                    raise tornado.gen.Return(msg_data.get("result"))
+            if msg_data.get("error", None) is not None:
+                raise Exception(msg_data.get("error"))
+            else:
+                raise tornado.gen.Return(msg_data.get("result"))
         finally:
             yield self._disconnect_client(broker_url, ref_id)
 
@@ -502,32 +589,21 @@ class MQTTClient(BaseProtocolClient):
                 "ack": uuid.uuid4().hex
             }
 
+            future_ack = self._expect_correlated(
+                broker_url, topic_ack, "ack", write_data["ack"]) if wait_ack else None
+
             write_payload = json.dumps(write_data).encode()
 
-            yield self._publish(broker_url, topic_write, write_payload, qos_publish)
+            yield self._publish_correlated(
+                broker_url, topic_write, write_payload, qos_publish,
+                (topic_ack, "ack", write_data["ack"]))
 
             if not wait_ack:
                 return
 
-            ini = time.time()
-
-            while True:
-                self._logr.debug(
-                    "Checking write ACK topic: {}".format(topic_ack))
-
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning(
-                        "Timeout writing Property: {}".format(topic_ack))
-                    raise ClientRequestTimeout
-
-                msg_match = self._next_match(
-                    broker_url, topic_ack,
-                    lambda item: item[1].get("ack") == write_data.get("ack"))
-
-                if msg_match:
-                    break
-
-                yield self._wait_on_message(broker_url, topic_ack)
+            yield self._wait_correlated(
+                broker_url, topic_ack, "ack", write_data["ack"],
+                future_ack, timeout=timeout)
         finally:
             yield self._disconnect_client(broker_url, ref_id)
 
@@ -584,21 +660,96 @@ class MQTTClient(BaseProtocolClient):
                         "Timeout reading Property: {}".format(topic_obsv))
                     raise ClientRequestTimeout
 
-                msg_match = self._next_match(
-                    broker_obsv, topic_obsv,
-                    lambda item: item[2] >= read_time)
+                msg_data = self._first_message_since(broker_obsv, topic_obsv, read_time)
 
-                if not msg_match:
+                if msg_data is None:
                     yield self._wait_on_message(broker_obsv, topic_obsv)
                     continue
 
-                msg_id, msg_data, msg_time = msg_match
-
                 raise tornado.gen.Return(msg_data.get("value"))
         finally:
             yield self._disconnect_client(broker_read, ref_id)
             broker_obsv != broker_read and (yield self._disconnect_client(broker_obsv, ref_id))
 
+    @tornado.gen.coroutine
+    def _request_properties(self, td, op, request_data, timeout=None,
+                            qos_publish=QOS_2, qos_subscribe=QOS_1):
+        """Publishes a request on the multiple Properties topic of a remote Thing
+        and waits for the response with the same ID.
+        Returns the response message data."""
+
+        timeout = timeout if timeout else self._timeout_default
+        ref_id = uuid.uuid4().hex
+
+        href = self._pick_mqtt_href(td, td.get_thing_forms(), op=op)
+
+        if href is None:
+            raise FormNotFoundException()
+
+        parsed_href = self._parse_href(href)
+        broker_url = parsed_href["broker_url"]
+
+        topic_request = parsed_href["topic"]
+        topic_response = PropertiesMQTTHandler.to_response_topic(topic_request)
+
+        try:
+            yield self._init_client(broker_url, ref_id)
+            yield self._subscribe(broker_url, topic_response, qos_subscribe)
+
+            request_data = dict(request_data, id=uuid.uuid4().hex)
+
+            future_response = self._expect_correlated(
+                broker_url, topic_response, "id", request_data["id"])
+
+            request_payload = json.dumps(request_data).encode()
+
+            yield self._publish_correlated(
+                broker_url, topic_request, request_payload, qos_publish,
+                (topic_response, "id", request_data["id"]))
+
+            msg_data = yield self._wait_correlated(
+                broker_url, topic_response, "id", request_data["id"],
+                future_response, timeout=timeout)
+
+            if msg_data.get("error", None) is not None:
+                raise Exception(msg_data.get("error"))
+
+            raise tornado.gen.Return(msg_data)
+        finally:
+            yield self._disconnect_client(broker_url, ref_id)
+
+    @tornado.gen.coroutine
+    def read_multiple_properties(self, td, names=None, timeout=None,
+                                 qos_publish=QOS_2, qos_subscribe=QOS_1):
+        """Reads the values of multiple Properties on a remote Thing in a single request.
+        All Properties are read if names is None.
+        Returns a Future that resolves with a dict of values by Property name."""
+
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None \
+            else InteractionVerbs.READ_MULTIPLE_PROPERTIES
+
+        request_data = {"action": "read"}
+
+        if names is not None:
+            request_data.update({"names": list(names)})
+
+        msg_data = yield self._request_properties(
+            td, op, request_data, timeout=timeout,
+            qos_publish=qos_publish, qos_subscribe=qos_subscribe)
+
+        raise tornado.gen.Return(msg_data.get("values"))
+
+    @tornado.gen.coroutine
+    def write_multiple_properties(self, td, values, timeout=None,
+                                  qos_publish=QOS_2, qos_subscribe=QOS_1):
+        """Updates the values of multiple Properties on a remote Thing in a single request.
+        Returns a Future."""
+
+        yield self._request_properties(
+            td, InteractionVerbs.WRITE_MULTIPLE_PROPERTIES,
+            {"action": "write", "values": values}, timeout=timeout,
+            qos_publish=qos_publish, qos_subscribe=qos_subscribe)
+
     def _build_subscribe(self, broker_url, topic, next_item_builder, qos):
         """Builds the subscribe function that should be passed when
         constructing an Observable to listen for messages on an MQTT topic."""
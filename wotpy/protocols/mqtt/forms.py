@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Form selection rules of the MQTT client.
+"""
+
+from wotpy.protocols.forms import BaseFormPicker
+from wotpy.protocols.mqtt.enums import MQTTSchemes
+
+
+class MQTTFormPicker(BaseFormPicker):
+    """Picks MQTT Forms."""
+
+    SCHEMES = MQTTSchemes.list()
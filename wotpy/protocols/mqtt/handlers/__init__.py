@@ -11,6 +11,7 @@ Entities that handle the MQTT operations needed to support each of the Interacti
     wotpy.protocols.mqtt.handlers.base
     wotpy.protocols.mqtt.handlers.event
     wotpy.protocols.mqtt.handlers.ping
+    wotpy.protocols.mqtt.handlers.properties
     wotpy.protocols.mqtt.handlers.property
     wotpy.protocols.mqtt.handlers.subs
 """
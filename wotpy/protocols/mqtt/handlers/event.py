@@ -15,10 +15,18 @@ from tornado.queues import QueueFull
 
 from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
 from wotpy.protocols.mqtt.handlers.subs import InteractionsSubscriber
-from wotpy.utils.utils import to_json_obj
 from wotpy.wot.enums import InteractionTypes
 
 
+def _encode_event_payload(emitted_event):
+    """Encodes the MQTT message payload for an event emission."""
+
+    return '{{"name": {}, "data": {}, "timestamp": {}}}'.format(
+        json.dumps(emitted_event.name),
+        emitted_event.json_data,
+        int(time.time() * 1000)).encode()
+
+
 class EventMQTTHandler(BaseMQTTHandler):
     """MQTT handler for Event subscriptions."""
 
@@ -81,15 +89,9 @@ class EventMQTTHandler(BaseMQTTHandler):
 
         def on_next(item):
             try:
-                data = {
-                    "name": item.name,
-                    "data": to_json_obj(item.data),
-                    "timestamp": int(time.time() * 1000)
-                }
-
                 self.queue.put_nowait({
                     "topic": topic,
-                    "data": json.dumps(data).encode(),
+                    "data": item.encode_once(_encode_event_payload),
                     "qos": self._qos
                 })
             except QueueFull:
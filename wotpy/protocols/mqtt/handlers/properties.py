@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MQTT handler for reads and writes of multiple Properties in a single request.
+"""
+
+import json
+import time
+from json import JSONDecodeError
+
+import six
+import tornado.gen
+from hbmqtt.mqtt.constants import QOS_2
+
+from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.utils.utils import to_json_obj
+
+
+class PropertiesMQTTHandler(BaseMQTTHandler):
+    """MQTT handler for reads and writes of multiple Properties in a single request.
+    Responses are published in the responses topic of the Thing with the same ID as the request."""
+
+    KEY_ACTION = "action"
+    KEY_NAMES = "names"
+    KEY_VALUES = "values"
+    KEY_REQUEST_ID = "id"
+    ACTION_READ = "read"
+    ACTION_WRITE = "write"
+
+    def __init__(self, mqtt_server, qos=QOS_2):
+        super(PropertiesMQTTHandler, self).__init__(mqtt_server)
+
+        self._qos = qos
+
+    @property
+    def topic_wildcard_requests(self):
+        """Wildcard topic to subscribe to all multiple Properties requests."""
+
+        return "{}/properties/requests/#".format(self.servient_id)
+
+    @classmethod
+    def to_response_topic(cls, requests_topic):
+        """Takes a multiple Properties requests topic and returns the related responses topic."""
+
+        topic_split = requests_topic.split("/")
+        servient_id, thing_name = topic_split[-4], topic_split[-1]
+
+        return "{}/properties/responses/{}".format(servient_id, thing_name)
+
+    def build_responses_topic(self, thing):
+        """Returns the MQTT topic for the responses to multiple Properties requests."""
+
+        return "{}/properties/responses/{}".format(self.servient_id, thing.url_name)
+
+    @property
+    def topics(self):
+        """List of topics that this MQTT handler wants to subscribe to."""
+
+        return [(self.topic_wildcard_requests, self._qos)]
+
+    @tornado.gen.coroutine
+    def handle_message(self, msg):
+        """Listens to all multiple Properties request topics and responds to read and write requests."""
+
+        try:
+            parsed_msg = json.loads(msg.data.decode())
+        except (JSONDecodeError, TypeError):
+            return
+
+        action = parsed_msg.get(self.KEY_ACTION, False)
+
+        if not action or action not in [self.ACTION_WRITE, self.ACTION_READ]:
+            return
+
+        topic_split = msg.topic.split("/")
+
+        if len(topic_split) != len(self.topic_wildcard_requests.split("/")):
+            return
+
+        thing_url_name = topic_split[-1]
+
+        try:
+            exp_thing = next(
+                item for item in self.mqtt_server.exposed_things
+                if item.url_name == thing_url_name)
+        except StopIteration:
+            return
+
+        data = {
+            "id": parsed_msg.get(self.KEY_REQUEST_ID, None),
+            "timestamp": int(time.time() * 1000)
+        }
+
+        try:
+            if action == self.ACTION_READ:
+                names = parsed_msg.get(self.KEY_NAMES, None)
+
+                if names is None:
+                    values = yield exp_thing.read_all_properties()
+                else:
+                    values = yield exp_thing.read_multiple_properties(names)
+
+                data.update({"values": {key: to_json_obj(val) for key, val in six.iteritems(values)}})
+            else:
+                yield exp_thing.write_multiple_properties(parsed_msg.get(self.KEY_VALUES, {}))
+        except Exception as ex:
+            data.update({"error": str(ex)})
+
+        yield self.queue.put({
+            "topic": self.build_responses_topic(exp_thing.thing),
+            "data": json.dumps(data).encode(),
+            "qos": self._qos
+        })
@@ -20,6 +20,21 @@ from wotpy.utils.utils import to_json_obj
 from wotpy.wot.enums import InteractionTypes
 
 
+def _encode_update_payload(value):
+    """Encodes the MQTT message payload for an update of a Property value."""
+
+    return json.dumps({
+        "value": to_json_obj(value),
+        "timestamp": int(time.time() * 1000)
+    }).encode()
+
+
+def _encode_property_change_payload(emitted_event):
+    """Encodes the MQTT message payload for a property change emission."""
+
+    return _encode_update_payload(emitted_event.data.value)
+
+
 class PropertyMQTTHandler(BaseMQTTHandler):
     """MQTT handler for Property reads, writes and subscriptions to value updates."""
 
@@ -171,17 +186,13 @@ class PropertyMQTTHandler(BaseMQTTHandler):
 
         yield None
 
-    def _build_update_message(self, topic, value):
-        """Builds an MQTT message to publish an update for a Property value."""
-
-        now_ms = int(time.time() * 1000)
+    def _build_update_message(self, topic, value, payload=None):
+        """Builds an MQTT message to publish an update for a Property value.
+        The payload is encoded from the value unless it is already given."""
 
         return {
             "topic": topic,
-            "data": json.dumps({
-                "value": to_json_obj(value),
-                "timestamp": now_ms
-            }).encode(),
+            "data": payload if payload is not None else _encode_update_payload(value),
             "qos": self._qos_observe
         }
 
@@ -192,7 +203,8 @@ class PropertyMQTTHandler(BaseMQTTHandler):
 
         def on_next(item):
             try:
-                msg = self._build_update_message(topic, item.data.value)
+                payload = item.encode_once(_encode_property_change_payload)
+                msg = self._build_update_message(topic, item.data.value, payload=payload)
                 self.queue.put_nowait(msg)
             except QueueFull:
                 pass
@@ -15,6 +15,7 @@ from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
 from wotpy.protocols.mqtt.handlers.event import EventMQTTHandler
 from wotpy.protocols.mqtt.handlers.ping import PingMQTTHandler
+from wotpy.protocols.mqtt.handlers.properties import PropertiesMQTTHandler
 from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
 from wotpy.protocols.mqtt.runner import MQTTHandlerRunner
 from wotpy.protocols.server import BaseProtocolServer
@@ -39,6 +40,7 @@ class MQTTServer(BaseProtocolServer):
         self._handler_runners = [
             build_runner(PingMQTTHandler(mqtt_server=self)),
             build_runner(PropertyMQTTHandler(mqtt_server=self, callback_ms=property_callback_ms)),
+            build_runner(PropertiesMQTTHandler(mqtt_server=self)),
             build_runner(EventMQTTHandler(mqtt_server=self, callback_ms=event_callback_ms)),
             build_runner(ActionMQTTHandler(mqtt_server=self)),
         ]
@@ -146,6 +148,31 @@ class MQTTServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns the MQTT Form instances to read
+        or write multiple Properties of the given Thing."""
+
+        href = "{}/{}/properties/requests/{}".format(
+            self._broker_url.rstrip("/"),
+            self.servient_id,
+            thing.url_name)
+
+        ops = [
+            InteractionVerbs.READ_ALL_PROPERTIES,
+            InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+            InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+        ]
+
+        return [
+            Form(
+                interaction=thing,
+                protocol=self.protocol,
+                href=href,
+                content_type=MediaTypes.JSON,
+                op=op)
+            for op in ops
+        ]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
@@ -88,6 +88,13 @@ class BaseProtocolServer(object):
 
         raise NotImplementedError()
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with all the Forms for the operations
+        that apply to the whole Thing (e.g. reading multiple Properties).
+        Servers that do not support any Thing-level operation return an empty list."""
+
+        return []
+
     @abstractmethod
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
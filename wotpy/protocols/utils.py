@@ -22,6 +22,16 @@ def is_scheme_form(form, base, scheme):
     return parsed_scheme in scheme if isinstance(scheme, list) else parsed_scheme == scheme
 
 
+def is_op_form(form, op):
+    """Returns True if the given operation is included in the
+    operations of the Form (which may be a single value or a list)."""
+
+    if isinstance(form.op, list):
+        return op in form.op
+
+    return form.op == op
+
+
 def pick_form(td, forms, schemes, op=None):
     """Picks the Form that will be used to connect to the remote Thing."""
 
@@ -32,7 +42,7 @@ def pick_form(td, forms, schemes, op=None):
         ]
 
         if op is not None:
-            scheme_forms = [form for form in scheme_forms if form.op == op]
+            scheme_forms = [form for form in scheme_forms if is_op_form(form, op)]
 
         if len(scheme_forms):
             return scheme_forms[0]
@@ -8,9 +8,13 @@ WebSockets Protocol Binding implementation.
     :toctree: _ws
 
     wotpy.protocols.ws.client
+    wotpy.protocols.ws.compression
     wotpy.protocols.ws.enums
+    wotpy.protocols.ws.forms
     wotpy.protocols.ws.handler
     wotpy.protocols.ws.messages
+    wotpy.protocols.ws.queue
     wotpy.protocols.ws.schemas
     wotpy.protocols.ws.server
+    wotpy.protocols.ws.validation
 """
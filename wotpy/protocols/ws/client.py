@@ -6,22 +6,24 @@ Classes that contain the client logic for the Websocket protocol.
 """
 
 import datetime
+import json
 import logging
 import uuid
+import warnings
 
+import six
 import tornado.gen
 import tornado.ioloop
-import tornado.locks
 import tornado.websocket
 from rx import Observable
 from tornado.concurrent import Future
 
 from wotpy.protocols.client import BaseProtocolClient
-from wotpy.protocols.enums import Protocols
+from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.exceptions import FormNotFoundException, ClientRequestTimeout
 from wotpy.protocols.refs import ConnRefCounter
-from wotpy.protocols.utils import pick_form, is_scheme_form
-from wotpy.protocols.ws.enums import WebsocketMethods, WebsocketSchemes
+from wotpy.protocols.ws.enums import WebsocketMethods
+from wotpy.protocols.ws.forms import WebsocketFormPicker
 from wotpy.protocols.ws.messages import \
     WebsocketMessageRequest, \
     WebsocketMessageResponse, \
@@ -34,178 +36,378 @@ from wotpy.wot.events import \
     PropertyChangeEventInit
 
 
-class WebsocketClient(BaseProtocolClient):
-    """Implementation of the protocol client interface for the Websocket protocol."""
+class WebsocketClientSubscription(object):
+    """Represents a subscription that is multiplexed over
+    the shared WebSockets connection to a remote Thing."""
+
+    def __init__(self, observer, on_next):
+        self.observer = observer
+        self.on_next_item = on_next
+        self.subscription_id = None
+
+    def next(self, msg_item):
+        """Passes an emitted item to the observer."""
+
+        try:
+            self.on_next_item(self.observer, msg_item)
+        except Exception as ex:
+            self.observer.on_error(ex)
+
+    def error(self, ex):
+        """Passes an error to the observer."""
 
-    SLEEP_AFTER_ERR_SECS = 1.0
-    RECEIVE_LOOP_TERMINATE_SLEEP_SECS = 0.1
+        self.observer.on_error(ex)
+
+
+class WebsocketClient(BaseProtocolClient):
+    """Implementation of the protocol client interface for the Websocket protocol.
+    Connections are pooled by URL and kept open for idle_timeout_secs after
+    their last user is done (or indefinitely if idle_timeout_secs is None).
+    The permessage-deflate extension is requested if a WebsocketCompression instance is given.
+    The receive_timeout_secs argument is deprecated and ignored: each pooled connection
+    is read by a single loop that blocks until a message arrives or the connection closes."""
+
+    DEFAULT_IDLE_TIMEOUT_SECS = 30.0
+
+    def __init__(self, receive_timeout_secs=None, ping_interval=2000,
+                 batch_requests=True, idle_timeout_secs=DEFAULT_IDLE_TIMEOUT_SECS,
+                 compression=None):
+        if receive_timeout_secs is not None:
+            warnings.warn(
+                "The receive_timeout_secs argument of WebsocketClient is deprecated and ignored",
+                DeprecationWarning)
 
-    def __init__(self, receive_timeout_secs=1.0, ping_interval=2000):
-        self._receive_timeout_secs = receive_timeout_secs
         self._ping_interval = ping_interval
+        self._batch_requests = batch_requests
+        self._idle_timeout_secs = idle_timeout_secs
+        self._compression = compression
+        self._send_queues = {}
         self._conns = {}
+        self._conn_futures = {}
+        self._idle_handles = {}
         self._ref_counter = ConnRefCounter()
-        self._lock_conn = tornado.locks.Lock()
-        self._msg_conditions = {}
-        self._messages = {}
-        self._receive_stop_events = {}
+        self._pending = {}
+        self._subscription_requests = {}
+        self._cancelled_requests = {}
+        self._subscriptions = {}
         self._logr = logging.getLogger(__name__)
 
     @tornado.gen.coroutine
     def _init_conn(self, ws_url, ref_id):
-        """Initializes and connects the WebSockets connection."""
+        """Adds a reference to the WebSockets connection for the given URL,
+        connecting first if there is no open connection. Concurrent callers
+        share the same connection attempt. Returns the connection."""
+
+        self._ref_counter.increase(ws_url, ref_id)
+        self._cancel_idle_close(ws_url)
+
+        if ws_url in self._conns:
+            raise tornado.gen.Return(self._conns[ws_url])
 
-        with (yield self._lock_conn.acquire()):
-            self._ref_counter.increase(ws_url, ref_id)
+        if ws_url not in self._conn_futures:
+            self._conn_futures[ws_url] = self._open_conn(ws_url)
 
-            if ws_url in self._conns:
-                return
+        try:
+            conn = yield self._conn_futures[ws_url]
+        except Exception:
+            self._ref_counter.decrease(ws_url, ref_id)
+            raise
+
+        raise tornado.gen.Return(conn)
 
-            self._logr.debug("Connecting to <{}>".format(ws_url))
+    @tornado.gen.coroutine
+    def _open_conn(self, ws_url):
+        """Connects to the given URL and starts the message receiving loop."""
+
+        self._logr.debug("Connecting to <{}>".format(ws_url))
 
-            self._conns[ws_url] = yield tornado.websocket.websocket_connect(
+        try:
+            conn = yield tornado.websocket.websocket_connect(
                 ws_url,
-                ping_interval=self._ping_interval)
+                ping_interval=self._ping_interval,
+                compression_options=self._compression.compression_options if self._compression else None)
+        finally:
+            self._conn_futures.pop(ws_url, None)
 
-            @tornado.gen.coroutine
-            def _start_receive_loop():
-                yield self._receive_loop(ws_url)
+        if self._compression:
+            self._compression.tune_client(conn)
 
-            self._receive_stop_events[ws_url] = tornado.locks.Event()
-            tornado.ioloop.IOLoop.current().add_callback(_start_receive_loop)
+        self._conns[ws_url] = conn
+        tornado.ioloop.IOLoop.current().add_callback(self._receive_loop, ws_url, conn)
+
+        raise tornado.gen.Return(conn)
 
-    @tornado.gen.coroutine
     def _stop_conn(self, ws_url, ref_id):
-        """Disconnects the WebSockets connection."""
+        """Removes a reference to the WebSockets connection for the given URL.
+        The connection is closed once it has been idle for the configured timeout."""
 
-        with (yield self._lock_conn.acquire()):
-            self._ref_counter.decrease(ws_url, ref_id)
+        self._ref_counter.decrease(ws_url, ref_id)
 
-            if self._ref_counter.has_any(ws_url):
-                return
+        if self._ref_counter.has_any(ws_url) or ws_url not in self._conns:
+            return
 
-            try:
-                if ws_url in self._conns:
-                    self._logr.debug("Disconnecting WS client: {}".format(ws_url))
-                    yield self._conns[ws_url].close()
-            except Exception as ex:
-                self._logr.warning("Error disconnecting: {}".format(ex), exc_info=True)
+        if self._idle_timeout_secs is None or ws_url in self._idle_handles:
+            return
 
-            if ws_url in self._receive_stop_events:
-                self._logr.debug("Stopping message read loop: {}".format(ws_url))
+        def close_idle():
+            self._idle_handles.pop(ws_url, None)
 
-                self._receive_stop_events[ws_url].set()
+            if not self._ref_counter.has_any(ws_url):
+                self._logr.debug("Disconnecting idle WS client: {}".format(ws_url))
+                self._close_conn(ws_url, Exception("WS connection closed"))
 
-                while self._receive_stop_events[ws_url].is_set():
-                    yield tornado.gen.sleep(self.RECEIVE_LOOP_TERMINATE_SLEEP_SECS)
+        self._idle_handles[ws_url] = tornado.ioloop.IOLoop.current().call_later(
+            self._idle_timeout_secs, close_idle)
 
-                self._receive_stop_events.pop(ws_url)
+    def _cancel_idle_close(self, ws_url):
+        """Cancels the scheduled idle close of the connection for the given URL."""
 
-            self._conns.pop(ws_url, None)
-            self._messages.pop(ws_url, None)
-            self._msg_conditions.pop(ws_url, None)
+        handle = self._idle_handles.pop(ws_url, None)
 
-    @tornado.gen.coroutine
-    def _send_message(self, ws_url, msg_req):
-        """Sends a WebSockets message and returns the condition
-        that will be notified when the response arrives."""
+        if handle is not None:
+            tornado.ioloop.IOLoop.current().remove_timeout(handle)
 
-        if ws_url not in self._conns:
-            self._logr.warning("<{}> is not an active connection".format(ws_url))
+    def _close_conn(self, ws_url, ex):
+        """Closes the connection for the given URL and passes the given error
+        to the pending requests and subscriptions that were using it.
+        The next request to the same URL opens a new connection."""
+
+        self._cancel_idle_close(ws_url)
+        self._send_queues.pop(ws_url, None)
+        conn = self._conns.pop(ws_url, None)
+
+        for future_res in six.itervalues(self._pending.pop(ws_url, {})):
+            if not future_res.done():
+                future_res.set_exception(ex)
+
+        self._abort_subscriptions(ws_url, ex)
+        self._cancelled_requests.pop(ws_url, None)
+
+        if conn is None:
             return
 
-        if ws_url not in self._msg_conditions:
-            self._msg_conditions[ws_url] = {}
+        try:
+            conn.close()
+        except Exception as ex_close:
+            self._logr.warning("Error disconnecting: {}".format(ex_close), exc_info=True)
 
-        if msg_req.id in self._msg_conditions[ws_url]:
-            self._logr.warning("Message condition already exists")
+    def _send_message(self, ws_url, msg_req):
+        """Sends a WebSockets request message and returns the
+        Future that will be resolved when the response arrives."""
+
+        future_res = Future()
+        self._pending.setdefault(ws_url, {})[msg_req.id] = future_res
+        self._write_request(ws_url, msg_req)
+
+        return future_res
+
+    @tornado.gen.coroutine
+    def _write_request(self, ws_url, msg_req):
+        """Writes a request message on the connection for the given URL.
+        Requests are queued and sent in batches if batching is enabled."""
 
-        yield self._conns[ws_url].write_message(msg_req.to_json())
+        if not self._batch_requests:
+            yield self._write_msgs(ws_url, [msg_req])
+            return
 
-        msg_condition = tornado.locks.Condition()
-        self._msg_conditions[ws_url][msg_req.id] = msg_condition
+        if ws_url not in self._send_queues:
+            self._send_queues[ws_url] = []
+            tornado.ioloop.IOLoop.current().add_callback(self._flush_send_queue, ws_url)
 
-        raise tornado.gen.Return(msg_condition)
+        self._send_queues[ws_url].append(msg_req)
 
     @tornado.gen.coroutine
-    def _receive_loop(self, ws_url):
-        """Starts the WebSockets message receiving loop."""
+    def _flush_send_queue(self, ws_url):
+        """Sends all the requests queued for the given URL during the current
+        loop iteration, grouped in a single batch message if there is more than one."""
+
+        yield self._write_msgs(ws_url, self._send_queues.pop(ws_url, []))
 
-        if ws_url not in self._conns:
-            self._logr.warning("<{}> is not an active connection".format(ws_url))
+    @tornado.gen.coroutine
+    def _write_msgs(self, ws_url, msg_reqs):
+        """Writes the given requests in a single message. The requests
+        that are waiting for a response are failed if the write fails."""
+
+        if not len(msg_reqs):
             return
 
-        if ws_url not in self._messages:
-            self._messages[ws_url] = {}
+        if len(msg_reqs) == 1:
+            raw_msg = msg_reqs[0].to_json()
+        else:
+            raw_msg = json.dumps([msg_req.to_dict() for msg_req in msg_reqs])
+
+        try:
+            if ws_url not in self._conns:
+                raise Exception("<{}> is not an active connection".format(ws_url))
 
-        while not self._receive_stop_events[ws_url].is_set():
-            try:
-                raw_res = yield self._conns[ws_url].read_message()
+            yield self._write_raw(self._conns[ws_url], raw_msg)
+        except Exception as ex:
+            self._logr.warning("Error sending message: {}".format(ex), exc_info=True)
+            self._fail_requests(ws_url, msg_reqs, ex)
 
-                self._logr.debug("Read message: {}".format(raw_res))
+    def _write_raw(self, conn, raw_msg):
+        """Writes a raw message on the given connection, skipping
+        compression for messages below the configured minimum size."""
 
-                if raw_res is None:
-                    self._logr.debug("Cannot read message: Closed WS connection")
-                    yield tornado.gen.sleep(self.SLEEP_AFTER_ERR_SECS)
-                    continue
+        if self._compression and not self._compression.should_compress(raw_msg):
+            with self._compression.uncompressed(conn.protocol):
+                return conn.write_message(raw_msg)
+
+        return conn.write_message(raw_msg)
+
+    def _fail_requests(self, ws_url, msg_reqs, ex):
+        """Passes the given error to the requests and subscriptions waiting for the given messages."""
 
-                msg_res = self._parse_msg_response(raw_res)
+        pending = self._pending.get(ws_url, {})
+        subscription_requests = self._subscription_requests.get(ws_url, {})
 
-                if msg_res:
-                    self._messages[ws_url][msg_res.id] = msg_res
-                    conditions = self._msg_conditions.get(ws_url, None)
+        for msg_req in msg_reqs:
+            future_res = pending.pop(msg_req.id, None)
+
+            if future_res and not future_res.done():
+                future_res.set_exception(ex)
+
+            subscription = subscription_requests.pop(msg_req.id, None)
+
+            if subscription:
+                subscription.error(ex)
+
+    @tornado.gen.coroutine
+    def _receive_loop(self, ws_url, conn):
+        """Reads messages from the given connection until it is closed."""
 
-                    if conditions and msg_res.id in conditions:
-                        self._logr.debug("Notifying: {}".format(msg_res.id))
-                        conditions[msg_res.id].notify_all()
+        while True:
+            try:
+                raw_res = yield conn.read_message()
             except Exception as ex:
                 self._logr.warning("Error in read loop: {}".format(ex), exc_info=True)
-                yield tornado.gen.sleep(self.SLEEP_AFTER_ERR_SECS)
+                raw_res = None
+
+            if raw_res is None:
+                break
+
+            self._logr.debug("Read message: {}".format(raw_res))
+
+            try:
+                for msg in self._parse_msgs(raw_res):
+                    self._dispatch_msg(ws_url, msg)
+            except Exception as ex:
+                self._logr.warning("Error dispatching message: {}".format(ex), exc_info=True)
 
-        self._receive_stop_events[ws_url].clear()
+        self._logr.debug("Closed WS connection: {}".format(ws_url))
+
+        if self._conns.get(ws_url, None) is conn:
+            self._close_conn(ws_url, Exception("WS connection closed"))
 
     @classmethod
-    def _parse_msg_response(cls, raw_msg):
-        """Returns a parsed WS Response message instance if
-        the raw message format is valid and has the given ID.
-        Raises Exception if the WS message is an error."""
+    def _parse_msg_response_dict(cls, msg):
+        """Returns a WS Response or Error message instance built
+        from the given parsed message, or None if the message is invalid."""
 
         try:
-            return WebsocketMessageResponse.from_raw(raw_msg)
+            return WebsocketMessageResponse.from_msg(msg)
         except WebsocketMessageException:
             pass
 
         try:
-            return WebsocketMessageError.from_raw(raw_msg)
+            return WebsocketMessageError.from_msg(msg)
         except WebsocketMessageException:
             pass
 
         return None
 
     @classmethod
-    def _parse_emitted_item(cls, raw_msg, sub_id):
-        """Returns a parsed WS Emitted Item message instance if
-        the raw message format is valid and has the given ID.
-        Raises Exception if the WS message is an error."""
+    def _parse_msgs(cls, raw_msg):
+        """Returns the list of WS Response, Error and Emitted Item
+        message instances contained in a single or batch raw message."""
 
         try:
-            msg = WebsocketMessageEmittedItem.from_raw(raw_msg)
+            msg = json.loads(raw_msg)
+        except ValueError:
+            return []
 
-            if msg.subscription_id == sub_id:
-                return msg
-        except WebsocketMessageException:
-            pass
+        msgs = msg if isinstance(msg, list) else [msg]
+        parsed = []
+
+        for item in msgs:
+            msg_parsed = cls._parse_msg_response_dict(item)
+
+            if msg_parsed is None:
+                try:
+                    msg_parsed = WebsocketMessageEmittedItem.from_msg(item)
+                except WebsocketMessageException:
+                    continue
+
+            parsed.append(msg_parsed)
+
+        return parsed
+
+    def _dispatch_msg(self, ws_url, msg):
+        """Routes a message received on the connection for the given URL to the
+        request that is waiting for it or to the subscription that it belongs to."""
+
+        subscriptions = self._subscriptions.get(ws_url, {})
+
+        if isinstance(msg, WebsocketMessageEmittedItem):
+            subscription = subscriptions.get(msg.subscription_id, None)
+
+            if subscription:
+                subscription.next(msg)
+
+            return
+
+        if isinstance(msg, WebsocketMessageError) and msg.id is None:
+            sub_id = msg.data.get("subscription") if isinstance(msg.data, dict) else None
+            subscription = subscriptions.pop(sub_id, None)
+
+            if subscription:
+                subscription.error(Exception(msg.message))
+
+            return
+
+        subscription = self._subscription_requests.get(ws_url, {}).pop(msg.id, None)
+
+        if msg.id in self._cancelled_requests.get(ws_url, set()):
+            self._cancelled_requests[ws_url].discard(msg.id)
+
+            if isinstance(msg, WebsocketMessageResponse):
+                self._dispose_subscription(ws_url, msg.result)
+
+            return
+
+        if subscription and isinstance(msg, WebsocketMessageError):
+            subscription.error(Exception(msg.message))
+        elif subscription:
+            subscription.subscription_id = msg.result
+            self._subscriptions.setdefault(ws_url, {})[msg.result] = subscription
+
+        future_res = self._pending.get(ws_url, {}).pop(msg.id, None)
+
+        if future_res and not future_res.done():
+            future_res.set_result(msg)
+
+    @tornado.gen.coroutine
+    def _dispose_subscription(self, ws_url, sub_id):
+        """Asks the server to dispose the subscription with the given ID."""
+
+        msg_dispose = WebsocketMessageRequest(
+            method=WebsocketMethods.DISPOSE,
+            params={"subscription": sub_id},
+            msg_id=uuid.uuid4().hex)
 
         try:
-            err = WebsocketMessageError.from_raw(raw_msg)
-            err_sub_id = err.data and err.data.get("subscription")
+            yield self._write_request(ws_url, msg_dispose)
+        except Exception as ex:
+            self._logr.debug("Error disposing subscription: {}".format(ex))
 
-            if err_sub_id == sub_id:
-                raise Exception(err.message)
-        except WebsocketMessageException:
-            pass
+    def _abort_subscriptions(self, ws_url, ex):
+        """Passes the given error to all the subscriptions on the connection for the given URL."""
 
-        return None
+        subscriptions = list(self._subscription_requests.pop(ws_url, {}).values())
+        subscriptions.extend(self._subscriptions.pop(ws_url, {}).values())
+
+        for subscription in subscriptions:
+            subscription.error(ex)
 
     @property
     def protocol(self):
@@ -214,71 +416,59 @@ class WebsocketClient(BaseProtocolClient):
 
         return Protocols.WEBSOCKETS
 
-    def _build_subscribe(self, ws_url, msg_req, on_next):
+    def _build_subscribe(self, ws_url, method, params, on_next):
         """Builds the subscribe function that is passed
-        as an argument on the creation of an Observable."""
+        as an argument on the creation of an Observable.
+        Subscriptions share the pooled connection for the given URL."""
 
         def subscribe(observer):
-            """Connect to the WS server and start passing the received events to the Observer."""
+            """Sends the subscription request over the shared WS connection
+            and starts passing the received events to the Observer."""
 
-            future_sub_id = Future()
-            future_ws_conn = Future()
+            ref_id = uuid.uuid4().hex
+            subscription = WebsocketClientSubscription(observer, on_next)
+            state = {"disposed": False}
 
-            def on_error(ex):
-                observer.on_error(ex)
-
-            def on_next_event(raw_msg):
-                sub_id = future_sub_id.result()
+            msg_req = WebsocketMessageRequest(
+                method=method,
+                params=params,
+                msg_id=uuid.uuid4().hex)
 
+            @tornado.gen.coroutine
+            def start():
                 try:
-                    msg_item = self._parse_emitted_item(raw_msg, sub_id)
+                    yield self._init_conn(ws_url, ref_id)
                 except Exception as ex:
-                    return on_error(ex)
-
-                if msg_item is None:
+                    subscription.error(ex)
                     return
 
-                try:
-                    on_next(observer, msg_item)
-                except Exception as ex:
-                    return on_error(ex)
-
-            def parse_subscription_id(raw_msg):
-                msg_res = self._parse_msg_response(raw_msg)
-
-                if isinstance(msg_res, WebsocketMessageError):
-                    return on_error(Exception(msg_res.message))
-
-                if msg_res is None:
+                if state["disposed"]:
+                    self._stop_conn(ws_url, ref_id)
                     return
 
-                sub_id = msg_res.result
-                future_sub_id.set_result(sub_id)
+                self._subscription_requests.setdefault(ws_url, {})[msg_req.id] = subscription
+                yield self._write_request(ws_url, msg_req)
 
-            def on_msg(raw_msg):
-                if raw_msg is None:
-                    return on_error(Exception("WS connection closed"))
+            @tornado.gen.coroutine
+            def stop():
+                sub_id = subscription.subscription_id
 
-                if future_sub_id.done():
-                    on_next_event(raw_msg)
-                else:
-                    parse_subscription_id(raw_msg)
+                if self._subscription_requests.get(ws_url, {}).pop(msg_req.id, None):
+                    # The subscription is disposed when the response arrives
+                    self._cancelled_requests.setdefault(ws_url, set()).add(msg_req.id)
+                elif sub_id is not None and self._subscriptions.get(ws_url, {}).pop(sub_id, None):
+                    yield self._dispose_subscription(ws_url, sub_id)
 
-            def on_conn(ft):
-                try:
-                    ws_conn = ft.result()
-                except Exception as ex:
-                    return on_error(ex)
+                self._stop_conn(ws_url, ref_id)
 
-                future_ws_conn.set_result(ws_conn)
-                ws_conn.write_message(msg_req.to_json())
-
-            tornado.websocket.websocket_connect(ws_url, callback=on_conn, on_message_callback=on_msg)
+            tornado.ioloop.IOLoop.current().add_callback(start)
 
             def unsubscribe():
-                if future_ws_conn.done():
-                    ws_conn = future_ws_conn.result()
-                    ws_conn.close()
+                if state["disposed"]:
+                    return
+
+                state["disposed"] = True
+                tornado.ioloop.IOLoop.current().add_callback(stop)
 
             return unsubscribe
 
@@ -288,109 +478,124 @@ class WebsocketClient(BaseProtocolClient):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
 
-        forms = td.get_forms(name)
+        return WebsocketFormPicker.is_supported_interaction(td, name)
 
-        forms_wss = [
-            form for form in forms
-            if is_scheme_form(form, td.base, WebsocketSchemes.WSS)
-        ]
+    def is_supported_thing_operation(self, td, op):
+        """Returns True if any of the Thing-level Forms for the given
+        operation is supported in this Protocol Binding client."""
 
-        forms_ws = [
-            form for form in forms
-            if is_scheme_form(form, td.base, WebsocketSchemes.WS)
-        ]
+        return WebsocketFormPicker.is_supported_thing_operation(td, op)
 
-        return len(forms_wss) or len(forms_ws)
+    @tornado.gen.coroutine
+    def _request(self, ws_url, method, params, timeout=None):
+        """Sends a request on the pooled connection for the given URL and waits
+        for the response. Raises the error or returns the result from the response."""
 
-    def _raise_message(self, ws_url, msg_id):
-        """Raises the error or return Exception from the message
-        in the internal collection matching the given ID."""
+        ref_id = uuid.uuid4().hex
+        msg_req = WebsocketMessageRequest(method=method, params=params, msg_id=uuid.uuid4().hex)
 
-        assert ws_url in self._messages, "Unknown WS connection"
-        assert msg_id in self._messages[ws_url], "Unknown message ID"
+        yield self._init_conn(ws_url, ref_id)
 
-        msg = self._messages[ws_url][msg_id]
+        try:
+            future_res = self._send_message(ws_url, msg_req)
+
+            if timeout:
+                future_res = tornado.gen.with_timeout(datetime.timedelta(seconds=timeout), future_res)
+
+            msg = yield future_res
+        except tornado.gen.TimeoutError:
+            raise ClientRequestTimeout
+        finally:
+            self._pending.get(ws_url, {}).pop(msg_req.id, None)
+            self._stop_conn(ws_url, ref_id)
 
         if isinstance(msg, WebsocketMessageError):
             raise Exception(msg.message)
-        else:
-            raise tornado.gen.Return(msg.result)
+
+        raise tornado.gen.Return(msg.result)
 
     @tornado.gen.coroutine
-    def invoke_action(self, td, name, input_value, timeout=None):
-        """Invokes an Action on a remote Thing.
-        Returns a Future."""
+    def read_multiple_properties(self, td, names=None, timeout=None):
+        """Reads the values of multiple Properties on a remote Thing in a single request.
+        All Properties are read if names is None.
+        Returns a Future that resolves with a dict of values by Property name."""
 
-        if name not in td.actions:
-            raise FormNotFoundException()
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None \
+            else InteractionVerbs.READ_MULTIPLE_PROPERTIES
 
-        form = pick_form(
-            td, td.get_action_forms(name),
-            WebsocketSchemes.list())
+        form = WebsocketFormPicker.pick_form(td, td.get_thing_forms(), op=op)
 
         if not form:
             raise FormNotFoundException()
 
         ws_url = form.resolve_uri(td.base)
-        ref_id = uuid.uuid4().hex
+        params = {} if names is None else {"names": list(names)}
 
-        try:
-            yield self._init_conn(ws_url, ref_id)
+        result = yield self._request(
+            ws_url, WebsocketMethods.READ_MULTIPLE_PROPERTIES,
+            params, timeout=timeout)
 
-            msg_req = WebsocketMessageRequest(
-                method=WebsocketMethods.INVOKE_ACTION,
-                params={"name": name, "parameters": input_value},
-                msg_id=uuid.uuid4().hex)
+        raise tornado.gen.Return(result)
 
-            condition = yield self._send_message(ws_url, msg_req)
+    @tornado.gen.coroutine
+    def write_multiple_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing in a single request.
+        Returns a Future."""
+
+        form = WebsocketFormPicker.pick_form(
+            td, td.get_thing_forms(),
+            op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
 
-            timeout = datetime.timedelta(seconds=timeout) if timeout else None
-            cond_res = yield condition.wait(timeout=timeout)
+        if not form:
+            raise FormNotFoundException()
 
-            if not cond_res:
-                raise ClientRequestTimeout
+        ws_url = form.resolve_uri(td.base)
 
-            self._raise_message(ws_url, msg_req.id)
-        finally:
-            yield self._stop_conn(ws_url, ref_id)
+        yield self._request(
+            ws_url, WebsocketMethods.WRITE_MULTIPLE_PROPERTIES,
+            {"values": values}, timeout=timeout)
 
     @tornado.gen.coroutine
-    def write_property(self, td, name, value, timeout=None):
-        """Updates the value of a Property on a remote Thing.
+    def invoke_action(self, td, name, input_value, timeout=None):
+        """Invokes an Action on a remote Thing.
         Returns a Future."""
 
-        if name not in td.properties:
+        if name not in td.actions:
             raise FormNotFoundException()
 
-        form = pick_form(
-            td, td.get_property_forms(name),
-            WebsocketSchemes.list())
+        form = WebsocketFormPicker.pick_form(td, td.get_action_forms(name))
 
         if not form:
             raise FormNotFoundException()
 
         ws_url = form.resolve_uri(td.base)
-        ref_id = uuid.uuid4().hex
 
-        try:
-            yield self._init_conn(ws_url, ref_id)
+        result = yield self._request(
+            ws_url, WebsocketMethods.INVOKE_ACTION,
+            {"name": name, "parameters": input_value}, timeout=timeout)
 
-            msg_req = WebsocketMessageRequest(
-                method=WebsocketMethods.WRITE_PROPERTY,
-                params={"name": name, "value": value},
-                msg_id=uuid.uuid4().hex)
+        raise tornado.gen.Return(result)
+
+    @tornado.gen.coroutine
+    def write_property(self, td, name, value, timeout=None):
+        """Updates the value of a Property on a remote Thing.
+        Returns a Future."""
 
-            condition = yield self._send_message(ws_url, msg_req)
+        if name not in td.properties:
+            raise FormNotFoundException()
 
-            timeout = datetime.timedelta(seconds=timeout) if timeout else None
-            cond_res = yield condition.wait(timeout=timeout)
+        form = WebsocketFormPicker.pick_form(td, td.get_property_forms(name))
 
-            if not cond_res:
-                raise ClientRequestTimeout
+        if not form:
+            raise FormNotFoundException()
 
-            self._raise_message(ws_url, msg_req.id)
-        finally:
-            yield self._stop_conn(ws_url, ref_id)
+        ws_url = form.resolve_uri(td.base)
+
+        result = yield self._request(
+            ws_url, WebsocketMethods.WRITE_PROPERTY,
+            {"name": name, "value": value}, timeout=timeout)
+
+        raise tornado.gen.Return(result)
 
     @tornado.gen.coroutine
     def read_property(self, td, name, timeout=None):
@@ -400,35 +605,18 @@ class WebsocketClient(BaseProtocolClient):
         if name not in td.properties:
             raise FormNotFoundException()
 
-        form = pick_form(
-            td, td.get_property_forms(name),
-            WebsocketSchemes.list())
+        form = WebsocketFormPicker.pick_form(td, td.get_property_forms(name))
 
         if not form:
             raise FormNotFoundException()
 
         ws_url = form.resolve_uri(td.base)
-        ref_id = uuid.uuid4().hex
 
-        try:
-            yield self._init_conn(ws_url, ref_id)
+        result = yield self._request(
+            ws_url, WebsocketMethods.READ_PROPERTY,
+            {"name": name}, timeout=timeout)
 
-            msg_req = WebsocketMessageRequest(
-                method=WebsocketMethods.READ_PROPERTY,
-                params={"name": name},
-                msg_id=uuid.uuid4().hex)
-
-            condition = yield self._send_message(ws_url, msg_req)
-
-            timeout = datetime.timedelta(seconds=timeout) if timeout else None
-            cond_res = yield condition.wait(timeout=timeout)
-
-            if not cond_res:
-                raise ClientRequestTimeout
-
-            self._raise_message(ws_url, msg_req.id)
-        finally:
-            yield self._stop_conn(ws_url, ref_id)
+        raise tornado.gen.Return(result)
 
     def on_event(self, td, name):
         """Subscribes to an event on a remote Thing.
@@ -438,9 +626,7 @@ class WebsocketClient(BaseProtocolClient):
             # noinspection PyUnresolvedReferences
             return Observable.throw(FormNotFoundException())
 
-        form = pick_form(
-            td, td.get_event_forms(name),
-            WebsocketSchemes.list())
+        form = WebsocketFormPicker.pick_form(td, td.get_event_forms(name))
 
         if not form:
             # noinspection PyUnresolvedReferences
@@ -448,15 +634,10 @@ class WebsocketClient(BaseProtocolClient):
 
         ws_url = form.resolve_uri(td.base)
 
-        msg_req = WebsocketMessageRequest(
-            method=WebsocketMethods.ON_EVENT,
-            params={"name": name},
-            msg_id=uuid.uuid4().hex)
-
         def on_next(observer, msg_item):
             observer.on_next(EmittedEvent(init=msg_item.data, name=name))
 
-        subscribe = self._build_subscribe(ws_url, msg_req, on_next)
+        subscribe = self._build_subscribe(ws_url, WebsocketMethods.ON_EVENT, {"name": name}, on_next)
 
         # noinspection PyUnresolvedReferences
         return Observable.create(subscribe)
@@ -469,9 +650,7 @@ class WebsocketClient(BaseProtocolClient):
             # noinspection PyUnresolvedReferences
             return Observable.throw(FormNotFoundException())
 
-        form = pick_form(
-            td, td.get_property_forms(name),
-            WebsocketSchemes.list())
+        form = WebsocketFormPicker.pick_form(td, td.get_property_forms(name))
 
         if not form:
             # noinspection PyUnresolvedReferences
@@ -479,18 +658,13 @@ class WebsocketClient(BaseProtocolClient):
 
         ws_url = form.resolve_uri(td.base)
 
-        msg_req = WebsocketMessageRequest(
-            method=WebsocketMethods.ON_PROPERTY_CHANGE,
-            params={"name": name},
-            msg_id=uuid.uuid4().hex)
-
         def on_next(observer, msg_item):
             init_name = msg_item.data["name"]
             init_value = msg_item.data["value"]
             init = PropertyChangeEventInit(name=init_name, value=init_value)
             observer.on_next(PropertyChangeEmittedEvent(init=init))
 
-        subscribe = self._build_subscribe(ws_url, msg_req, on_next)
+        subscribe = self._build_subscribe(ws_url, WebsocketMethods.ON_PROPERTY_CHANGE, {"name": name}, on_next)
 
         # noinspection PyUnresolvedReferences
         return Observable.create(subscribe)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Settings for the permessage-deflate WebSockets extension.
+"""
+
+import contextlib
+import logging
+import zlib
+
+import tornado
+import tornado.websocket
+
+
+class WebsocketCompression(object):
+    """permessage-deflate settings shared by the WebSockets server and client.
+    Compression is negotiated per connection during the opening handshake and
+    messages shorter than min_size bytes are sent uncompressed.
+    Skipping compression per message and tuning the client compressor rely on
+    private Tornado attributes, so both are only enabled on the Tornado versions
+    in TORNADO_INTERNALS_VERSIONS (all messages are compressed with the default
+    client settings otherwise)."""
+
+    DEFAULT_LEVEL = zlib.Z_DEFAULT_COMPRESSION
+    DEFAULT_MEM_LEVEL = 8
+    DEFAULT_MIN_SIZE = 0
+    TORNADO_INTERNALS_VERSIONS = ((5, 0), (7, 0))
+
+    def __init__(self, level=DEFAULT_LEVEL, mem_level=DEFAULT_MEM_LEVEL, min_size=DEFAULT_MIN_SIZE):
+        if level != zlib.Z_DEFAULT_COMPRESSION and not 0 <= level <= 9:
+            raise ValueError("Invalid compression level: {}".format(level))
+
+        if not 1 <= mem_level <= 9:
+            raise ValueError("Invalid memory level: {}".format(mem_level))
+
+        if min_size < 0:
+            raise ValueError("Invalid minimum size: {}".format(min_size))
+
+        self.level = level
+        self.mem_level = mem_level
+        self.min_size = min_size
+        self._logr = logging.getLogger(__name__)
+
+    @classmethod
+    def supports_tornado_internals(cls):
+        """Returns True if the installed Tornado version exposes
+        the private compressor attributes used by this class."""
+
+        version_min, version_max = cls.TORNADO_INTERNALS_VERSIONS
+
+        if not version_min <= tuple(tornado.version_info[:2]) < version_max:
+            return False
+
+        compressor_cls = getattr(tornado.websocket, "_PerMessageDeflateCompressor", None)
+
+        return compressor_cls is not None and hasattr(compressor_cls, "_create_compressor")
+
+    @property
+    def compression_options(self):
+        """Compression options in the format expected by Tornado."""
+
+        return {
+            "compression_level": self.level,
+            "mem_level": self.mem_level
+        }
+
+    def should_compress(self, message):
+        """Returns True if the given message is long enough to be compressed."""
+
+        return len(message) >= self.min_size
+
+    @contextlib.contextmanager
+    def uncompressed(self, protocol):
+        """Context manager that disables compression on the given Tornado
+        WebSockets protocol instance for the writes done in its scope.
+        RFC 7692 allows uncompressed frames on connections that negotiated the extension."""
+
+        compressor = getattr(protocol, "_compressor", None) \
+            if self.supports_tornado_internals() else None
+
+        if compressor is None:
+            yield
+            return
+
+        protocol._compressor = None
+
+        try:
+            yield
+        finally:
+            protocol._compressor = compressor
+
+    def tune_client(self, conn):
+        """Applies the compression and memory levels to a client connection.
+        Tornado ignores the compression options on the client side, so the
+        compressor negotiated in the handshake is rebuilt with these settings."""
+
+        if not self.supports_tornado_internals():
+            self._logr.warning("Client compression settings not supported on Tornado {}".format(
+                tornado.version))
+            return
+
+        compressor = getattr(conn.protocol, "_compressor", None)
+
+        if compressor is None:
+            return
+
+        try:
+            compressor._compression_level = self.level
+            compressor._mem_level = self.mem_level
+
+            if compressor._compressor is not None:
+                compressor._compressor = compressor._create_compressor()
+        except AttributeError as ex:
+            self._logr.warning("Unable to apply client compression settings: {}".format(ex))
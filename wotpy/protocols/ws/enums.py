@@ -13,6 +13,8 @@ class WebsocketMethods(EnumListMixin):
 
     READ_PROPERTY = "read_property"
     WRITE_PROPERTY = "write_property"
+    READ_MULTIPLE_PROPERTIES = "read_multiple_properties"
+    WRITE_MULTIPLE_PROPERTIES = "write_multiple_properties"
     INVOKE_ACTION = "invoke_action"
     ON_PROPERTY_CHANGE = "on_property_change"
     ON_TD_CHANGE = "on_td_change"
@@ -36,3 +38,12 @@ class WebsocketSchemes(EnumListMixin):
 
     WS = "ws"
     WSS = "wss"
+
+
+class WebsocketOverflowPolicies(EnumListMixin):
+    """Enumeration of policies applied to emitted items
+    when the send queue of a connection overflows."""
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    CLOSE = "close"
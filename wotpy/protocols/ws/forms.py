@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Form selection rules of the WebSockets client.
+"""
+
+from wotpy.protocols.forms import BaseFormPicker
+from wotpy.protocols.ws.enums import WebsocketSchemes
+
+
+class WebsocketFormPicker(BaseFormPicker):
+    """Picks WebSockets Forms in the order of the WebsocketSchemes enum."""
+
+    SCHEMES = WebsocketSchemes.list()
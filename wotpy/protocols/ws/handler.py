@@ -5,27 +5,29 @@
 Class that handles incoming WebSockets messages.
 """
 
+import json
 import uuid
 
-from jsonschema import validate, ValidationError
+import six
 from rx.concurrency import IOLoopScheduler
 from tornado import websocket, gen
 
 from wotpy.protocols.ws.enums import WebsocketMethods, WebsocketErrors
+from wotpy.protocols.ws.queue import WebsocketSendQueue
 from wotpy.protocols.ws.messages import \
     WebsocketMessageRequest, \
     WebsocketMessageException, \
+    WebsocketMessageParamsException, \
     WebsocketMessageError, \
     WebsocketMessageResponse, \
     WebsocketMessageEmittedItem
-from wotpy.protocols.ws.schemas import \
-    SCHEMA_PARAMS_READ_PROPERTY, \
-    SCHEMA_PARAMS_WRITE_PROPERTY, \
-    SCHEMA_PARAMS_DISPOSE, \
-    SCHEMA_PARAMS_INVOKE_ACTION, \
-    SCHEMA_PARAMS_ON_PROPERTY_CHANGE, \
-    SCHEMA_PARAMS_ON_TD_CHANGE, \
-    SCHEMA_PARAMS_ON_EVENT
+
+
+def _encode_emitted_item_body(emitted_event):
+    """Encodes the part of the emitted item messages that
+    is shared by all the subscriptions to an emission."""
+
+    return WebsocketMessageEmittedItem.build_body_json(emitted_event.name, emitted_event.json_data)
 
 
 # noinspection PyAbstractClass
@@ -36,14 +38,40 @@ class WebsocketHandler(websocket.WebSocketHandler):
 
     POLICY_VIOLATION_CODE = 1008
     POLICY_VIOLATION_REASON = "Not found"
+    OVERFLOW_CLOSE_REASON = "Send queue overflow"
 
     def __init__(self, *args, **kwargs):
         self._server = kwargs.pop("websocket_server", None)
         self._scheduler = IOLoopScheduler()
         self._subscriptions = {}
+        self._pending_subscriptions = {}
         self._exposed_thing_name = None
+        self._send_queue = self._build_send_queue()
         super(WebsocketHandler, self).__init__(*args, **kwargs)
 
+    def _build_send_queue(self):
+        """Builds the outbound message queue of this connection
+        with the send queue settings of the parent server."""
+
+        queue_kwargs = self._server.send_queue_kwargs if self._server else {}
+
+        return WebsocketSendQueue(
+            write=self.write_message,
+            close=lambda: self.close(self.POLICY_VIOLATION_CODE, self.OVERFLOW_CLOSE_REASON),
+            **queue_kwargs)
+
+    @property
+    def send_queue(self):
+        """Outbound message queue of this connection."""
+
+        return self._send_queue
+
+    @property
+    def exposed_thing_name(self):
+        """URL name of the ExposedThing served by this connection."""
+
+        return self._exposed_thing_name
+
     @property
     def exposed_thing(self):
         """Exposed thing property.
@@ -65,6 +93,26 @@ class WebsocketHandler(websocket.WebSocketHandler):
 
         return True
 
+    def get_compression_options(self):
+        """Returns the permessage-deflate options of the parent server.
+        Compression is disabled if the server has no compression settings."""
+
+        compression = self._server.compression if self._server else None
+
+        return compression.compression_options if compression else None
+
+    def write_message(self, message, binary=False):
+        """Sends the given message to the client, skipping compression
+        for messages below the minimum size of the server settings."""
+
+        compression = self._server.compression if self._server else None
+
+        if compression and self.ws_connection and not compression.should_compress(message):
+            with compression.uncompressed(self.ws_connection):
+                return super(WebsocketHandler, self).write_message(message, binary=binary)
+
+        return super(WebsocketHandler, self).write_message(message, binary=binary)
+
     def open(self, name):
         """Called when the WebSockets connection is opened."""
 
@@ -73,6 +121,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         try:
             self._server.get_exposed_thing(name)
             self._exposed_thing_name = name
+            self._server.add_handler(self)
         except ValueError:
             self.close(self.POLICY_VIOLATION_CODE, self.POLICY_VIOLATION_REASON)
 
@@ -80,7 +129,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
         """Builds an error message instance and sends it to the client."""
 
         err = WebsocketMessageError(message=message, code=code, data=data, msg_id=msg_id)
-        self.write_message(err.to_json())
+        self._send_queue.put(err.to_json())
 
     def _dispose_subscription(self, subscription_id):
         """Takes a subscription ID and destroys the related subscription."""
@@ -100,12 +149,10 @@ class WebsocketHandler(websocket.WebSocketHandler):
         """Default next callback for Observable subscriptions."""
 
         try:
-            msg = WebsocketMessageEmittedItem(
-                subscription_id=subscription_id,
-                name=item.name,
-                data=item.data)
-            self.write_message(msg.to_json())
-        except WebsocketMessageException as ex:
+            body_json = item.encode_once(_encode_emitted_item_body)
+            raw_msg = WebsocketMessageEmittedItem.build_json(subscription_id, body_json)
+            self._send_queue.put(raw_msg, subscription_id=subscription_id)
+        except ValueError as ex:
             self._on_subscription_error(subscription_id, ex)
 
     def _on_subscription_completed(self, subscription_id):
@@ -123,26 +170,40 @@ class WebsocketHandler(websocket.WebSocketHandler):
 
         self._subscriptions[subscription_id] = subscription
 
+    def _add_pending_subscription(self, observable):
+        """Registers a subscription to the given Observable that will be
+        started once the response with the subscription ID has been written."""
+
+        subscription_id = str(uuid.uuid4())
+        self._pending_subscriptions[subscription_id] = observable
+
+        return subscription_id
+
+    def _start_pending_subscriptions(self, responses):
+        """Starts the pending subscriptions whose IDs were sent in the given responses."""
+
+        for res in responses:
+            if not isinstance(res, WebsocketMessageResponse) or not isinstance(res.result, six.string_types):
+                continue
+
+            observable = self._pending_subscriptions.pop(res.result, None)
+
+            if observable is not None:
+                self._subscribe(res.result, observable)
+
     @gen.coroutine
     def _handle_get_property(self, req):
         """Handler for the 'get_property' method."""
 
         params = req.params
 
-        try:
-            validate(params, SCHEMA_PARAMS_READ_PROPERTY)
-        except ValidationError as ex:
-            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
-            return
-
         try:
             prop_value = yield self.exposed_thing.read_property(name=params["name"])
         except Exception as ex:
-            self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
-            return
+            raise gen.Return(WebsocketMessageError(
+                message=str(ex), code=WebsocketErrors.INTERNAL_ERROR, msg_id=req.id))
 
-        res = WebsocketMessageResponse(result=prop_value, msg_id=req.id)
-        self.write_message(res.to_json())
+        raise gen.Return(WebsocketMessageResponse(result=prop_value, msg_id=req.id))
 
     @gen.coroutine
     def _handle_set_property(self, req):
@@ -151,19 +212,42 @@ class WebsocketHandler(websocket.WebSocketHandler):
         params = req.params
 
         try:
-            validate(params, SCHEMA_PARAMS_WRITE_PROPERTY)
-        except ValidationError as ex:
-            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
-            return
+            yield self.exposed_thing.write_property(name=params["name"], value=params["value"])
+        except Exception as ex:
+            raise gen.Return(WebsocketMessageError(
+                message=str(ex), code=WebsocketErrors.INTERNAL_ERROR, msg_id=req.id))
+
+        raise gen.Return(WebsocketMessageResponse(result=None, msg_id=req.id))
+
+    @gen.coroutine
+    def _handle_read_multiple_properties(self, req):
+        """Handler for the 'read_multiple_properties' method.
+        All Properties are read if the 'names' param is missing."""
+
+        names = req.params.get("names", None)
 
         try:
-            yield self.exposed_thing.write_property(name=params["name"], value=params["value"])
+            if names is None:
+                values = yield self.exposed_thing.read_all_properties()
+            else:
+                values = yield self.exposed_thing.read_multiple_properties(names)
         except Exception as ex:
-            self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
-            return
+            raise gen.Return(WebsocketMessageError(
+                message=str(ex), code=WebsocketErrors.INTERNAL_ERROR, msg_id=req.id))
+
+        raise gen.Return(WebsocketMessageResponse(result=values, msg_id=req.id))
+
+    @gen.coroutine
+    def _handle_write_multiple_properties(self, req):
+        """Handler for the 'write_multiple_properties' method."""
+
+        try:
+            yield self.exposed_thing.write_multiple_properties(req.params["values"])
+        except Exception as ex:
+            raise gen.Return(WebsocketMessageError(
+                message=str(ex), code=WebsocketErrors.INTERNAL_ERROR, msg_id=req.id))
 
-        res = WebsocketMessageResponse(result=None, msg_id=req.id)
-        self.write_message(res.to_json())
+        raise gen.Return(WebsocketMessageResponse(result=None, msg_id=req.id))
 
     @gen.coroutine
     def _handle_invoke_action(self, req):
@@ -171,84 +255,43 @@ class WebsocketHandler(websocket.WebSocketHandler):
 
         params = req.params
 
-        try:
-            validate(params, SCHEMA_PARAMS_INVOKE_ACTION)
-        except ValidationError as ex:
-            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
-            return
-
         try:
             input_value = params.get("parameters")
             action_result = yield self.exposed_thing.invoke_action(params["name"], input_value)
         except Exception as ex:
-            self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
-            return
+            raise gen.Return(WebsocketMessageError(
+                message=str(ex), code=WebsocketErrors.INTERNAL_ERROR, msg_id=req.id))
 
-        res = WebsocketMessageResponse(result=action_result, msg_id=req.id)
-        self.write_message(res.to_json())
+        raise gen.Return(WebsocketMessageResponse(result=action_result, msg_id=req.id))
 
     @gen.coroutine
     def _handle_on_property_change(self, req):
         """Handler for the 'on_property_change' subscription method."""
 
         params = req.params
-
-        try:
-            validate(params, SCHEMA_PARAMS_ON_PROPERTY_CHANGE)
-        except ValidationError as ex:
-            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
-            return
-
-        subscription_id = str(uuid.uuid4())
-
-        res = WebsocketMessageResponse(result=subscription_id, msg_id=req.id)
-        self.write_message(res.to_json())
-
         observable = self.exposed_thing.on_property_change(name=params["name"])
+        subscription_id = self._add_pending_subscription(observable)
 
-        self._subscribe(subscription_id, observable)
+        raise gen.Return(WebsocketMessageResponse(result=subscription_id, msg_id=req.id))
 
     @gen.coroutine
     def _handle_on_td_change(self, req):
         """Handler for the 'on_td_change' subscription method."""
 
-        params = req.params
-
-        try:
-            validate(params, SCHEMA_PARAMS_ON_TD_CHANGE)
-        except ValidationError as ex:
-            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
-            return
-
-        subscription_id = str(uuid.uuid4())
-
-        res = WebsocketMessageResponse(result=subscription_id, msg_id=req.id)
-        self.write_message(res.to_json())
-
         observable = self.exposed_thing.on_td_change()
+        subscription_id = self._add_pending_subscription(observable)
 
-        self._subscribe(subscription_id, observable)
+        raise gen.Return(WebsocketMessageResponse(result=subscription_id, msg_id=req.id))
 
     @gen.coroutine
     def _handle_on_event(self, req):
         """Handler for the 'on_event' subscription method."""
 
         params = req.params
-
-        try:
-            validate(params, SCHEMA_PARAMS_ON_EVENT)
-        except ValidationError as ex:
-            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
-            return
-
-        subscription_id = str(uuid.uuid4())
-
-        res = WebsocketMessageResponse(result=subscription_id, msg_id=req.id)
-        self.write_message(res.to_json())
-
         observable = self.exposed_thing.on_event(name=params["name"])
+        subscription_id = self._add_pending_subscription(observable)
 
-        self._subscribe(subscription_id, observable)
+        raise gen.Return(WebsocketMessageResponse(result=subscription_id, msg_id=req.id))
 
     @gen.coroutine
     def _handle_dispose(self, req):
@@ -256,12 +299,6 @@ class WebsocketHandler(websocket.WebSocketHandler):
 
         params = req.params
 
-        try:
-            validate(params, SCHEMA_PARAMS_DISPOSE)
-        except ValidationError as ex:
-            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
-            return
-
         result = None
         subscription_id = params["subscription"]
 
@@ -269,17 +306,21 @@ class WebsocketHandler(websocket.WebSocketHandler):
             self._dispose_subscription(subscription_id)
             result = subscription_id
 
-        res = WebsocketMessageResponse(result=result, msg_id=req.id)
-        self.write_message(res.to_json())
+        if self._pending_subscriptions.pop(subscription_id, None) is not None:
+            result = subscription_id
+
+        raise gen.Return(WebsocketMessageResponse(result=result, msg_id=req.id))
 
     @gen.coroutine
     def _handle(self, req):
-        """Takes a WebsocketMessageRequest instance and routes
-        the request to the required method handler."""
+        """Takes a WebsocketMessageRequest instance, routes the request
+        to the required method handler and returns the response message."""
 
         handler_map = {
             WebsocketMethods.READ_PROPERTY: self._handle_get_property,
             WebsocketMethods.WRITE_PROPERTY: self._handle_set_property,
+            WebsocketMethods.READ_MULTIPLE_PROPERTIES: self._handle_read_multiple_properties,
+            WebsocketMethods.WRITE_MULTIPLE_PROPERTIES: self._handle_write_multiple_properties,
             WebsocketMethods.INVOKE_ACTION: self._handle_invoke_action,
             WebsocketMethods.ON_PROPERTY_CHANGE: self._handle_on_property_change,
             WebsocketMethods.ON_TD_CHANGE: self._handle_on_td_change,
@@ -288,25 +329,77 @@ class WebsocketHandler(websocket.WebSocketHandler):
         }
 
         if req.method not in handler_map:
-            self._write_error("Unimplemented method", WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
-            return
+            raise gen.Return(WebsocketMessageError(
+                message="Unimplemented method", code=WebsocketErrors.INTERNAL_ERROR, msg_id=req.id))
 
         handler = handler_map[req.method]
-        yield handler(req)
+        res = yield handler(req)
+
+        raise gen.Return(res)
+
+    @gen.coroutine
+    def _process(self, msg):
+        """Processes a parsed request message and returns the response message."""
+
+        try:
+            req = WebsocketMessageRequest.from_msg(msg)
+        except WebsocketMessageParamsException as ex:
+            raise gen.Return(WebsocketMessageError(
+                message=str(ex), code=WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=ex.msg_id))
+        except WebsocketMessageException as ex:
+            raise gen.Return(WebsocketMessageError(
+                message=str(ex), code=WebsocketErrors.INTERNAL_ERROR))
+
+        res = yield self._handle(req)
+
+        raise gen.Return(res)
+
+    @gen.coroutine
+    def _process_single(self, msg):
+        """Processes a single request message and writes the response."""
+
+        res = yield self._process(msg)
+        self._send_queue.put(res.to_json())
+        self._start_pending_subscriptions([res])
+
+    @gen.coroutine
+    def _process_batch(self, msgs):
+        """Processes all the requests in a batch concurrently
+        and writes the responses in a single batch message."""
+
+        if not len(msgs):
+            self._write_error("Empty batch", WebsocketErrors.INVALID_REQUEST)
+            return
+
+        responses = yield [self._process(msg) for msg in msgs]
+        self._send_queue.put(json.dumps([res.to_dict() for res in responses]))
+        self._start_pending_subscriptions(responses)
 
     @gen.coroutine
     def on_message(self, message):
         """Called each time the server receives a WebSockets message.
+        Messages may contain a single request or a batch (array) of requests.
         All messages that do not conform to the protocol are discarded."""
 
         try:
-            req = WebsocketMessageRequest.from_raw(message)
-            gen.convert_yielded(self._handle(req))
-        except WebsocketMessageException as ex:
+            msg = json.loads(message)
+        except Exception as ex:
             self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR)
+            return
+
+        if isinstance(msg, list):
+            gen.convert_yielded(self._process_batch(msg))
+        else:
+            gen.convert_yielded(self._process_single(msg))
 
     def on_close(self):
         """Called when the WebSockets connection is closed."""
 
+        self._pending_subscriptions = {}
+        self._send_queue.clear()
+
+        if self._server:
+            self._server.remove_handler(self)
+
         for subscription_id in list(self._subscriptions.keys()):
             self._dispose_subscription(subscription_id)
@@ -7,18 +7,29 @@ Classes that represent JSON-RPC messages exchanged over WebSockets.
 
 import json
 
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 
 from wotpy.protocols.ws.enums import WebsocketErrors
-from wotpy.protocols.ws.schemas import \
-    SCHEMA_REQUEST, \
-    SCHEMA_RESPONSE, \
-    SCHEMA_EMITTED_ITEM, \
-    SCHEMA_ERROR, \
-    JSON_RPC_VERSION
+from wotpy.protocols.ws.schemas import JSON_RPC_VERSION
+from wotpy.protocols.ws.validation import \
+    validate_request, \
+    validate_response, \
+    validate_error, \
+    validate_emitted_item, \
+    is_params_error
 from wotpy.utils.utils import to_json_obj
 
 
+def _load_json(raw_msg):
+    """Parses a raw WebSockets message.
+    Raises WebsocketMessageException if the message is not valid JSON."""
+
+    try:
+        return json.loads(raw_msg)
+    except Exception as ex:
+        raise WebsocketMessageException(str(ex))
+
+
 def parse_ws_message(raw_msg):
     """Takes a raw WebSockets message and attempts
     to parse it to create a message instance."""
@@ -46,6 +57,15 @@ class WebsocketMessageException(Exception):
     pass
 
 
+class WebsocketMessageParamsException(WebsocketMessageException):
+    """Exception raised when the envelope of a WS request is
+    valid but the params are invalid for the requested method."""
+
+    def __init__(self, message, msg_id=None):
+        super(WebsocketMessageParamsException, self).__init__(message)
+        self.msg_id = msg_id
+
+
 class WebsocketMessageRequest(object):
     """Represents a message received on a websocket that
     contains a JSON-RPC WoT action request."""
@@ -55,26 +75,39 @@ class WebsocketMessageRequest(object):
         """Builds a new WebsocketMessageRequest instance from a raw socket message.
         Raises WebsocketMessageException if the message is invalid."""
 
+        return cls.from_msg(_load_json(raw_msg))
+
+    @classmethod
+    def from_msg(cls, msg):
+        """Builds a new WebsocketMessageRequest instance from an already parsed message.
+        Raises WebsocketMessageException if the message is invalid."""
+
         try:
-            msg = json.loads(raw_msg)
-            validate(msg, SCHEMA_REQUEST)
-
-            return WebsocketMessageRequest(
-                method=msg["method"],
-                params=msg["params"],
-                msg_id=msg.get("id", None))
-        except Exception as ex:
+            validate_request(msg)
+        except ValidationError as ex:
+            if is_params_error(ex):
+                raise WebsocketMessageParamsException(str(ex), msg_id=msg.get("id", None))
+
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, method, params, msg_id=None):
+        return WebsocketMessageRequest(
+            method=msg["method"],
+            params=msg["params"],
+            msg_id=msg.get("id", None),
+            validate=False)
+
+    def __init__(self, method, params, msg_id=None, validate=True):
         self.method = method
         self.params = params
         self.msg_id = msg_id
 
+        if not validate:
+            return
+
         try:
-            validate(self.to_dict(), SCHEMA_REQUEST)
+            validate_request(self.to_dict())
         except ValidationError as ex:
-            raise WebsocketMessageError(str(ex))
+            raise WebsocketMessageException(str(ex))
 
     @property
     def id(self):
@@ -108,24 +141,34 @@ class WebsocketMessageResponse(object):
         """Builds a new WebsocketMessageResponse instance from a raw socket message.
         Raises WebsocketMessageException if the message is invalid."""
 
-        try:
-            msg = json.loads(raw_msg)
-            validate(msg, SCHEMA_RESPONSE)
+        return cls.from_msg(_load_json(raw_msg))
+
+    @classmethod
+    def from_msg(cls, msg):
+        """Builds a new WebsocketMessageResponse instance from an already parsed message.
+        Raises WebsocketMessageException if the message is invalid."""
 
-            return WebsocketMessageResponse(
-                result=msg["result"],
-                msg_id=msg.get("id", None))
-        except Exception as ex:
+        try:
+            validate_response(msg)
+        except ValidationError as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, result, msg_id=None):
+        return WebsocketMessageResponse(
+            result=msg["result"],
+            msg_id=msg.get("id", None),
+            validate=False)
+
+    def __init__(self, result, msg_id=None, validate=True):
         self.result = result
         self.msg_id = msg_id
 
+        if not validate:
+            return
+
         try:
-            validate(self.to_dict(), SCHEMA_RESPONSE)
+            validate_response(self.to_dict())
         except ValidationError as ex:
-            raise WebsocketMessageError(str(ex))
+            raise WebsocketMessageException(str(ex))
 
     @property
     def id(self):
@@ -158,28 +201,38 @@ class WebsocketMessageError(object):
         """Builds a new WebsocketMessageError instance from a raw socket message.
         Raises WebsocketMessageException if the message is invalid."""
 
+        return cls.from_msg(_load_json(raw_msg))
+
+    @classmethod
+    def from_msg(cls, msg):
+        """Builds a new WebsocketMessageError instance from an already parsed message.
+        Raises WebsocketMessageException if the message is invalid."""
+
         try:
-            msg = json.loads(raw_msg)
-            validate(msg, SCHEMA_ERROR)
-
-            return WebsocketMessageError(
-                message=msg["error"]["message"],
-                code=msg["error"]["code"],
-                data=msg["error"].get("data", None),
-                msg_id=msg.get("id", None))
-        except Exception as ex:
+            validate_error(msg)
+        except ValidationError as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, message, code=WebsocketErrors.INTERNAL_ERROR, data=None, msg_id=None):
+        return WebsocketMessageError(
+            message=msg["error"]["message"],
+            code=msg["error"]["code"],
+            data=msg["error"].get("data", None),
+            msg_id=msg.get("id", None),
+            validate=False)
+
+    def __init__(self, message, code=WebsocketErrors.INTERNAL_ERROR, data=None, msg_id=None, validate=True):
         self.message = message
         self.msg_id = msg_id
         self.code = code
         self.data = data
 
+        if not validate:
+            return
+
         try:
-            validate(self.to_dict(), SCHEMA_ERROR)
+            validate_error(self.to_dict())
         except ValidationError as ex:
-            raise WebsocketMessageError(str(ex))
+            raise WebsocketMessageException(str(ex))
 
     @property
     def id(self):
@@ -216,26 +269,36 @@ class WebsocketMessageEmittedItem(object):
         """Builds a new WebsocketMessageEmittedItem instance from a raw socket message.
         Raises WebsocketMessageException if the message is invalid."""
 
+        return cls.from_msg(_load_json(raw_msg))
+
+    @classmethod
+    def from_msg(cls, msg):
+        """Builds a new WebsocketMessageEmittedItem instance from an already parsed message.
+        Raises WebsocketMessageException if the message is invalid."""
+
         try:
-            msg = json.loads(raw_msg)
-            validate(msg, SCHEMA_EMITTED_ITEM)
-
-            return WebsocketMessageEmittedItem(
-                subscription_id=msg["subscription"],
-                name=msg["name"],
-                data=msg["data"])
-        except Exception as ex:
+            validate_emitted_item(msg)
+        except ValidationError as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, subscription_id, name, data):
+        return WebsocketMessageEmittedItem(
+            subscription_id=msg["subscription"],
+            name=msg["name"],
+            data=msg["data"],
+            validate=False)
+
+    def __init__(self, subscription_id, name, data, validate=True):
         self.subscription_id = subscription_id
         self.name = name
         self.data = to_json_obj(data)
 
+        if not validate:
+            return
+
         try:
-            validate(self.to_dict(), SCHEMA_EMITTED_ITEM)
+            validate_emitted_item(self.to_dict())
         except ValidationError as ex:
-            raise WebsocketMessageError(str(ex))
+            raise WebsocketMessageException(str(ex))
 
     def to_dict(self):
         """Returns this message as a dict."""
@@ -252,3 +315,17 @@ class WebsocketMessageEmittedItem(object):
         """Returns this message as a JSON string."""
 
         return json.dumps(self.to_dict())
+
+    @classmethod
+    def build_body_json(cls, name, data_json):
+        """Returns the raw part of an emitted item message that is shared
+        by all the subscriptions to the same emission (name and data)."""
+
+        return '"name": {}, "data": {}}}'.format(json.dumps(name), data_json)
+
+    @classmethod
+    def build_json(cls, subscription_id, body_json):
+        """Returns a raw emitted item message for the given subscription
+        spliced with a body built by build_body_json()."""
+
+        return '{{"subscription": {}, {}'.format(json.dumps(subscription_id), body_json)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Bounded outbound message queue for WebSockets connections.
+"""
+
+import collections
+import logging
+
+from tornado import gen
+
+from wotpy.protocols.ws.enums import WebsocketOverflowPolicies
+
+
+class WebsocketSendQueue(object):
+    """Bounded queue of raw messages that are written one at a time on a WebSockets connection.
+    Once the queue depth reaches the high water mark the overflow policy is applied
+    to the emitted items of subscriptions until the depth drains to the low water mark.
+    Messages that do not belong to a subscription (responses and errors) are never dropped.
+    Entries are indexed by sequence number and the emitted items are also kept
+    in their own ordered index, so that dropping the oldest item is O(1)."""
+
+    DEFAULT_HIGH_WATER = 1000
+    DEFAULT_LOW_WATER = 500
+
+    def __init__(self, write, close,
+                 high_water=DEFAULT_HIGH_WATER,
+                 low_water=DEFAULT_LOW_WATER,
+                 overflow_policy=WebsocketOverflowPolicies.DROP_OLDEST):
+        self.check_settings(high_water, low_water, overflow_policy)
+
+        self._write = write
+        self._close = close
+        self._high_water = high_water
+        self._low_water = low_water
+        self._overflow_policy = overflow_policy
+        self._entries = collections.OrderedDict()
+        self._emitted = collections.OrderedDict()
+        self._latest = {}
+        self._seq = 0
+        self._overflowing = False
+        self._draining = False
+        self._closed = False
+        self.dropped = 0
+        self.coalesced = 0
+        self.overflows = 0
+        self._logr = logging.getLogger(__name__)
+
+    @classmethod
+    def check_settings(cls, high_water, low_water, overflow_policy):
+        """Raises ValueError if the given queue settings are invalid."""
+
+        if overflow_policy not in WebsocketOverflowPolicies.list():
+            raise ValueError("Unknown overflow policy: {}".format(overflow_policy))
+
+        if low_water < 0 or low_water >= high_water:
+            raise ValueError("The low water mark should be lower than the high water mark")
+
+    @property
+    def depth(self):
+        """Number of messages waiting to be written."""
+
+        return len(self._entries)
+
+    @property
+    def overflowing(self):
+        """True if the queue is above its high water mark and has not drained to the low water mark yet."""
+
+        return self._overflowing
+
+    def stats(self):
+        """Returns a dict with the current depth and the drop counters of this queue."""
+
+        return {
+            "depth": self.depth,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "overflows": self.overflows
+        }
+
+    def put(self, raw_msg, subscription_id=None):
+        """Adds a raw message to the queue and starts writing if the connection is idle.
+        Emitted items should be added with the ID of the subscription they belong to."""
+
+        if self._closed:
+            return
+
+        if not self._overflowing and self.depth >= self._high_water:
+            self._overflowing = True
+            self.overflows += 1
+            self._logr.warning("Send queue overflow (depth: {})".format(self.depth))
+
+            if self._overflow_policy == WebsocketOverflowPolicies.CLOSE:
+                self.clear()
+                self._close()
+                return
+
+        if self._overflowing and subscription_id is not None:
+            if self._overflow_policy == WebsocketOverflowPolicies.COALESCE and self._coalesce(raw_msg, subscription_id):
+                return
+
+            self._drop_oldest()
+
+        self._append(raw_msg, subscription_id)
+
+        if not self._draining:
+            self._draining = True
+            gen.convert_yielded(self._drain())
+
+    def clear(self):
+        """Discards all queued messages and stops accepting new ones."""
+
+        self._closed = True
+        self._entries.clear()
+        self._emitted.clear()
+        self._latest.clear()
+
+    def _append(self, raw_msg, subscription_id):
+        """Appends a new entry at the tail of the queue."""
+
+        self._seq += 1
+        self._entries[self._seq] = [subscription_id, raw_msg]
+
+        if subscription_id is not None:
+            self._emitted[self._seq] = True
+            self._latest[subscription_id] = self._seq
+
+    def _coalesce(self, raw_msg, subscription_id):
+        """Replaces the queued item of the given subscription with a newer one.
+        Returns False if there is no item of that subscription in the queue."""
+
+        seq = self._latest.get(subscription_id, None)
+
+        if seq is None:
+            return False
+
+        self._entries[seq][1] = raw_msg
+        self.coalesced += 1
+
+        return True
+
+    def _drop_oldest(self):
+        """Discards the oldest emitted item in the queue, if any."""
+
+        if not len(self._emitted):
+            return
+
+        seq, _ = self._emitted.popitem(last=False)
+        self._remove(seq, self._entries.pop(seq))
+        self.dropped += 1
+
+    def _remove(self, seq, entry):
+        """Removes the indexes of an entry that has been taken out of the queue."""
+
+        self._emitted.pop(seq, None)
+
+        if self._latest.get(entry[0], None) == seq:
+            self._latest.pop(entry[0])
+
+    @gen.coroutine
+    def _drain(self):
+        """Writes the queued messages one at a time, waiting
+        for each write to be flushed before the next one."""
+
+        try:
+            while len(self._entries):
+                seq, entry = self._entries.popitem(last=False)
+                self._remove(seq, entry)
+
+                if self._overflowing and self.depth <= self._low_water:
+                    self._overflowing = False
+
+                try:
+                    yield self._write(entry[1])
+                except Exception as ex:
+                    self._logr.debug("Error writing message: {}".format(ex))
+                    self.clear()
+        finally:
+            self._draining = False
@@ -137,6 +137,30 @@ SCHEMA_PARAMS_WRITE_PROPERTY = {
     ]
 }
 
+SCHEMA_PARAMS_READ_MULTIPLE_PROPERTIES = {
+    "$schema": "http://json-schema.org/schema#",
+    "id": "http://fundacionctic.org/schemas/wotpy-ws-params-read-multiple-properties.json",
+    "type": "object",
+    "properties": {
+        "names": {
+            "type": "array",
+            "items": {"type": "string"}
+        }
+    }
+}
+
+SCHEMA_PARAMS_WRITE_MULTIPLE_PROPERTIES = {
+    "$schema": "http://json-schema.org/schema#",
+    "id": "http://fundacionctic.org/schemas/wotpy-ws-params-write-multiple-properties.json",
+    "type": "object",
+    "properties": {
+        "values": {"type": "object"}
+    },
+    "required": [
+        "values"
+    ]
+}
+
 SCHEMA_PARAMS_INVOKE_ACTION = {
     "$schema": "http://json-schema.org/schema#",
     "id": "http://fundacionctic.org/schemas/wotpy-ws-params-invoke-action.json",
@@ -191,3 +215,40 @@ SCHEMA_PARAMS_DISPOSE = {
         "subscription"
     ]
 }
+
+SCHEMA_PARAMS = {
+    WebsocketMethods.READ_PROPERTY: SCHEMA_PARAMS_READ_PROPERTY,
+    WebsocketMethods.WRITE_PROPERTY: SCHEMA_PARAMS_WRITE_PROPERTY,
+    WebsocketMethods.READ_MULTIPLE_PROPERTIES: SCHEMA_PARAMS_READ_MULTIPLE_PROPERTIES,
+    WebsocketMethods.WRITE_MULTIPLE_PROPERTIES: SCHEMA_PARAMS_WRITE_MULTIPLE_PROPERTIES,
+    WebsocketMethods.INVOKE_ACTION: SCHEMA_PARAMS_INVOKE_ACTION,
+    WebsocketMethods.ON_PROPERTY_CHANGE: SCHEMA_PARAMS_ON_PROPERTY_CHANGE,
+    WebsocketMethods.ON_TD_CHANGE: SCHEMA_PARAMS_ON_TD_CHANGE,
+    WebsocketMethods.ON_EVENT: SCHEMA_PARAMS_ON_EVENT,
+    WebsocketMethods.DISPOSE: SCHEMA_PARAMS_DISPOSE
+}
+
+
+def _build_schema_request_method(method, schema_params):
+    """Builds the schema that validates both the envelope
+    and the params of a request for the given method."""
+
+    schema = dict(SCHEMA_REQUEST)
+    schema["id"] = "http://fundacionctic.org/schemas/wotpy-ws-request-{}.json".format(method)
+    schema["properties"] = dict(SCHEMA_REQUEST["properties"])
+    schema["properties"]["method"] = {"type": "string", "enum": [method]}
+
+    schema["properties"]["params"] = {
+        key: val for key, val in schema_params.items()
+        if key not in ["$schema", "id"]
+    }
+
+    schema["required"] = SCHEMA_REQUEST["required"] + ["params"]
+
+    return schema
+
+
+SCHEMA_REQUEST_METHODS = {
+    method: _build_schema_request_method(method, schema_params)
+    for method, schema_params in SCHEMA_PARAMS.items()
+}
@@ -10,24 +10,43 @@ from tornado import web
 from tornado.httpserver import HTTPServer
 
 from wotpy.codecs.enums import MediaTypes
-from wotpy.protocols.enums import Protocols
+from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.server import BaseProtocolServer
-from wotpy.protocols.ws.enums import WebsocketSchemes
+from wotpy.protocols.ws.enums import WebsocketSchemes, WebsocketOverflowPolicies
 from wotpy.protocols.ws.handler import WebsocketHandler
+from wotpy.protocols.ws.queue import WebsocketSendQueue
 from wotpy.wot.form import Form
 
 
 class WebsocketServer(BaseProtocolServer):
     """WebSockets binding server implementation. Builds a Tornado application
-    that uses the WebsocketHandler handler to process WebSockets messages."""
+    that uses the WebsocketHandler handler to process WebSockets messages.
+    Messages are sent to each connection through a bounded queue
+    that applies the given overflow policy to slow subscribers.
+    The permessage-deflate extension is offered to clients if a
+    WebsocketCompression instance is given."""
 
     DEFAULT_PORT = 81
 
-    def __init__(self, port=DEFAULT_PORT, ssl_context=None):
+    def __init__(self, port=DEFAULT_PORT, ssl_context=None,
+                 send_queue_high_water=WebsocketSendQueue.DEFAULT_HIGH_WATER,
+                 send_queue_low_water=WebsocketSendQueue.DEFAULT_LOW_WATER,
+                 overflow_policy=WebsocketOverflowPolicies.DROP_OLDEST,
+                 compression=None):
         super(WebsocketServer, self).__init__(port=port)
+
+        WebsocketSendQueue.check_settings(send_queue_high_water, send_queue_low_water, overflow_policy)
+
         self._server = None
         self._app = self._build_app()
         self._ssl_context = ssl_context
+        self._handlers = set()
+        self._compression = compression
+        self._send_queue_kwargs = {
+            "high_water": send_queue_high_water,
+            "low_water": send_queue_low_water,
+            "overflow_policy": overflow_policy
+        }
 
     @property
     def protocol(self):
@@ -54,6 +73,38 @@ class WebsocketServer(BaseProtocolServer):
 
         return self._app
 
+    @property
+    def compression(self):
+        """permessage-deflate settings of this server (None if compression is disabled)."""
+
+        return self._compression
+
+    @property
+    def send_queue_kwargs(self):
+        """Arguments used to build the send queue of each connection."""
+
+        return self._send_queue_kwargs
+
+    def add_handler(self, handler):
+        """Registers the handler of an open connection."""
+
+        self._handlers.add(handler)
+
+    def remove_handler(self, handler):
+        """Unregisters the handler of a closed connection."""
+
+        self._handlers.discard(handler)
+
+    def send_queue_stats(self):
+        """Returns a list with the send queue depth and drop counters of each open connection."""
+
+        return [
+            dict(handler.send_queue.stats(),
+                 thing=handler.exposed_thing_name,
+                 remote_ip=handler.request.remote_ip)
+            for handler in self._handlers
+        ]
+
     def _build_app(self):
         """Builds and returns the Tornado application for the WebSockets server."""
 
@@ -82,6 +133,25 @@ class WebsocketServer(BaseProtocolServer):
                 content_type=MediaTypes.JSON)
         ]
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with the Forms to read or write
+        multiple Properties of the given Thing in a single request."""
+
+        base_url = self.build_base_url(hostname=hostname, thing=thing)
+
+        return [
+            Form(
+                interaction=thing,
+                protocol=self.protocol,
+                href=base_url,
+                content_type=MediaTypes.JSON,
+                op=[
+                    InteractionVerbs.READ_ALL_PROPERTIES,
+                    InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                    InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+                ])
+        ]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
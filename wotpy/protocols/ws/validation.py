@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Functions to validate the JSON-RPC messages exchanged over WebSockets.
+Each message is validated in a single pass against its precompiled schema,
+while the hot methods are checked by hand-written validators.
+"""
+
+import six
+from jsonschema import ValidationError
+
+from wotpy.protocols.ws.enums import WebsocketMethods
+from wotpy.protocols.ws.schemas import \
+    SCHEMA_REQUEST, \
+    SCHEMA_REQUEST_METHODS, \
+    SCHEMA_RESPONSE, \
+    SCHEMA_ERROR, \
+    SCHEMA_EMITTED_ITEM, \
+    JSON_RPC_VERSION
+from wotpy.wot.validation import get_validator
+
+
+def is_params_error(err):
+    """Returns True if the given ValidationError was raised
+    by the params of a request instead of its envelope."""
+
+    return len(err.path) > 0 and err.path[0] == "params"
+
+
+def _is_valid_id(msg_id):
+    """Returns True if the given value is a valid JSON-RPC message ID."""
+
+    if msg_id is None or isinstance(msg_id, six.string_types):
+        return True
+
+    return isinstance(msg_id, six.integer_types) and not isinstance(msg_id, bool)
+
+
+def _check_envelope(msg):
+    """Checks the fields of the request envelope.
+    Returns the params dict of the request."""
+
+    if msg.get("jsonrpc") != JSON_RPC_VERSION:
+        raise ValidationError("Invalid JSON-RPC version", path=["jsonrpc"])
+
+    if not _is_valid_id(msg.get("id")):
+        raise ValidationError("Invalid message ID", path=["id"])
+
+    params = msg.get("params")
+
+    if not isinstance(params, dict):
+        raise ValidationError("'params' is not an object", path=["params"])
+
+    return params
+
+
+def _check_name(params):
+    """Checks that the params contain a string 'name' field."""
+
+    if not isinstance(params.get("name"), six.string_types):
+        raise ValidationError("'name' is a required string property", path=["params", "name"])
+
+
+def _validate_read_property(msg):
+    """Hand-written validator for 'read_property' requests."""
+
+    _check_name(_check_envelope(msg))
+
+
+def _validate_write_property(msg):
+    """Hand-written validator for 'write_property' requests."""
+
+    params = _check_envelope(msg)
+    _check_name(params)
+
+    if "value" not in params:
+        raise ValidationError("'value' is a required property", path=["params", "value"])
+
+
+def _validate_invoke_action(msg):
+    """Hand-written validator for 'invoke_action' requests."""
+
+    _check_name(_check_envelope(msg))
+
+
+FAST_REQUEST_VALIDATORS = {
+    WebsocketMethods.READ_PROPERTY: _validate_read_property,
+    WebsocketMethods.WRITE_PROPERTY: _validate_write_property,
+    WebsocketMethods.INVOKE_ACTION: _validate_invoke_action
+}
+
+
+def validate_request(msg):
+    """Validates the envelope and the params of a request message in a single pass.
+    Raises ValidationError if the message is invalid."""
+
+    method = msg.get("method") if isinstance(msg, dict) else None
+
+    if method in FAST_REQUEST_VALIDATORS:
+        FAST_REQUEST_VALIDATORS[method](msg)
+    elif method in SCHEMA_REQUEST_METHODS:
+        get_validator(SCHEMA_REQUEST_METHODS[method]).validate(msg)
+    else:
+        get_validator(SCHEMA_REQUEST).validate(msg)
+        raise ValidationError("Unknown method: {}".format(method), path=["method"])
+
+
+def validate_response(msg):
+    """Validates a response message against its precompiled schema."""
+
+    get_validator(SCHEMA_RESPONSE).validate(msg)
+
+
+def validate_error(msg):
+    """Validates an error message against its precompiled schema."""
+
+    get_validator(SCHEMA_ERROR).validate(msg)
+
+
+def validate_emitted_item(msg):
+    """Validates an emitted item message against its precompiled schema."""
+
+    get_validator(SCHEMA_EMITTED_ITEM).validate(msg)
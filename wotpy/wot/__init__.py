@@ -11,6 +11,7 @@ Dictionaries and classes defined under the W3C WoT Scripting API specification.
     wotpy.wot.dictionaries
     wotpy.wot.discovery
     wotpy.wot.exposed
+    wotpy.wot.catalogue
     wotpy.wot.constants
     wotpy.wot.enums
     wotpy.wot.events
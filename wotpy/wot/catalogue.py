@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tornado application that serves the TD catalogue of a servient.
+"""
+
+import tornado.web
+
+
+def _write_cached_json(handler, body, etag):
+    """Writes a pre-serialized JSON body with its strong ETag on the given
+    request handler, replying with 304 Not Modified if the client copy is fresh."""
+
+    handler.set_header("Etag", etag)
+
+    if handler.check_etag_header():
+        handler.set_status(304)
+        return
+
+    handler.set_header("Content-Type", "application/json; charset=UTF-8")
+    handler.write(body)
+
+
+class TDHandler(tornado.web.RequestHandler):
+    """Handler that returns the TD document of a given Thing."""
+
+    def initialize(self, servient):
+        self.servient = servient
+
+    def get(self, thing_url_name):
+        exp_thing = self.servient.exposed_thing_set.find_by_thing_id(
+            thing_url_name)
+
+        body, etag = self.servient.get_serialized_td(exp_thing)
+        _write_cached_json(self, body, etag)
+
+
+class TDCatalogueHandler(tornado.web.RequestHandler):
+    """Handler that returns the entire catalogue of Things contained in this servient.
+    May return TDs in expanded format or URL pointers to the individual TDs."""
+
+    def initialize(self, servient):
+        self.servient = servient
+
+    def get(self):
+        expanded = True if self.get_argument("expanded", False) else False
+        body, etag = self.servient.get_serialized_catalogue(expanded=expanded)
+        _write_cached_json(self, body, etag)
+
+
+def build_td_catalogue_app(servient):
+    """Returns a Tornado app that provides one endpoint to retrieve the
+    entire catalogue of thing descriptions contained in the given servient."""
+
+    return tornado.web.Application([
+        (r"/", TDCatalogueHandler, dict(servient=servient)),
+        (r"/(?P<thing_url_name>[^\/]+)", TDHandler, dict(servient=servient))
+    ])
@@ -9,7 +9,8 @@ import six
 import tornado.gen
 from rx.concurrency import IOLoopScheduler
 from six.moves import UserDict
-from slugify import slugify
+
+from wotpy.wot.enums import InteractionTypes
 
 
 class ConsumedThingInteractionDict(UserDict):
@@ -24,7 +25,7 @@ class ConsumedThingInteractionDict(UserDict):
         """Takes a case-insensitive URL-safe interaction name and returns
         the actual name in the interaction dict."""
 
-        return next((key for key in six.iterkeys(self.interaction_dict) if slugify(key) == slugify(name)), None)
+        return self._consumed_thing.find_interaction_name(name, self.interaction_type)
 
     def __getitem__(self, name):
         """Lazily build and return an object that implements the Interaction interface."""
@@ -45,6 +46,12 @@ class ConsumedThingInteractionDict(UserDict):
     def __iter__(self):
         return six.iterkeys(self.interaction_dict)
 
+    @property
+    def interaction_type(self):
+        """Returns the type of the interactions contained in this dict."""
+
+        raise NotImplementedError()
+
     @property
     def interaction_dict(self):
         """Returns an interactions dict by name.
@@ -64,6 +71,10 @@ class ConsumedThingPropertyDict(ConsumedThingInteractionDict):
     """A dictionary that provides lazy access to the objects that implement
     the ThingProperty interface for each property in a given ConsumedThing."""
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.PROPERTY
+
     @property
     def interaction_dict(self):
         return self._consumed_thing.td.properties
@@ -77,6 +88,10 @@ class ConsumedThingActionDict(ConsumedThingInteractionDict):
     """A dictionary that provides lazy access to the objects that implement
     the ThingAction interface for each action in a given ConsumedThing."""
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.ACTION
+
     @property
     def interaction_dict(self):
         return self._consumed_thing.td.actions
@@ -90,6 +105,10 @@ class ConsumedThingEventDict(ConsumedThingInteractionDict):
     """A dictionary that provides lazy access to the objects that implement
     the ThingEvent interface for each event in a given ConsumedThing."""
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.EVENT
+
     @property
     def interaction_dict(self):
         return self._consumed_thing.td.events
@@ -5,13 +5,17 @@
 Class that represents a Thing consumed by a servient.
 """
 
+import six
 import tornado.gen
 from rx.concurrency import IOLoopScheduler
+from slugify import slugify
 
+from wotpy.protocols.enums import InteractionVerbs
 from wotpy.wot.consumed.interaction_map import \
     ConsumedThingPropertyDict, \
     ConsumedThingActionDict, \
     ConsumedThingEventDict
+from wotpy.wot.enums import InteractionTypes
 
 
 class ConsumedThing(object):
@@ -21,6 +25,7 @@ class ConsumedThing(object):
     def __init__(self, servient, td):
         self._servient = servient
         self._td = td
+        self._interaction_names = None
 
     def __str__(self):
         return "<{}> {}".format(self.__class__.__name__, self.td.id)
@@ -44,6 +49,42 @@ class ConsumedThing(object):
 
         return self._td
 
+    def _build_interaction_names(self):
+        """Builds the maps from the original names and the URL-safe
+        names to the actual interaction names for each type of interaction."""
+
+        td_names = {
+            InteractionTypes.PROPERTY: list(six.iterkeys(self.td.properties)),
+            InteractionTypes.ACTION: list(six.iterkeys(self.td.actions)),
+            InteractionTypes.EVENT: list(six.iterkeys(self.td.events))
+        }
+
+        interaction_names = {}
+
+        for intrct_type, names in six.iteritems(td_names):
+            url_names = {}
+
+            for name in names:
+                url_names.setdefault(slugify(name), name)
+
+            interaction_names[intrct_type] = (set(names), url_names)
+
+        return interaction_names
+
+    def find_interaction_name(self, name, interaction_type):
+        """Takes a case-insensitive URL-safe interaction name and returns the actual name
+        of the interaction with the given type, or None if it does not exist in the TD."""
+
+        if self._interaction_names is None:
+            self._interaction_names = self._build_interaction_names()
+
+        names, url_names = self._interaction_names[interaction_type]
+
+        if name in names:
+            return name
+
+        return url_names.get(slugify(name), None)
+
     @tornado.gen.coroutine
     def invoke_action(self, name, input_value=None, timeout=None, client_kwargs=None):
         """Takes the Action name from the name argument and the list of parameters,
@@ -93,6 +134,71 @@ class ConsumedThing(object):
 
         raise tornado.gen.Return(value)
 
+    @tornado.gen.coroutine
+    def read_multiple_properties(self, names=None, timeout=None, client_kwargs=None):
+        """Takes a list of Property names (all Properties if None) and retrieves their values
+        from the remote Thing. A single request is sent when any client supports the Thing-level
+        operation, otherwise each Property is read concurrently in a separate request.
+        Returns a Future that resolves with a dict of values by Property name."""
+
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None \
+            else InteractionVerbs.READ_MULTIPLE_PROPERTIES
+
+        client = self.servient.select_thing_client(self.td, op)
+        client_kwargs = client_kwargs if client_kwargs else {}
+
+        if client is None:
+            names = list(six.iterkeys(self.td.properties)) if names is None else names
+
+            values = yield {
+                name: self.read_property(name, timeout=timeout, client_kwargs=client_kwargs)
+                for name in set(names)
+            }
+
+            raise tornado.gen.Return(values)
+
+        values = yield client.read_multiple_properties(
+            self.td, names=names,
+            timeout=timeout,
+            **client_kwargs.get(client.protocol, {}))
+
+        raise tornado.gen.Return(values)
+
+    @tornado.gen.coroutine
+    def read_all_properties(self, timeout=None, client_kwargs=None):
+        """Retrieves the values of all the Properties of the remote Thing.
+        Returns a Future that resolves with a dict of values by Property name."""
+
+        values = yield self.read_multiple_properties(
+            names=None, timeout=timeout, client_kwargs=client_kwargs)
+
+        raise tornado.gen.Return(values)
+
+    @tornado.gen.coroutine
+    def write_multiple_properties(self, values, timeout=None, client_kwargs=None):
+        """Takes a dict of values by Property name and updates all of them on the remote Thing.
+        A single request is sent when any client supports the Thing-level operation,
+        otherwise each Property is written concurrently in a separate request.
+        Returns a Future that resolves on success or rejects with an Error."""
+
+        client = self.servient.select_thing_client(
+            self.td, InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        client_kwargs = client_kwargs if client_kwargs else {}
+
+        if client is None:
+            yield [
+                self.write_property(name, value, timeout=timeout, client_kwargs=client_kwargs)
+                for name, value in six.iteritems(values)
+            ]
+
+            return
+
+        yield client.write_multiple_properties(
+            self.td, values,
+            timeout=timeout,
+            **client_kwargs.get(client.protocol, {}))
+
     def on_event(self, name, client_kwargs=None):
         """Returns an Observable for the Event specified in the name argument,
         allowing subscribing to and unsubscribing from notifications."""
@@ -5,15 +5,81 @@
 Base class for WoT dictionaries.
 """
 
+import functools
+
 import six
 
 from wotpy.utils.utils import merge_args_kwargs_dict, to_camel, to_snake
 
 
+class WotBaseDictMeta(type):
+    """Metaclass for WoT dictionaries.
+    Declares empty __slots__ on classes that do not define their own
+    and precomputes the field tables that are derived from the Meta class."""
+
+    def __new__(mcs, name, bases, namespace):
+        if "__slots__" not in namespace:
+            namespace["__slots__"] = ()
+
+        return super(WotBaseDictMeta, mcs).__new__(mcs, name, bases, namespace)
+
+    def __init__(cls, name, bases, namespace):
+        super(WotBaseDictMeta, cls).__init__(name, bases, namespace)
+
+        meta = getattr(cls, "Meta", None)
+        fields = getattr(meta, "fields", set())
+        class_attrs = set(dir(cls))
+
+        cls._fields_table = tuple(
+            (name_camel, to_snake(name_camel), to_snake(name_camel) in class_attrs)
+            for name_camel in sorted(fields))
+
+        cls._fields_camel = {}
+
+        for name_camel, name_snake, _ in cls._fields_table:
+            cls._fields_camel[name_camel] = name_camel
+            cls._fields_camel[name_snake] = name_camel
+
+        cls._fields_required = tuple(getattr(meta, "required", ()))
+        cls._fields_defaults = dict(getattr(meta, "defaults", {}))
+
+
+def memoized_wrapper(func):
+    """Decorator for properties that wrap nested items of the internal dict in WoT dictionaries.
+    The wrappers are built on the first access and reused until the dictionary is updated.
+    Lists and dicts are returned as shallow copies so that callers may freely modify them."""
+
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        if self._wrappers is None:
+            self._wrappers = {}
+
+        try:
+            value = self._wrappers[name]
+        except KeyError:
+            value = func(self)
+            self._wrappers[name] = value
+
+        if isinstance(value, list):
+            return list(value)
+
+        if isinstance(value, dict):
+            return dict(value)
+
+        return value
+
+    return wrapper
+
+
+@six.add_metaclass(WotBaseDictMeta)
 class WotBaseDict(object):
     """Base class for all WoT data types represented
     as dictionaries in the Scripting API specification."""
 
+    __slots__ = ("_init", "_wrappers")
+
     class Meta:
         fields = set()
         required = set()
@@ -26,16 +92,12 @@ class WotBaseDict(object):
         init_dict = merge_args_kwargs_dict(args, kwargs)
 
         self._init = {}
+        self._wrappers = None
 
         for key, val in six.iteritems(init_dict):
-            self._init.update({to_camel(key): val})
-
-        try:
-            required = self.Meta.required
-        except AttributeError:
-            required = []
+            self._init[self._fields_camel.get(key, None) or to_camel(key)] = val
 
-        for field in required:
+        for field in self._fields_required:
             if field not in self._init:
                 raise ValueError("Missing required field: {}".format(field))
 
@@ -43,48 +105,47 @@ class WotBaseDict(object):
         """Transforms the field name to camelCase and
         attemps to retrieve it from the internal dict."""
 
-        name_camel = to_camel(name)
+        name_camel = self._fields_camel.get(name, None)
 
-        if name_camel not in self.Meta.fields:
+        if name_camel is None:
             raise AttributeError(name)
 
-        if name_camel in self._init:
+        try:
             return self._init[name_camel]
+        except KeyError:
+            return self._fields_defaults.get(name_camel, None)
 
-        try:
-            return self.Meta.defaults.get(name_camel, None)
-        except AttributeError:
-            return None
+    def _clear_wrappers(self):
+        """Discards the memoized nested wrappers after the internal dict is updated."""
+
+        self._wrappers = None
 
     def to_dict(self):
         """Returns the pure dict (JSON-serializable) representation of this WoT dictionary."""
 
         ret = {}
-
-        def is_list_wot_dicts(x):
-            return isinstance(x, list) and len(x) and hasattr(x[0], "to_dict")
-
-        def is_dict_wot_dicts(x):
-            return isinstance(x, dict) and len(x) and hasattr(next(six.itervalues(x)), "to_dict")
-
-        def is_wot_dict(x):
-            return hasattr(x, "to_dict")
-
-        existing_fields = [
-            f for f in self.Meta.fields
-            if f in self._init or (to_snake(f) in dir(self) and getattr(self, to_snake(f)) is not None)
-        ]
-
-        for name_camel in existing_fields:
-            field_val = getattr(self, to_snake(name_camel))
-
-            if is_list_wot_dicts(field_val):
-                field_val = [item.to_dict() for item in field_val]
-            elif is_dict_wot_dicts(field_val):
-                field_val = {key: val.to_dict() for key, val in six.iteritems(field_val)}
-            elif is_wot_dict(field_val):
+        init = self._init
+
+        for name_camel, name_snake, is_class_attr in self._fields_table:
+            if is_class_attr:
+                field_val = getattr(self, name_snake)
+
+                if field_val is None and name_camel not in init:
+                    continue
+            elif name_camel in init:
+                field_val = init[name_camel]
+            else:
+                continue
+
+            if isinstance(field_val, list):
+                if len(field_val) and hasattr(field_val[0], "to_dict"):
+                    field_val = [item.to_dict() for item in field_val]
+            elif isinstance(field_val, dict):
+                if len(field_val) and hasattr(next(six.itervalues(field_val)), "to_dict"):
+                    field_val = {key: val.to_dict() for key, val in six.iteritems(field_val)}
+            elif hasattr(field_val, "to_dict"):
                 field_val = field_val.to_dict()
 
-            ret.update({name_camel: field_val})
+            ret[name_camel] = field_val
 
         return ret
@@ -7,7 +7,7 @@ Wrapper classes for dictionaries for interaction initialization that are defined
 
 import six
 
-from wotpy.wot.dictionaries.base import WotBaseDict
+from wotpy.wot.dictionaries.base import WotBaseDict, memoized_wrapper
 from wotpy.wot.dictionaries.link import FormDict
 from wotpy.wot.dictionaries.schema import DataSchemaDict
 from wotpy.wot.dictionaries.security import SecuritySchemeDict
@@ -28,6 +28,7 @@ class InteractionFragmentDict(WotBaseDict):
         }
 
     @property
+    @memoized_wrapper
     def forms(self):
         """Indicates one or more endpoints from which
         an interaction pattern is accessible."""
@@ -35,6 +36,7 @@ class InteractionFragmentDict(WotBaseDict):
         return [FormDict(item) for item in self._init.get("forms", [])]
 
     @property
+    @memoized_wrapper
     def uri_variables(self):
         """Define URI template variables as collection based on DataSchema declarations."""
 
@@ -47,6 +49,7 @@ class InteractionFragmentDict(WotBaseDict):
         }
 
     @property
+    @memoized_wrapper
     def security(self):
         """Set of security configurations, provided as an array,
         that must all be satisfied for access to resources at or
@@ -61,6 +64,8 @@ class InteractionFragmentDict(WotBaseDict):
 class PropertyFragmentDict(InteractionFragmentDict):
     """A dictionary wrapper class that contains data to initialize a Property."""
 
+    __slots__ = ("_data_schema",)
+
     class Meta:
         fields = InteractionFragmentDict.Meta.fields.union({
             "observable"
@@ -117,6 +122,7 @@ class ActionFragmentDict(InteractionFragmentDict):
         }
 
     @property
+    @memoized_wrapper
     def input(self):
         """Used to define the input data schema of the action."""
 
@@ -125,6 +131,7 @@ class ActionFragmentDict(InteractionFragmentDict):
         return DataSchemaDict.build(init) if init else None
 
     @property
+    @memoized_wrapper
     def output(self):
         """Used to define the output data schema of the action."""
 
@@ -144,6 +151,7 @@ class EventFragmentDict(InteractionFragmentDict):
         })
 
     @property
+    @memoized_wrapper
     def subscription(self):
         """Defines data that needs to be passed upon subscription,
         e.g., filters or message format for setting up Webhooks."""
@@ -153,6 +161,7 @@ class EventFragmentDict(InteractionFragmentDict):
         return DataSchemaDict.build(init) if init else None
 
     @property
+    @memoized_wrapper
     def data(self):
         """Defines the data schema of the Event instance messages pushed by the Thing."""
 
@@ -161,6 +170,7 @@ class EventFragmentDict(InteractionFragmentDict):
         return DataSchemaDict.build(init) if init else None
 
     @property
+    @memoized_wrapper
     def cancellation(self):
         """Defines any data that needs to be passed to cancel a subscription,
         e.g., a specific message to remove a Webhook."""
@@ -7,7 +7,7 @@ Wrapper classes for link dictionaries defined in the Scripting API.
 
 from six.moves import urllib
 
-from wotpy.wot.dictionaries.base import WotBaseDict
+from wotpy.wot.dictionaries.base import WotBaseDict, memoized_wrapper
 from wotpy.wot.dictionaries.security import SecuritySchemeDict
 
 
@@ -50,6 +50,7 @@ class FormDict(LinkDict):
         }
 
     @property
+    @memoized_wrapper
     def security(self):
         """Set of security configurations, provided as an array,
         that must all be satisfied for access to resources at or
@@ -7,7 +7,7 @@ Wrapper classes for data schema dictionaries defined in the Scripting API.
 
 import six
 
-from wotpy.wot.dictionaries.base import WotBaseDict
+from wotpy.wot.dictionaries.base import WotBaseDict, memoized_wrapper
 from wotpy.utils.utils import merge_args_kwargs_dict
 from wotpy.wot.enums import DataType
 
@@ -112,6 +112,7 @@ class ObjectSchemaDict(DataSchemaDict):
         return DataType.OBJECT
 
     @property
+    @memoized_wrapper
     def properties(self):
         """Data schema nested definitions."""
 
@@ -140,6 +141,7 @@ class ArraySchemaDict(DataSchemaDict):
         return DataType.ARRAY
 
     @property
+    @memoized_wrapper
     def items(self):
         """Used to define the characteristics of an array."""
 
@@ -7,9 +7,9 @@ Wrapper class for dictionaries to represent Things.
 
 import six
 
-from wotpy.wot.dictionaries.base import WotBaseDict
+from wotpy.wot.dictionaries.base import WotBaseDict, memoized_wrapper
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict, ActionFragmentDict, EventFragmentDict
-from wotpy.wot.dictionaries.link import LinkDict
+from wotpy.wot.dictionaries.link import LinkDict, FormDict
 from wotpy.wot.dictionaries.security import SecuritySchemeDict
 from wotpy.utils.utils import to_camel
 from wotpy.wot.dictionaries.version import VersioningDict
@@ -36,6 +36,7 @@ class ThingFragment(WotBaseDict):
             "actions",
             "events",
             "links",
+            "forms",
             "security"
         }
 
@@ -64,6 +65,7 @@ class ThingFragment(WotBaseDict):
 
         fields_list = [
             "links",
+            "forms",
             "security"
         ]
 
@@ -85,6 +87,8 @@ class ThingFragment(WotBaseDict):
         if name_camel in self.Meta.fields_readonly:
             raise AttributeError("Can't set attribute {}".format(name))
 
+        self._clear_wrappers()
+
         if name_camel in self.Meta.fields_str:
             self._init[name_camel] = value
             return
@@ -109,6 +113,7 @@ class ThingFragment(WotBaseDict):
         return self._init.get("title", self.id)
 
     @property
+    @memoized_wrapper
     def security(self):
         """Set of security configurations, provided as an array,
         that must all be satisfied for access to resources at or
@@ -121,6 +126,7 @@ class ThingFragment(WotBaseDict):
         return [SecuritySchemeDict.build(item) for item in self._init.get("security")]
 
     @property
+    @memoized_wrapper
     def properties(self):
         """The properties optional attribute represents a dict with keys
         that correspond to Property names and values of type PropertyFragment."""
@@ -131,6 +137,7 @@ class ThingFragment(WotBaseDict):
         }
 
     @property
+    @memoized_wrapper
     def actions(self):
         """The actions optional attribute represents a dict with keys
         that correspond to Action names and values of type ActionFragment."""
@@ -141,6 +148,7 @@ class ThingFragment(WotBaseDict):
         }
 
     @property
+    @memoized_wrapper
     def events(self):
         """The events optional attribute represents a dictionary with keys
         that correspond to Event names and values of type EventFragment."""
@@ -151,12 +159,22 @@ class ThingFragment(WotBaseDict):
         }
 
     @property
+    @memoized_wrapper
     def links(self):
         """The links optional attribute represents an array of Link objects."""
 
         return [LinkDict(item) for item in self._init.get("links", [])]
 
     @property
+    @memoized_wrapper
+    def forms(self):
+        """Indicates one or more endpoints from which operations
+        that apply to the whole Thing (e.g. reading all Properties) are accessible."""
+
+        return [FormDict(item) for item in self._init.get("forms", [])]
+
+    @property
+    @memoized_wrapper
     def version(self):
         """Provides version information."""
 
@@ -5,18 +5,38 @@
 Classes that represent events that are emitted by Things.
 """
 
+import json
 import pprint
 
+from wotpy.utils.utils import to_json_obj
 from wotpy.wot.enums import DefaultThingEvent, TDChangeType, TDChangeMethod
 
 
+def _encode_json_data(emitted_event):
+    """Serializes the data of the given emission to a JSON string.
+    Raises ValueError if the data is not serializable."""
+
+    try:
+        return json.dumps(emitted_event.data)
+    except TypeError:
+        pass
+
+    try:
+        return json.dumps(to_json_obj(emitted_event.data))
+    except TypeError as ex:
+        raise ValueError(str(ex))
+
+
 class EmittedEvent(object):
     """Base event class.
-    Represents a generic event defined in a TD."""
+    Represents a generic event defined in a TD.
+    The same instance is delivered to every subscriber of an emission,
+    which allows bindings to share the encoded payload through encode_once()."""
 
     def __init__(self, init, name):
         self.init = init
         self.name = name
+        self._encoded = {}
 
     def __str__(self):
         try:
@@ -32,6 +52,23 @@ class EmittedEvent(object):
 
         return self.init
 
+    def encode_once(self, encoder):
+        """Returns the result of calling encoder with this emission.
+        The encoder is called only the first time and its result is cached by encoder."""
+
+        try:
+            return self._encoded[encoder]
+        except KeyError:
+            encoded = self._encoded[encoder] = encoder(self)
+            return encoded
+
+    @property
+    def json_data(self):
+        """The data of this emission serialized to a JSON string.
+        Raises ValueError if the data is not serializable."""
+
+        return self.encode_once(_encode_json_data)
+
 
 class PropertyChangeEmittedEvent(EmittedEvent):
     """Event triggered to indicate a property change.
@@ -96,10 +133,13 @@ class ThingDescriptionChangeEventInit(object):
         data: An instance of :py:class:`.ThingPropertyInit`, :py:class:`.ThingActionInit`
             or :py:class:`.ThingEventInit` (or ``None`` if the change did not add a new interaction).
         description (dict): A dict that represents a TD serialized to JSON-LD.
+        changes (list): List of dicts that describe each one of the changes collapsed in a batch.
+            The fields ``td_change_type`` and ``name`` are ``None`` when the event contains
+            more than one change and ``method`` is then :py:attr:`.TDChangeMethod.CHANGE`.
     """
 
-    def __init__(self, td_change_type, method, name, data=None, description=None):
-        assert td_change_type in TDChangeType.list()
+    def __init__(self, td_change_type, method, name, data=None, description=None, changes=None):
+        assert td_change_type in TDChangeType.list() or (td_change_type is None and changes)
         assert method in TDChangeMethod.list()
 
         self.td_change_type = td_change_type
@@ -107,3 +147,4 @@ class ThingDescriptionChangeEventInit(object):
         self.name = name
         self.data = data
         self.description = description
+        self.changes = changes
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Class that routes the events emitted by an ExposedThing to the subscribers of each topic.
+"""
+
+import threading
+
+from rx import Observable
+from rx.subjects import Subject
+
+from wotpy.wot.enums import DefaultThingEvent
+
+
+class EmittedEventDispatcher(object):
+    """Routes emitted events to the observers subscribed to each topic.
+    A topic is a tuple of (topic kind, name). Each emission only reaches
+    the observers of its own topics instead of being filtered by every observer."""
+
+    TOPIC_EVENT = "event"
+    TOPIC_PROPERTY_CHANGE = "property_change"
+
+    def __init__(self):
+        self._subjects = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def topics_for(cls, emitted_event):
+        """Returns the list of topics that match the given emitted event."""
+
+        topics = [(cls.TOPIC_EVENT, emitted_event.name)]
+
+        if emitted_event.name == DefaultThingEvent.PROPERTY_CHANGE:
+            topics.append((cls.TOPIC_PROPERTY_CHANGE, emitted_event.data.name))
+
+        return topics
+
+    @property
+    def topics(self):
+        """Returns the list of topics that currently have some subscribed observer."""
+
+        return list(self._subjects.keys())
+
+    def dispatch(self, emitted_event):
+        """Pushes the emitted event to the observers of all the topics that it matches."""
+
+        for topic in self.topics_for(emitted_event):
+            subject = self._subjects.get(topic, None)
+
+            if subject is not None:
+                subject.on_next(emitted_event)
+
+    def _subscribe_topic(self, topic, observer):
+        """Subscribes the observer to the given topic.
+        The topic Subject is removed when its last observer is disposed."""
+
+        with self._lock:
+            subject = self._subjects.get(topic, None)
+
+            if subject is None:
+                subject = Subject()
+                self._subjects[topic] = subject
+
+            disposable = subject.subscribe(observer)
+
+        def dispose():
+            with self._lock:
+                disposable.dispose()
+
+                if not len(subject.observers) and self._subjects.get(topic, None) is subject:
+                    self._subjects.pop(topic)
+
+        return dispose
+
+    def observable(self, topic):
+        """Returns an Observable that emits the events dispatched on the given topic."""
+
+        def subscribe(observer):
+            return self._subscribe_topic(topic, observer)
+
+        # noinspection PyUnresolvedReferences
+        return Observable.create(subscribe)
@@ -24,7 +24,15 @@ class ExposedThingInteractionDict(UserDict):
         """Takes a case-insensitive URL-safe interaction name and returns
         the actual name in the interaction dict."""
 
-        return next((key for key in six.iterkeys(self.interaction_dict) if slugify(key) == slugify(name)), None)
+        if name in self.interaction_dict:
+            return name
+
+        interaction = self._exposed_thing.thing.find_interaction_by_url_name(slugify(name))
+
+        if interaction is None or self.interaction_dict.get(interaction.name, None) is not interaction:
+            return None
+
+        return interaction.name
 
     def __getitem__(self, name):
         """Lazily build and return an object that implements the Interaction interface."""
@@ -5,10 +5,12 @@
 Classes that represent Things exposed by a servient.
 """
 
+import contextlib
+
+import six
 import tornado.gen
 from rx import Observable
 from rx.concurrency import IOLoopScheduler
-from rx.subjects import Subject
 from tornado.concurrent import Future
 
 from wotpy.utils.enums import EnumListMixin
@@ -23,6 +25,7 @@ from wotpy.wot.events import \
     PropertyChangeEventInit, \
     ActionInvocationEventInit, \
     ThingDescriptionChangeEventInit
+from wotpy.wot.exposed.dispatcher import EmittedEventDispatcher
 from wotpy.wot.exposed.interaction_map import \
     ExposedThingEventDict, \
     ExposedThingActionDict, \
@@ -69,7 +72,9 @@ class ExposedThing(object):
             self.HandlerKeys.INVOKE_ACTION: {}
         }
 
-        self._events_stream = Subject()
+        self._events_dispatcher = EmittedEventDispatcher()
+        self._td_changes_depth = 0
+        self._td_changes = []
 
     def __str__(self):
         return "<{}> {}".format(self.__class__.__name__, self.id)
@@ -235,7 +240,45 @@ class ExposedThing(object):
             yield self._default_update_property_handler(name, value)
 
         event_init = PropertyChangeEventInit(name=name, value=value)
-        self._events_stream.on_next(PropertyChangeEmittedEvent(init=event_init))
+        self._events_dispatcher.dispatch(PropertyChangeEmittedEvent(init=event_init))
+
+    @tornado.gen.coroutine
+    def read_all_properties(self):
+        """Reads the values of all the Properties concurrently.
+        Returns a Future that resolves with a dict of values by Property name."""
+
+        values = yield self.read_multiple_properties(list(self.thing.properties.keys()))
+
+        raise tornado.gen.Return(values)
+
+    @tornado.gen.coroutine
+    def read_multiple_properties(self, names):
+        """Reads the values of the Properties in the names list concurrently.
+        Returns a Future that resolves with a dict of values by Property name
+        or rejects with a KeyError if any of the Properties does not exist."""
+
+        for name in names:
+            if name not in self.thing.properties:
+                raise KeyError("Unknown property: {}".format(name))
+
+        values = yield {name: self.read_property(name) for name in set(names)}
+
+        raise tornado.gen.Return(values)
+
+    @tornado.gen.coroutine
+    def write_multiple_properties(self, values):
+        """Takes a dict of values by Property name and updates all of them concurrently.
+        All the Properties are checked before writing so that a request that includes
+        an unknown or non-writable Property does not result in a partial update."""
+
+        for name in values:
+            if name not in self.thing.properties:
+                raise KeyError("Unknown property: {}".format(name))
+
+            if not self.thing.properties[name].writable:
+                raise TypeError("Property is non-writable: {}".format(name))
+
+        yield [self.write_property(name, value) for name, value in six.iteritems(values)]
 
     @tornado.gen.coroutine
     def invoke_action(self, name, input_value=None):
@@ -253,7 +296,7 @@ class ExposedThing(object):
 
         event_init = ActionInvocationEventInit(action_name=name, return_value=result)
         emitted_event = ActionInvocationEmittedEvent(init=event_init)
-        self._events_stream.on_next(emitted_event)
+        self._events_dispatcher.dispatch(emitted_event)
 
         raise tornado.gen.Return(result)
 
@@ -265,11 +308,8 @@ class ExposedThing(object):
             # noinspection PyUnresolvedReferences
             return Observable.throw(Exception("Unknown event"))
 
-        def event_filter(item):
-            return item.name == name
-
-        # noinspection PyUnresolvedReferences
-        return self._events_stream.filter(event_filter)
+        return self._events_dispatcher.observable(
+            (EmittedEventDispatcher.TOPIC_EVENT, name))
 
     def on_property_change(self, name):
         """Returns an Observable for the Property specified in the name argument,
@@ -285,22 +325,15 @@ class ExposedThing(object):
             # noinspection PyUnresolvedReferences
             return Observable.throw(Exception("Property is not observable"))
 
-        def property_change_filter(item):
-            return item.name == DefaultThingEvent.PROPERTY_CHANGE and \
-                   item.data.name == name
-
-        # noinspection PyUnresolvedReferences
-        return self._events_stream.filter(property_change_filter)
+        return self._events_dispatcher.observable(
+            (EmittedEventDispatcher.TOPIC_PROPERTY_CHANGE, name))
 
     def on_td_change(self):
         """Returns an Observable, allowing subscribing to and unsubscribing
         from notifications to the Thing Description."""
 
-        def td_change_filter(item):
-            return item.name == DefaultThingEvent.DESCRIPTION_CHANGE
-
-        # noinspection PyUnresolvedReferences
-        return self._events_stream.filter(td_change_filter)
+        return self._events_dispatcher.observable(
+            (EmittedEventDispatcher.TOPIC_EVENT, DefaultThingEvent.DESCRIPTION_CHANGE))
 
     def expose(self):
         """Start serving external requests for the Thing, so that
@@ -321,7 +354,66 @@ class ExposedThing(object):
         if not self.thing.find_interaction(name=event_name):
             raise ValueError("Unknown event: {}".format(event_name))
 
-        self._events_stream.on_next(EmittedEvent(name=event_name, init=payload))
+        self._events_dispatcher.dispatch(EmittedEvent(name=event_name, init=payload))
+
+    def _add_td_change(self, td_change_type, method, name, data=None):
+        """Registers a change on the Thing Description.
+        The change is notified right away unless there is an ongoing batch of changes."""
+
+        self._td_changes.append({
+            "td_change_type": td_change_type,
+            "method": method,
+            "name": name,
+            "data": data
+        })
+
+        if self._td_changes_depth == 0:
+            self._flush_td_changes()
+
+    def _flush_td_changes(self):
+        """Regenerates the Forms of this Thing in the servient and emits
+        one TD change event for all the changes registered since the last flush."""
+
+        changes, self._td_changes = self._td_changes, []
+
+        if not len(changes):
+            return
+
+        self._servient.refresh_exposed_thing_forms(self.thing.id)
+
+        if len(changes) == 1:
+            change = changes[0]
+            description = None
+
+            if change["method"] == TDChangeMethod.ADD:
+                description = ThingDescription.from_thing(self.thing).to_dict()
+
+            event_data = ThingDescriptionChangeEventInit(description=description, **change)
+        else:
+            event_data = ThingDescriptionChangeEventInit(
+                td_change_type=None,
+                method=TDChangeMethod.CHANGE,
+                name=None,
+                description=ThingDescription.from_thing(self.thing).to_dict(),
+                changes=changes)
+
+        self._events_dispatcher.dispatch(ThingDescriptionChangeEmittedEvent(init=event_data))
+
+    @contextlib.contextmanager
+    def batch_changes(self):
+        """Context manager that groups multiple Interaction additions and removals.
+        The changes are applied immediately, but the Forms are regenerated
+        and a single TD change event is emitted when the outermost batch exits."""
+
+        self._td_changes_depth += 1
+
+        try:
+            yield self
+        finally:
+            self._td_changes_depth -= 1
+
+            if self._td_changes_depth == 0:
+                self._flush_td_changes()
 
     def add_property(self, name, property_init, value=None):
         """Adds a Property defined by the argument and updates the Thing Description.
@@ -335,14 +427,7 @@ class ExposedThing(object):
         self._thing.add_interaction(prop)
         self._set_property_value(prop, value)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.PROPERTY,
-            method=TDChangeMethod.ADD,
-            name=name,
-            data=property_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict())
-
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._add_td_change(TDChangeType.PROPERTY, TDChangeMethod.ADD, name, data=property_init.to_dict())
 
     def remove_property(self, name):
         """Removes the Property specified by the name argument,
@@ -350,12 +435,7 @@ class ExposedThing(object):
 
         self._thing.remove_interaction(name=name)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.PROPERTY,
-            method=TDChangeMethod.REMOVE,
-            name=name)
-
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._add_td_change(TDChangeType.PROPERTY, TDChangeMethod.REMOVE, name)
 
     def add_action(self, name, action_init, action_handler=None):
         """Adds an Action to the Thing object as defined by the action
@@ -368,14 +448,7 @@ class ExposedThing(object):
 
         self._thing.add_interaction(action)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.ACTION,
-            method=TDChangeMethod.ADD,
-            name=name,
-            data=action_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict())
-
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._add_td_change(TDChangeType.ACTION, TDChangeMethod.ADD, name, data=action_init.to_dict())
 
         if action_handler:
             self.set_action_handler(name, action_handler)
@@ -386,12 +459,7 @@ class ExposedThing(object):
 
         self._thing.remove_interaction(name=name)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.ACTION,
-            method=TDChangeMethod.REMOVE,
-            name=name)
-
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._add_td_change(TDChangeType.ACTION, TDChangeMethod.REMOVE, name)
 
     def add_event(self, name, event_init):
         """Adds an event to the Thing object as defined by the event argument
@@ -404,14 +472,7 @@ class ExposedThing(object):
 
         self._thing.add_interaction(event)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.EVENT,
-            method=TDChangeMethod.ADD,
-            name=name,
-            data=event_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict())
-
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._add_td_change(TDChangeType.EVENT, TDChangeMethod.ADD, name, data=event_init.to_dict())
 
     def remove_event(self, name):
         """Removes the event specified by the name argument,
@@ -419,12 +480,7 @@ class ExposedThing(object):
 
         self._thing.remove_interaction(name=name)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.EVENT,
-            method=TDChangeMethod.REMOVE,
-            name=name)
-
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._add_td_change(TDChangeType.EVENT, TDChangeMethod.REMOVE, name)
 
     def set_action_handler(self, name, action_handler):
         """Takes name as string argument and action_handler as argument of type ActionHandler.
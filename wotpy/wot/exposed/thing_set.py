@@ -8,10 +8,15 @@ Class that represents a group or set of ExposedThing instances that exist in the
 
 class ExposedThingSet(object):
     """Represents a group of ExposedThing objects.
-    A group cannot contain two ExposedThing with the same Thing ID."""
+    A group cannot contain two ExposedThing with the same Thing ID.
+    Secondary indexes by URL name and Thing object are kept
+    so that all lookups can be resolved in constant time.
+    The URL name index is updated when the title of a Thing changes."""
 
     def __init__(self):
         self._exposed_things = {}
+        self._url_names = {}
+        self._things = {}
 
     @property
     def exposed_things(self):
@@ -20,18 +25,33 @@ class ExposedThingSet(object):
         for exposed_thing in self._exposed_things.values():
             yield exposed_thing
 
+    def _on_url_name_change(self, thing, url_name_prev):
+        """Moves a Thing to its new URL name in the URL name index."""
+
+        if self._url_names.get(url_name_prev, None) == thing.id:
+            self._url_names.pop(url_name_prev)
+
+        self._url_names[thing.url_name] = thing.id
+
     def contains(self, exposed_thing):
         """Returns True if this group contains the given ExposedThing."""
 
-        return exposed_thing in self._exposed_things.values()
+        item = self._things.get(id(exposed_thing.thing), None)
+
+        return item is not None and item == exposed_thing
 
     def add(self, exposed_thing):
         """Add a new ExposedThing to this set."""
 
-        if exposed_thing.thing.id in self._exposed_things:
+        thing_id = exposed_thing.thing.id
+
+        if thing_id in self._exposed_things:
             raise ValueError("Duplicate Exposed Thing: {}".format(exposed_thing.title))
 
-        self._exposed_things[exposed_thing.thing.id] = exposed_thing
+        self._exposed_things[thing_id] = exposed_thing
+        self._url_names[exposed_thing.thing.url_name] = thing_id
+        self._things[id(exposed_thing.thing)] = exposed_thing
+        exposed_thing.thing.add_url_name_listener(self._on_url_name_change)
 
     def remove(self, thing_id):
         """Removes an existing ExposedThing by ID.
@@ -44,21 +64,23 @@ class ExposedThingSet(object):
 
         assert exposed_thing.thing.id in self._exposed_things
         self._exposed_things.pop(exposed_thing.thing.id)
+        self._things.pop(id(exposed_thing.thing), None)
+        self._url_names.pop(exposed_thing.thing.url_name, None)
+        exposed_thing.thing.remove_url_name_listener(self._on_url_name_change)
 
     def find_by_thing_id(self, thing_id):
         """Finds an existing ExposedThing by Thing ID.
         The ID argument may be the original Thing ID or the URL-safe name
         (which is also unique and based on the ID)."""
 
-        def is_match(exp_thing):
-            return exp_thing.thing.id == thing_id or exp_thing.thing.url_name == thing_id
+        exp_thing = self._exposed_things.get(thing_id, None)
+
+        if exp_thing is not None:
+            return exp_thing
 
-        return next((item for item in self._exposed_things.values() if is_match(item)), None)
+        return self._exposed_things.get(self._url_names.get(thing_id, None), None)
 
     def find_by_interaction(self, interaction):
         """Finds the ExposedThing whose Thing contains the given Interaction."""
 
-        def is_match(exp_thing):
-            return exp_thing.thing is interaction.thing
-
-        return next((item for item in self._exposed_things.values() if is_match(item)), None)
+        return self._things.get(id(interaction.thing), None)
@@ -30,7 +30,8 @@ class Form(object):
 
     @property
     def interaction(self):
-        """Interaction that contains this Form."""
+        """Interaction that contains this Form.
+        This is the Thing itself for the Forms of Thing-level operations."""
 
         return self._interaction
 
@@ -51,5 +52,6 @@ class Form(object):
             self.protocol,
             self.href,
             self.content_type,
+            self.subprotocol,
             tuple(self.op) if isinstance(self.op, list) else self.op
         ))
@@ -28,6 +28,7 @@ class InteractionPattern(object):
 
         self._thing = thing
         self._name = name
+        self._url_name = slugify(name)
         self._forms = []
 
     def __getattr__(self, name):
@@ -66,7 +67,7 @@ class InteractionPattern(object):
     def url_name(self):
         """URL-safe version of the name."""
 
-        return slugify(self.name)
+        return self._url_name
 
     @property
     def forms(self):
@@ -78,6 +79,7 @@ class InteractionPattern(object):
         """Removes all the Forms from this Interaction."""
 
         self._forms = []
+        self._thing.bump_revision()
 
     def add_form(self, form):
         """Add a new Form."""
@@ -90,6 +92,7 @@ class InteractionPattern(object):
             raise ValueError("Duplicate Form: {}".format(form))
 
         self._forms.append(form)
+        self._thing.bump_revision()
 
     def remove_form(self, form):
         """Remove an existing Form."""
@@ -97,9 +100,19 @@ class InteractionPattern(object):
         try:
             pop_idx = self._forms.index(form)
             self._forms.pop(pop_idx)
+            self._thing.bump_revision()
         except ValueError:
             pass
 
+    def remove_protocol_forms(self, protocol):
+        """Removes all the Forms linked to the given protocol in a single pass."""
+
+        forms = [form for form in self._forms if form.protocol != protocol]
+
+        if len(forms) != len(self._forms):
+            self._forms = forms
+            self._thing.bump_revision()
+
 
 class Property(InteractionPattern):
     """Properties expose internal state of a Thing that can be
@@ -6,18 +6,20 @@ Class that represents a WoT servient.
 """
 
 import functools
+import hashlib
+import importlib
 import re
 import socket
 
 import six
 import tornado.concurrent
+import tornado.escape
 import tornado.gen
 import tornado.ioloop
 import tornado.locks
-import tornado.web
 from wotpy.protocols.enums import Protocols
-from wotpy.protocols.http.client import HTTPClient
-from wotpy.protocols.ws.client import WebsocketClient
+from wotpy.protocols.http.forms import HTTPFormPicker
+from wotpy.protocols.ws.forms import WebsocketFormPicker
 from wotpy.support import (is_coap_supported, is_dnssd_supported,
                            is_mqtt_supported)
 from wotpy.utils.utils import get_main_ipv4_address
@@ -27,55 +29,43 @@ from wotpy.wot.td import ThingDescription
 from wotpy.wot.wot import WoT
 
 
-class TDHandler(tornado.web.RequestHandler):
-    """Handler that returns the TD document of a given Thing."""
-
-    def initialize(self, servient):
-        self.servient = servient
-
-    def get(self, thing_url_name):
-        exp_thing = self.servient.exposed_thing_set.find_by_thing_id(
-            thing_url_name)
-
-        td_doc = ThingDescription.from_thing(exp_thing.thing).to_dict()
-        base_url = self.servient.get_thing_base_url(exp_thing)
-
-        if base_url:
-            td_doc.update({"base": base_url})
-
-        self.write(td_doc)
-
+class ServientStateException(Exception):
+    """Exception raised when the user modifies the Servient while
+    the Servient is in an inappropriate state."""
 
-class TDCatalogueHandler(tornado.web.RequestHandler):
-    """Handler that returns the entire catalogue of Things contained in this servient.
-    May return TDs in expanded format or URL pointers to the individual TDs."""
+    pass
 
-    def initialize(self, servient):
-        self.servient = servient
 
-    def get(self):
-        response = {}
+class DefaultClientBuilder(object):
+    """Placeholder for a default Protocol Binding client.
+    The client module is only imported and the client instance only
+    built the first time it is selected to communicate with a Thing.
+    Support checks are delegated to the Form picker that the client also uses."""
 
-        for exp_thing in self.servient.enabled_exposed_things:
-            thing_id = exp_thing.thing.id
+    def __init__(self, protocol, module_name, class_name, form_picker, kwargs=None):
+        self.protocol = protocol
+        self.module_name = module_name
+        self.class_name = class_name
+        self.form_picker = form_picker
+        self.kwargs = kwargs if kwargs else {}
 
-            if self.get_argument("expanded", False):
-                val = ThingDescription.from_thing(exp_thing.thing).to_dict()
-                val.update(
-                    {"base": self.servient.get_thing_base_url(exp_thing)})
-            else:
-                val = "/{}".format(exp_thing.thing.url_name)
+    def is_supported_interaction(self, td, name):
+        """Returns True if the any of the Forms for the Interaction
+        with the given name is supported by the client."""
 
-            response[thing_id] = val
+        return self.form_picker.is_supported_interaction(td, name)
 
-        self.write(response)
+    def is_supported_thing_operation(self, td, op):
+        """Returns True if any of the Thing-level Forms for
+        the given operation is supported by the client."""
 
+        return self.form_picker.is_supported_thing_operation(td, op)
 
-class ServientStateException(Exception):
-    """Exception raised when the user modifies the Servient while
-    the Servient is in an inappropriate state."""
+    def build(self):
+        """Imports the client module and returns a new client instance."""
 
-    pass
+        module = importlib.import_module(self.module_name)
+        return getattr(module, self.class_name)(**self.kwargs)
 
 
 def _stopped_servient_only(func):
@@ -140,6 +130,8 @@ class Servient(object):
         self._dnssd_instance_name = dnssd_instance_name
         self._dnssd = None
         self._enabled_exposed_thing_ids = set()
+        self._td_cache = {}
+        self._catalogue_cache = {}
 
         if not len(self._clients):
             self._build_default_clients()
@@ -199,6 +191,25 @@ class Servient(object):
 
         return next(client for client in clients if client.protocol == protocol)
 
+    @staticmethod
+    def _default_select_thing_client(clients, td, op):
+        """Default implementation of the function to select a Protocol Binding
+        client for a Thing-level operation. Returns None if no client supports it."""
+
+        protocol_prefs = [
+            Protocols.HTTP,
+            Protocols.COAP,
+            Protocols.WEBSOCKETS,
+            Protocols.MQTT
+        ]
+
+        supported = {
+            client.protocol: client for client in clients
+            if client.is_supported_thing_operation(td, op)
+        }
+
+        return next((supported[proto] for proto in protocol_prefs if proto in supported), None)
+
     @property
     def is_running(self):
         """Returns True if the Servient is currently running
@@ -241,7 +252,11 @@ class Servient(object):
 
     @property
     def clients(self):
-        """Returns the dict of Protocol Binding clients attached to this servient."""
+        """Returns the dict of Protocol Binding clients attached to this servient.
+        Builds all the default clients that have not been built yet."""
+
+        for client in list(self._clients.values()):
+            self._get_built_client(client)
 
         return self._clients
 
@@ -296,35 +311,55 @@ class Servient(object):
         self._dnssd = None
 
     def _build_default_clients(self):
-        """Builds the default Protocol Binding clients."""
+        """Adds the builders of the default Protocol Binding clients.
+        The clients are lazily built when they are first required."""
 
         self._clients = self._clients if self._clients else {}
 
         conf = self._clients_config if self._clients_config else {}
 
-        self._clients.update({
-            Protocols.WEBSOCKETS: WebsocketClient(**conf.get(Protocols.WEBSOCKETS, {})),
-            Protocols.HTTP: HTTPClient(**conf.get(Protocols.HTTP, {}))
-        })
+        builders = [
+            DefaultClientBuilder(
+                Protocols.WEBSOCKETS, "wotpy.protocols.ws.client", "WebsocketClient",
+                WebsocketFormPicker, conf.get(Protocols.WEBSOCKETS)),
+            DefaultClientBuilder(
+                Protocols.HTTP, "wotpy.protocols.http.client", "HTTPClient",
+                HTTPFormPicker, conf.get(Protocols.HTTP))
+        ]
 
         if is_coap_supported():
-            from wotpy.protocols.coap.client import CoAPClient
-            self._clients.update(
-                {Protocols.COAP: CoAPClient(**conf.get(Protocols.COAP, {}))})
+            from wotpy.protocols.coap.forms import CoAPFormPicker
+            builders.append(DefaultClientBuilder(
+                Protocols.COAP, "wotpy.protocols.coap.client", "CoAPClient",
+                CoAPFormPicker, conf.get(Protocols.COAP)))
 
         if is_mqtt_supported():
-            from wotpy.protocols.mqtt.client import MQTTClient
-            self._clients.update(
-                {Protocols.MQTT: MQTTClient(**conf.get(Protocols.MQTT, {}))})
+            from wotpy.protocols.mqtt.forms import MQTTFormPicker
+            builders.append(DefaultClientBuilder(
+                Protocols.MQTT, "wotpy.protocols.mqtt.client", "MQTTClient",
+                MQTTFormPicker, conf.get(Protocols.MQTT)))
+
+        self._clients.update({builder.protocol: builder for builder in builders})
+
+    def _get_built_client(self, client):
+        """Returns the given client, building it first if it is a default client placeholder."""
+
+        if not isinstance(client, DefaultClientBuilder):
+            return client
+
+        built_client = client.build()
+
+        if self._clients.get(client.protocol, None) is client:
+            self._clients[client.protocol] = built_client
+
+        return built_client
 
     def _build_td_catalogue_app(self):
         """Returns a Tornado app that provides one endpoint to retrieve the
         entire catalogue of thing descriptions contained in this servient."""
 
-        return tornado.web.Application([
-            (r"/", TDCatalogueHandler, dict(servient=self)),
-            (r"/(?P<thing_url_name>[^\/]+)", TDHandler, dict(servient=self))
-        ])
+        from wotpy.wot.catalogue import build_td_catalogue_app
+        return build_td_catalogue_app(self)
 
     def _start_catalogue(self):
         """Starts the TD catalogue server if enabled."""
@@ -348,24 +383,22 @@ class Servient(object):
         """Cleans all the Forms from all the ExposedThings contained in this Servient."""
 
         for exposed_thing in self._exposed_thing_set.exposed_things:
+            exposed_thing.thing.clean_forms()
+
             for interaction in exposed_thing.thing.interactions:
                 interaction.clean_forms()
 
     def _clean_protocol_forms(self, exposed_thing, protocol):
-        """Removes all interaction forms linked to this
-        server protocol for the given ExposedThing."""
+        """Removes all interaction and Thing-level forms linked
+        to this server protocol for the given ExposedThing."""
 
         assert self._exposed_thing_set.contains(exposed_thing)
         assert protocol in self._servers
 
-        for interaction in exposed_thing.thing.interactions:
-            forms_to_remove = [
-                form for form in interaction.forms
-                if form.protocol == protocol
-            ]
+        exposed_thing.thing.remove_protocol_forms(protocol)
 
-            for form in forms_to_remove:
-                interaction.remove_form(form)
+        for interaction in exposed_thing.thing.interactions:
+            interaction.remove_protocol_forms(protocol)
 
     def _server_has_exposed_thing(self, server, exposed_thing):
         """Returns True if the given server contains the ExposedThing."""
@@ -388,6 +421,21 @@ class Servient(object):
             for form in forms:
                 interaction.add_form(form)
 
+        thing_forms = server.build_thing_forms(
+            hostname=self._hostname, thing=exposed_thing.thing)
+
+        for form in thing_forms:
+            exposed_thing.thing.add_form(form)
+
+    def _regenerate_exposed_thing_forms(self, exposed_thing):
+        """Cleans and regenerates Forms for the given ExposedThing in all servers."""
+
+        for server in self._servers.values():
+            self._clean_protocol_forms(exposed_thing, server.protocol)
+
+            if self._server_has_exposed_thing(server, exposed_thing):
+                self._add_interaction_forms(server, exposed_thing)
+
     def _regenerate_server_forms(self, server):
         """Cleans and regenerates Forms for the given server in all ExposedThings."""
 
@@ -417,11 +465,94 @@ class Servient(object):
 
         return server.build_base_url(hostname=self.hostname, thing=exposed_thing.thing)
 
+    @staticmethod
+    def _build_serialized_entry(key, body):
+        """Returns a cache entry for the given serialized body, including its strong ETag."""
+
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+
+        return key, body, etag
+
+    def get_serialized_td(self, exposed_thing):
+        """Returns a tuple with the JSON-serialized TD (as bytes) of the given ExposedThing,
+        including the base URL, and its ETag. The serialized TD is cached per ExposedThing
+        and only rebuilt when the Thing is modified or the base URL changes."""
+
+        base_url = self.get_thing_base_url(exposed_thing)
+        cache_key = (exposed_thing.thing.revision, base_url)
+        cached = self._td_cache.get(exposed_thing.id, None)
+
+        if cached is not None and cached[0] == cache_key:
+            return cached[1], cached[2]
+
+        td_doc = ThingDescription.from_thing(exposed_thing.thing).to_dict()
+
+        if base_url:
+            td_doc.update({"base": base_url})
+
+        body = tornado.escape.utf8(tornado.escape.json_encode(td_doc))
+        cached = self._build_serialized_entry(cache_key, body)
+        self._td_cache[exposed_thing.id] = cached
+
+        return cached[1], cached[2]
+
+    def get_serialized_catalogue(self, expanded=False):
+        """Returns a tuple with the JSON-serialized TD catalogue (as bytes) of the enabled
+        ExposedThings and its ETag. The expanded catalogue is assembled from the cached
+        serialized TDs and only rebuilt when some Thing is modified, enabled or disabled."""
+
+        exp_things = list(self.enabled_exposed_things)
+
+        if expanded:
+            parts = [
+                (exp_thing.id,) + self.get_serialized_td(exp_thing)
+                for exp_thing in exp_things
+            ]
+
+            cache_key = tuple((thing_id, etag) for thing_id, _, etag in parts)
+        else:
+            parts = [
+                (exp_thing.id, "/{}".format(exp_thing.thing.url_name))
+                for exp_thing in exp_things
+            ]
+
+            cache_key = tuple(parts)
+
+        cached = self._catalogue_cache.get(expanded, None)
+
+        if cached is not None and cached[0] == cache_key:
+            return cached[1], cached[2]
+
+        if expanded:
+            items = [
+                tornado.escape.utf8(tornado.escape.json_encode(thing_id)) + b":" + td_body
+                for thing_id, td_body, _ in parts
+            ]
+
+            body = b"{" + b",".join(items) + b"}"
+        else:
+            body = tornado.escape.utf8(tornado.escape.json_encode(dict(parts)))
+
+        cached = self._build_serialized_entry(cache_key, body)
+        self._catalogue_cache[expanded] = cached
+
+        return cached[1], cached[2]
+
     def select_client(self, td, name):
         """Returns the Protocol Binding client instance to
         communicate with the given Interaction."""
 
-        return Servient._default_select_client(self.clients.values(), td, name)
+        client = Servient._default_select_client(list(self._clients.values()), td, name)
+
+        return self._get_built_client(client)
+
+    def select_thing_client(self, td, op):
+        """Returns the Protocol Binding client instance to perform the given
+        Thing-level operation (e.g. readmultipleproperties) or None if no client supports it."""
+
+        client = Servient._default_select_thing_client(list(self._clients.values()), td, op)
+
+        return self._get_built_client(client) if client is not None else None
 
     @_stopped_servient_only
     def add_client(self, client):
@@ -456,17 +587,36 @@ class Servient(object):
         for server in self._servers.values():
             self._regenerate_server_forms(server)
 
+    def refresh_exposed_thing_forms(self, thing_id):
+        """Cleans and regenerates Forms for the ExposedThing with the given ID.
+        Does nothing if the ExposedThing is not contained in this servient or is disabled."""
+
+        exposed_thing = self._exposed_thing_set.find_by_thing_id(thing_id)
+
+        if exposed_thing is None or exposed_thing.id not in self._enabled_exposed_thing_ids:
+            return
+
+        self._regenerate_exposed_thing_forms(exposed_thing)
+
     def enable_exposed_thing(self, thing_id):
         """Enables the ExposedThing with the given ID.
         This is, the servers will listen for requests for this thing."""
 
-        exposed_thing = self.get_exposed_thing(thing_id)
+        self.enable_exposed_things([thing_id])
+
+    def enable_exposed_things(self, thing_ids):
+        """Enables all the ExposedThings with the given IDs.
+        Only the Forms of the enabled ExposedThings are generated, in a single pass."""
+
+        exposed_things = [self.get_exposed_thing(thing_id) for thing_id in thing_ids]
 
         for server in self._servers.values():
-            server.add_exposed_thing(exposed_thing)
-            self._regenerate_server_forms(server)
+            for exposed_thing in exposed_things:
+                server.add_exposed_thing(exposed_thing)
 
-        self._enabled_exposed_thing_ids.add(exposed_thing.id)
+        for exposed_thing in exposed_things:
+            self._regenerate_exposed_thing_forms(exposed_thing)
+            self._enabled_exposed_thing_ids.add(exposed_thing.id)
 
     def disable_exposed_thing(self, thing_id):
         """Disables the ExposedThing with the given ID.
@@ -480,8 +630,8 @@ class Servient(object):
 
         for server in self._servers.values():
             server.remove_exposed_thing(exposed_thing.id)
-            self._regenerate_server_forms(server)
 
+        self._regenerate_exposed_thing_forms(exposed_thing)
         self._enabled_exposed_thing_ids.remove(exposed_thing.id)
 
     def add_exposed_thing(self, exposed_thing):
@@ -496,7 +646,9 @@ class Servient(object):
         if thing_id in self._enabled_exposed_thing_ids:
             self.disable_exposed_thing(thing_id)
 
+        exposed_thing = self.get_exposed_thing(thing_id)
         self._exposed_thing_set.remove(thing_id)
+        self._td_cache.pop(exposed_thing.id, None)
 
     def get_exposed_thing(self, thing_id):
         """Finds and returns an ExposedThing contained in this servient by Thing ID.
@@ -12,21 +12,28 @@ import six
 
 from wotpy.wot.dictionaries.thing import ThingFragment
 from wotpy.wot.thing import Thing
-from wotpy.wot.validation import SCHEMA_THING, InvalidDescription
+from wotpy.wot.validation import SCHEMA_THING, InvalidDescription, get_validator
 
 
 class ThingDescription(object):
     """Class that represents a Thing Description document.
     Contains logic to validate and transform a Thing to a serialized TD and vice versa."""
 
-    def __init__(self, doc):
+    def __init__(self, doc, validate=True):
         """Constructor.
-        Validates that the document conforms to the TD schema."""
+        Validates that the document conforms to the TD schema.
+        The document may be a JSON string, a dict or a ThingFragment.
+        Validation may be skipped by setting validate to False, although this should
+        only be done for trusted documents (e.g. those generated from local Things)."""
 
-        self._doc = json.loads(doc) if isinstance(doc, (six.string_types, bytes)) else doc
-        self._thing_fragment = ThingFragment(self._doc)
+        if isinstance(doc, ThingFragment):
+            self._thing_fragment = doc
+        else:
+            doc = json.loads(doc) if isinstance(doc, (six.string_types, bytes)) else doc
+            self._thing_fragment = ThingFragment(doc)
 
-        self.validate(doc=self._thing_fragment.to_dict())
+        if validate:
+            self.validate(doc=self._thing_fragment.to_dict())
 
     @classmethod
     def validate(cls, doc):
@@ -34,15 +41,17 @@ class ThingDescription(object):
         Raises ValidationError if validation fails."""
 
         try:
-            jsonschema.validate(doc, SCHEMA_THING)
+            get_validator(SCHEMA_THING).validate(doc)
         except (jsonschema.ValidationError, TypeError) as ex:
             raise InvalidDescription(str(ex))
 
     @classmethod
-    def from_thing(cls, thing):
-        """Builds an instance of a JSON-serialized Thing Description from a Thing object."""
+    def from_thing(cls, thing, validate=False):
+        """Builds an instance of a JSON-serialized Thing Description from a Thing object.
+        The document of a local Thing is generated by the Thing itself, therefore
+        this is a trusted path that skips schema validation unless explicitly requested."""
 
-        return ThingDescription(thing.thing_fragment.to_dict())
+        return ThingDescription(thing.thing_fragment, validate=validate)
 
     def __getattr__(self, name):
         """Search for members that raised an AttributeError in
@@ -68,7 +77,7 @@ class ThingDescription(object):
     def build_thing(self):
         """Builds a new Thing object from the serialized Thing Description."""
 
-        return Thing(thing_fragment=self.to_thing_fragment())
+        return Thing(thing_fragment=ThingFragment(self.to_dict()))
 
     def get_forms(self, name):
         """Returns a list of FormDict for the interaction that matches the given name."""
@@ -98,3 +107,8 @@ class ThingDescription(object):
         """Returns a list of FormDict for the event that matches the given name."""
 
         return self.events[name].forms
+
+    def get_thing_forms(self):
+        """Returns a list of FormDict for the operations that apply to the whole Thing."""
+
+        return self.forms
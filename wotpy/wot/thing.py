@@ -37,9 +37,16 @@ class Thing(object):
 
     def __init__(self, thing_fragment=None, **kwargs):
         self._thing_fragment = thing_fragment if thing_fragment else ThingFragment(**kwargs)
+        self._revision = 0
+        self._cache = {}
+        self._cache_revision = self._revision
         self._properties = {}
         self._actions = {}
         self._events = {}
+        self._forms = []
+        self._interactions_by_name = {}
+        self._interactions_by_url_name = {}
+        self._url_name_listeners = []
         self._init_fragment_interactions()
 
     def __getattr__(self, name):
@@ -56,7 +63,28 @@ class Thing(object):
         if name_camel not in self.THING_FRAGMENT_WRITABLE_FIELDS:
             return super(Thing, self).__setattr__(name, value)
 
-        return self._thing_fragment.__setattr__(name, value)
+        url_name_prev = self.url_name
+
+        self._thing_fragment.__setattr__(name, value)
+        self.bump_revision()
+
+        if self.url_name != url_name_prev:
+            for listener in list(self._url_name_listeners):
+                listener(self, url_name_prev)
+
+    def add_url_name_listener(self, listener):
+        """Adds a callback that is called with this Thing and its previous
+        URL name each time the URL name changes (i.e. the title is updated)."""
+
+        self._url_name_listeners.append(listener)
+
+    def remove_url_name_listener(self, listener):
+        """Removes a callback added with add_url_name_listener."""
+
+        try:
+            self._url_name_listeners.remove(listener)
+        except ValueError:
+            pass
 
     def _init_fragment_interactions(self):
         """Adds the interactions declared in the ThingFragment to the instance private dicts."""
@@ -73,9 +101,42 @@ class Thing(object):
             event = Event(thing=self, name=name, init_dict=event_fragment)
             self.add_interaction(event)
 
+    def _cached(self, key, builder):
+        """Returns the value memoized under the given key for the current
+        revision of this Thing, calling builder to compute it on a miss."""
+
+        if self._cache_revision != self._revision:
+            self._cache = {}
+            self._cache_revision = self._revision
+
+        if key not in self._cache:
+            self._cache[key] = builder()
+
+        return self._cache[key]
+
+    @property
+    def revision(self):
+        """Counter that is increased each time this Thing is modified
+        (i.e. interactions, forms or writable ThingFragment fields are updated).
+        Values derived from the Thing may be safely cached for a given revision."""
+
+        return self._revision
+
+    def bump_revision(self):
+        """Marks this Thing as modified, invalidating all the cached derived values."""
+
+        self._revision += 1
+
     @property
     def thing_fragment(self):
-        """The ThingFragment dictionary of this Thing."""
+        """The ThingFragment dictionary of this Thing.
+        The returned object is shared between callers until the next
+        revision of the Thing and should not be modified."""
+
+        return self._cached("thing_fragment", self._build_thing_fragment)
+
+    def _build_thing_fragment(self):
+        """Builds the ThingFragment dictionary of this Thing."""
 
         def interaction_to_json(intrct):
             """Returns the JSON serialization of an Interaction instance."""
@@ -111,19 +172,26 @@ class Thing(object):
             }
         })
 
+        doc.pop("forms", None)
+
+        if len(self._forms):
+            doc.update({
+                "forms": [form.form_dict.to_dict() for form in self._forms]
+            })
+
         return ThingFragment(doc)
 
     @property
     def id(self):
         """Thing ID."""
 
-        return self.thing_fragment.id
+        return self._thing_fragment.id
 
     @property
     def title(self):
         """Thing title."""
 
-        return self.thing_fragment.title
+        return self._thing_fragment.title
 
     @property
     def uuid(self):
@@ -131,6 +199,11 @@ class Thing(object):
         This value is deterministic and derived from the Thing ID.
         It may be of use when URL-unsafe chars are not acceptable."""
 
+        return self._cached("uuid", self._build_uuid)
+
+    def _build_uuid(self):
+        """Builds the deterministic UUID of this Thing from the Thing ID."""
+
         hasher = hashlib.md5()
         hasher.update(self.id.encode())
         bytes_id_hash = hasher.digest()
@@ -142,7 +215,7 @@ class Thing(object):
         """Returns the URL-safe name of this Thing.
         The URL name of a Thing is always unique and stable as long as the ID is unique."""
 
-        return slugify("{}-{}".format(self.title, self.uuid))
+        return self._cached("url_name", lambda: slugify("{}-{}".format(self.title, self.uuid)))
 
     @property
     def properties(self):
@@ -171,14 +244,56 @@ class Thing(object):
             self._actions.values(),
             self._events.values())
 
+    @property
+    def forms(self):
+        """Sequence of forms for the operations that apply to the whole Thing
+        (e.g. reading or writing multiple Properties in a single request)."""
+
+        return self._forms
+
+    def clean_forms(self):
+        """Removes all the Thing-level Forms."""
+
+        self._forms = []
+        self.bump_revision()
+
+    def add_form(self, form):
+        """Add a new Thing-level Form."""
+
+        assert form.interaction is self
+
+        existing = next((True for item in self._forms if item.id == form.id), False)
+
+        if existing:
+            raise ValueError("Duplicate Form: {}".format(form))
+
+        self._forms.append(form)
+        self.bump_revision()
+
+    def remove_protocol_forms(self, protocol):
+        """Removes all the Thing-level Forms linked to the given protocol in a single pass."""
+
+        forms = [form for form in self._forms if form.protocol != protocol]
+
+        if len(forms) != len(self._forms):
+            self._forms = forms
+            self.bump_revision()
+
     def find_interaction(self, name):
         """Finds an existing Interaction by name.
         The name argument may be the original name or the URL-safe version."""
 
-        def is_match(intrct):
-            return intrct.name == name or intrct.url_name == name
+        interaction = self._interactions_by_name.get(name, None)
+
+        if interaction is not None:
+            return interaction
+
+        return self._interactions_by_url_name.get(name, None)
+
+    def find_interaction_by_url_name(self, url_name):
+        """Finds an existing Interaction by the URL-safe version of its name."""
 
-        return next((intrct for intrct in self.interactions if is_match(intrct)), None)
+        return self._interactions_by_url_name.get(url_name, None)
 
     def add_interaction(self, interaction):
         """Add a new Interaction."""
@@ -203,6 +318,9 @@ class Thing(object):
             if isinstance(interaction, klass))
 
         interaction_dict_map[interaction_class][interaction.name] = interaction
+        self._interactions_by_name[interaction.name] = interaction
+        self._interactions_by_url_name[interaction.url_name] = interaction
+        self.bump_revision()
 
     def remove_interaction(self, name):
         """Removes an existing Interaction by name.
@@ -216,3 +334,6 @@ class Thing(object):
         self._properties.pop(interaction.name, None)
         self._actions.pop(interaction.name, None)
         self._events.pop(interaction.name, None)
+        self._interactions_by_name.pop(interaction.name, None)
+        self._interactions_by_url_name.pop(interaction.url_name, None)
+        self.bump_revision()
@@ -7,6 +7,8 @@ Schemas following the JSON Schema specification used to validate the shape of Th
 
 import re
 
+import jsonschema
+
 from wotpy.wot.enums import InteractionTypes
 
 REGEX_SAFE_NAME = r"^[a-zA-Z0-9_-]+$"
@@ -250,6 +252,10 @@ SCHEMA_THING = {
             "type": "array",
             "items": SCHEMA_LINK
         },
+        "forms": {
+            "type": "array",
+            "items": SCHEMA_FORM
+        },
         "security": {
             "type": "array",
             "items": SCHEMA_SECURITY_SCHEME
@@ -263,6 +269,34 @@ SCHEMA_THING = {
 }
 
 
+def build_validator(schema):
+    """Returns a validator instance for the given JSON schema.
+    The schema itself is checked only once, when the validator is built,
+    and the same instance may be reused to validate any number of documents."""
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+
+    return validator_class(schema)
+
+
+_validators = {}
+
+
+def get_validator(schema):
+    """Returns the shared validator instance for the given JSON schema.
+    The validator is built on the first call so that the cost of checking
+    the schema is only paid by the processes that actually validate documents.
+    Schemas are identified by object identity, they are meant to be module-level constants."""
+
+    try:
+        return _validators[id(schema)][1]
+    except KeyError:
+        validator = build_validator(schema)
+        _validators[id(schema)] = (schema, validator)
+        return validator
+
+
 def interaction_schema_for_type(interaction_type):
     """Returns the JSON schema that describes an
     interaction for the given interaction type."""
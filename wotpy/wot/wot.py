@@ -15,7 +15,6 @@ import tornado.gen
 import tornado.ioloop
 from rx import Observable
 from six.moves import range
-from tornado.httpclient import AsyncHTTPClient, HTTPRequest
 
 from wotpy.support import is_dnssd_supported
 from wotpy.utils.utils import handle_observer_finalization
@@ -108,6 +107,8 @@ class WoT(object):
                     path = path if path else ''
                     return "{}/{}".format(base, path.strip("/"))
 
+                from tornado.httpclient import AsyncHTTPClient
+
                 http_client = AsyncHTTPClient()
 
                 catalogue_resps = [
@@ -195,6 +196,8 @@ class WoT(object):
         """Accepts an url argument and returns a Future
         that resolves with a Thing Description string."""
 
+        from tornado.httpclient import AsyncHTTPClient, HTTPRequest
+
         timeout_secs = timeout_secs or DEFAULT_FETCH_TIMEOUT_SECS
 
         http_client = AsyncHTTPClient()